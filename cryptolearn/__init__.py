@@ -0,0 +1,9 @@
+"""Core learning engine for CryptoLearn Pro"""
+
+from cryptolearn.achievements import AchievementTracker
+from cryptolearn.analytics import LearningAnalytics
+from cryptolearn.catalog import TermCatalog
+from cryptolearn.catalog_store import CatalogError, CatalogStore
+from cryptolearn.progress import LearnedSet
+
+__all__ = ["AchievementTracker", "CatalogError", "CatalogStore", "LearnedSet", "LearningAnalytics", "TermCatalog"]
@@ -0,0 +1,248 @@
+"""Rasch (1PL IRT) estimates of learner ability and term difficulty.
+
+P(correct) = sigmoid(ability - difficulty). A learner's ability is tracked
+online with Elo-style updates after each answer; term difficulties are
+refit offline from the whole answer log with ``fit_rasch`` and stored per
+locale under data/calibration/, falling back to the catalog's labelled
+difficulty until a calibration exists.
+
+Refit from the app's progress database, or a CSV of ``learner,term,correct``
+rows::
+
+    python -m cryptolearn.ability data/progress/progress.db --locale en
+"""
+
+import argparse
+import json
+import math
+import os
+import random
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from cryptolearn.catalog import Difficulty, TermCatalog
+from cryptolearn.progress import LearnedSet
+
+CALIBRATION_DIR = Path(__file__).resolve().parent.parent / 'data' / 'calibration'
+
+# Difficulty (in logits) assumed for a term before any answers are calibrated
+DIFFICULTY_PRIOR = {
+    Difficulty.BEGINNER: -1.0,
+    Difficulty.INTERMEDIATE: 0.0,
+    Difficulty.ADVANCED: 1.0,
+}
+# Questions are chosen so the learner is expected to get this share right
+TARGET_SUCCESS = 0.7
+# How many of the closest-difficulty terms a question is drawn from
+CANDIDATE_POOL = 5
+# Added to a learned term's difficulty gap so batches pick it only as a last resort
+LEARNED_PENALTY = 1e6
+
+# Elo step size: large while little is known about a learner, then settling
+ELO_K_START = 0.6
+ELO_K_MIN = 0.15
+ELO_K_DECAY = 0.05
+
+FIT_ITERATIONS = 30
+FIT_L2 = 0.1  # ridge penalty keeping rarely answered parameters near zero
+
+
+def sigmoid(x):
+    return 1.0 / (1.0 + np.exp(-x))
+
+
+def fit_rasch(
+    learners: np.ndarray,
+    terms: np.ndarray,
+    correct: np.ndarray,
+    learner_count: int,
+    term_count: int,
+    iterations: int = FIT_ITERATIONS,
+    l2: float = FIT_L2,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Joint maximum-likelihood abilities and difficulties from an answer log.
+
+    Alternating diagonal Newton steps, each a few bincounts over the whole
+    log, so millions of answers fit in seconds. Difficulties are centred on
+    zero to pin the scale.
+    """
+    learners = np.asarray(learners, dtype=np.int64)
+    terms = np.asarray(terms, dtype=np.int64)
+    outcome = np.asarray(correct, dtype=np.float64)
+    ability = np.zeros(learner_count)
+    difficulty = np.zeros(term_count)
+
+    for _ in range(iterations):
+        p = sigmoid(ability[learners] - difficulty[terms])
+        gradient = np.bincount(learners, outcome - p, minlength=learner_count) - l2 * ability
+        curvature = np.bincount(learners, p * (1 - p), minlength=learner_count) + l2
+        ability += gradient / curvature
+
+        p = sigmoid(ability[learners] - difficulty[terms])
+        gradient = np.bincount(terms, p - outcome, minlength=term_count) - l2 * difficulty
+        curvature = np.bincount(terms, p * (1 - p), minlength=term_count) + l2
+        difficulty += gradient / curvature
+        difficulty -= difficulty.mean()
+
+    return ability, difficulty
+
+
+def calibration_path(locale: str) -> Path:
+    return CALIBRATION_DIR / f"{locale}.json"
+
+
+def calibration_stamp(locale: str) -> Tuple[float, int]:
+    """(mtime, size) of the locale's calibration file, so a refit can be told from the one already loaded"""
+    try:
+        stat = os.stat(calibration_path(locale))
+    except OSError:
+        return (0.0, -1)
+    return (stat.st_mtime, stat.st_size)
+
+
+def load_calibration(locale: str) -> Dict[str, float]:
+    """Term name -> fitted difficulty, or {} if this locale was never calibrated"""
+    path = calibration_path(locale)
+    if not path.exists():
+        return {}
+    with path.open(encoding='utf-8') as handle:
+        return {name: float(value) for name, value in json.load(handle)['difficulty'].items()}
+
+
+class LearnerAbility:
+    """One learner's ability estimate, updated Elo-style after every answer"""
+
+    __slots__ = ('theta', 'answers')
+
+    def __init__(self, theta: float = 0.0, answers: int = 0):
+        self.theta = theta
+        self.answers = answers
+
+    def expected(self, difficulty: float) -> float:
+        return 1.0 / (1.0 + math.exp(difficulty - self.theta))
+
+    def update(self, difficulty: float, correct: bool) -> None:
+        k = max(ELO_K_MIN, ELO_K_START / (1.0 + ELO_K_DECAY * self.answers))
+        self.theta += k * (float(correct) - self.expected(difficulty))
+        self.answers += 1
+
+
+class ItemBank:
+    """Term difficulties for one catalog version, with targeted question choice"""
+
+    def __init__(self, catalog: TermCatalog, calibration: Optional[Dict[str, float]] = None):
+        self.catalog = catalog
+        self.version = catalog.version
+        calibration = load_calibration(catalog.locale) if calibration is None else calibration
+        self.difficulty = np.array(
+            [calibration.get(term.name, DIFFICULTY_PRIOR[term.difficulty]) for term in catalog],
+            dtype=np.float64,
+        )
+        self.calibrated = sum(1 for term in catalog if term.name in calibration)
+
+    def difficulty_of(self, name: str) -> float:
+        term_id = self.catalog.id_of(name)
+        return 0.0 if term_id is None else float(self.difficulty[term_id])
+
+    def choose(
+        self,
+        ability: float,
+        learned: Optional[LearnedSet] = None,
+        target: float = TARGET_SUCCESS,
+        rng: Optional[random.Random] = None,
+    ) -> int:
+        """Term ID whose predicted success for this ability is closest to ``target``.
+
+        Unlearned terms are preferred; once everything is learned any term
+        qualifies. One vectorised pass over the difficulty array.
+        """
+        rng = rng or random
+        wanted = ability - math.log(target / (1.0 - target))
+        gap = np.abs(self.difficulty - wanted)
+        if learned is not None and len(learned) < len(self.catalog):
+            flags = np.unpackbits(np.frombuffer(learned.to_bytes(), dtype=np.uint8), bitorder='little')
+            gap[flags[:len(gap)].astype(bool)] = np.inf
+        pool = min(CANDIDATE_POOL, len(gap))
+        nearest = np.argpartition(gap, pool - 1)[:pool]
+        return int(rng.choice(nearest[np.isfinite(gap[nearest])].tolist() or nearest.tolist()))
+
+    def choose_many(
+        self,
+        ability: float,
+        count: int,
+        learned: Optional[LearnedSet] = None,
+        target: float = TARGET_SUCCESS,
+        rng: Optional[random.Random] = None,
+    ) -> List[int]:
+        """``count`` distinct term IDs near ``target`` success, easiest first.
+
+        Like ``choose`` but for a whole batch in one pass: unlearned terms
+        come first, learned ones only fill up a batch there aren't enough
+        unlearned terms for.
+        """
+        rng = rng or random
+        count = min(count, len(self.difficulty))
+        wanted = ability - math.log(target / (1.0 - target))
+        gap = np.abs(self.difficulty - wanted)
+        if learned is not None:
+            flags = np.unpackbits(np.frombuffer(learned.to_bytes(), dtype=np.uint8), bitorder='little')
+            gap[flags[:len(gap)].astype(bool)] += LEARNED_PENALTY
+        pool = min(count + CANDIDATE_POOL, len(gap))
+        nearest = np.argpartition(gap, pool - 1)[:pool]
+        nearest = nearest[np.argsort(gap[nearest], kind='stable')]
+        # Draw from the close unlearned terms when there are enough of them,
+        # otherwise take the best fits outright
+        unlearned = nearest[gap[nearest] < LEARNED_PENALTY].tolist()
+        chosen = np.array(rng.sample(unlearned, count) if len(unlearned) >= count else nearest[:count], dtype=np.int64)
+        return chosen[np.argsort(self.difficulty[chosen], kind='stable')].tolist()
+
+
+def main(argv=None) -> None:
+    """Refit term difficulties from an answer log and write the calibration file"""
+    import pandas as pd  # only the offline refit needs it
+
+    from cryptolearn.catalog_store import CatalogStore
+
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument('answers', help="progress .db, or CSV with learner,term,correct columns (term = term name)")
+    parser.add_argument('--locale', default='en')
+    parser.add_argument('--iterations', type=int, default=FIT_ITERATIONS)
+    args = parser.parse_args(argv)
+
+    catalog = CatalogStore().current(args.locale)
+    if args.answers.endswith('.db'):
+        import sqlite3
+
+        with sqlite3.connect(args.answers) as connection:
+            log = pd.read_sql_query("SELECT learner_id AS learner, term, correct FROM quiz_events", connection)
+    else:
+        log = pd.read_csv(args.answers, usecols=['learner', 'term', 'correct'])
+    learners, learner_codes = pd.factorize(log['learner'])
+    name_index, names = pd.factorize(log['term'])
+    ids = [catalog.id_of(str(name)) for name in names]
+    terms = np.array([-1 if term_id is None else term_id for term_id in ids], dtype=np.int64)[name_index]
+    known = terms >= 0
+
+    _, difficulty = fit_rasch(
+        learners[known], terms[known], log['correct'].to_numpy()[known],
+        len(learner_codes), len(catalog), iterations=args.iterations,
+    )
+    answered = np.bincount(terms[known], minlength=len(catalog)) > 0
+    path = calibration_path(args.locale)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open('w', encoding='utf-8') as handle:
+        json.dump({
+            'catalog_version': catalog.version,
+            'answers': int(known.sum()),
+            'difficulty': {
+                term.name: round(float(difficulty[term.term_id]), 4)
+                for term in catalog if answered[term.term_id]
+            },
+        }, handle, indent=2, ensure_ascii=False)
+    print(f"Calibrated {int(answered.sum())} terms from {int(known.sum())} answers -> {path}")
+
+
+if __name__ == '__main__':
+    main()
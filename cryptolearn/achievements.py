@@ -0,0 +1,158 @@
+"""Declarative achievements, unlocked by progress events"""
+
+from datetime import datetime
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from cryptolearn.progress import LearnedSet
+
+# Progress events a rule can depend on
+TERM_MASTERED = 'term_mastered'
+QUIZ_ANSWERED = 'quiz_answered'
+STREAK_CHANGED = 'streak_changed'
+
+
+class AchievementContext(NamedTuple):
+    learned: LearnedSet
+    quiz: dict  # session_state.quiz_system
+
+
+class _Rule(NamedTuple):
+    event: str
+    check: Callable[..., bool]
+    scoped: bool  # first argument narrows the event (e.g. to one category)
+
+
+# Rule kinds an achievement may use; arguments come from Achievement.args
+RULES: Dict[str, _Rule] = {
+    'terms_learned': _Rule(TERM_MASTERED, lambda ctx, count: len(ctx.learned) >= count, False),
+    'category_complete': _Rule(TERM_MASTERED, lambda ctx, category: ctx.learned.category_complete(category), True),
+    'all_terms': _Rule(TERM_MASTERED, lambda ctx: ctx.learned.covers(ctx.learned.catalog.all_mask), False),
+    'quiz_accuracy': _Rule(
+        QUIZ_ANSWERED,
+        lambda ctx, attempts, ratio: (
+            ctx.quiz['total_attempts'] >= attempts
+            and ctx.quiz['score'] / max(ctx.quiz['total_attempts'], 1) >= ratio
+        ),
+        False,
+    ),
+    'streak': _Rule(STREAK_CHANGED, lambda ctx, length: ctx.quiz['streak'] >= length, False),
+}
+
+
+class Achievement(NamedTuple):
+    key: str
+    name: str
+    description: str
+    reward: str
+    icon: str
+    rule: str
+    args: tuple = ()
+
+
+ACHIEVEMENTS: Tuple[Achievement, ...] = (
+    Achievement('first_steps', "First Steps", "Learn your first crypto term", "$50 knowledge value", "🌱", 'terms_learned', (1,)),
+    Achievement('getting_started', "Getting Started", "Master 5 terms", "$250 knowledge value", "📚", 'terms_learned', (5,)),
+    Achievement('committed_learner', "Committed Learner", "Master 10 terms", "$500 knowledge value", "🎯", 'terms_learned', (10,)),
+    Achievement('knowledge_seeker', "Knowledge Seeker", "Master 20 terms", "$1,000 knowledge value", "🔍", 'terms_learned', (20,)),
+    Achievement('crypto_scholar', "Crypto Scholar", "Master 30 terms", "$1,500 knowledge value", "🎓", 'terms_learned', (30,)),
+    Achievement('expert_level', "Expert Level", "Master 40 terms", "$2,000 knowledge value", "🥇", 'terms_learned', (40,)),
+    Achievement('quiz_master', "Quiz Master", "Score 90%+ accuracy on 20+ questions", "Quiz mastery bonus", "🧠", 'quiz_accuracy', (20, 0.9)),
+    Achievement('streak_legend', "Streak Legend", "Achieve 15+ question streak", "Consistency bonus", "🔥", 'streak', (15,)),
+    Achievement('defi_expert', "DeFi Expert", "Master all DeFi terms", "$3,000 DeFi potential", "🏦", 'category_complete', ('defi_revolution',)),
+    Achievement('memecoin_master', "Memecoin Master", "Master all Memecoin Culture terms", "Meme mastery status", "🐕", 'category_complete', ('memecoin_culture',)),
+    Achievement('security_guardian', "Security Guardian", "Master all Security terms", "Asset protection knowledge", "🛡️", 'category_complete', ('security_essentials',)),
+    Achievement('complete_mastery', "Complete Mastery", "Master ALL available terms", "$10,000+ earning potential", "👑", 'all_terms'),
+)
+
+
+class AchievementTracker:
+    """Unlock state for one learner.
+
+    Rules are indexed by the event they depend on (and, for category
+    rules, by category), so an event only re-evaluates the still-locked
+    rules it can affect. Each unlock is recorded once, with its time, in
+    ``history``; unlocked achievements stay unlocked even if the condition
+    later lapses (a broken streak).
+    """
+
+    def __init__(self, achievements: Tuple[Achievement, ...] = ACHIEVEMENTS, history: Optional[List[dict]] = None):
+        self.achievements = achievements
+        self.history: List[dict] = [] if history is None else history
+        self.unlocked: Dict[str, datetime] = {entry['key']: entry['unlocked_at'] for entry in self.history}
+
+        self._index: Dict[Tuple[str, Optional[str]], List[Achievement]] = {}
+        for achievement in achievements:
+            if achievement.key in self.unlocked:
+                continue
+            rule = RULES[achievement.rule]
+            scope = achievement.args[0] if rule.scoped else None
+            self._index.setdefault((rule.event, scope), []).append(achievement)
+
+        self._seen_learned: Optional[Tuple[str, int]] = None
+        self._seen_bits = 0
+        self._seen_attempts: Optional[int] = None
+        self._seen_streak: Optional[int] = None
+
+    def is_unlocked(self, key: str) -> bool:
+        return key in self.unlocked
+
+    def unlocked_at(self, key: str) -> Optional[datetime]:
+        return self.unlocked.get(key)
+
+    def emit(self, event: str, context: AchievementContext, scope: Optional[str] = None) -> List[Achievement]:
+        """Evaluate the locked rules that depend on an event; returns new unlocks"""
+        newly_unlocked = self._evaluate((event, None), context)
+        if scope is not None:
+            newly_unlocked += self._evaluate((event, scope), context)
+        return newly_unlocked
+
+    def _evaluate(self, key: Tuple[str, Optional[str]], context: AchievementContext) -> List[Achievement]:
+        pending = self._index.get(key)
+        if not pending:
+            return []
+        newly_unlocked = []
+        still_locked = []
+        for achievement in pending:
+            if RULES[achievement.rule].check(context, *achievement.args):
+                self._unlock(achievement)
+                newly_unlocked.append(achievement)
+            else:
+                still_locked.append(achievement)
+        self._index[key] = still_locked
+        return newly_unlocked
+
+    def observe(self, learned: LearnedSet, quiz: dict) -> List[Achievement]:
+        """Emit events for whatever changed since the last call; returns new unlocks"""
+        context = AchievementContext(learned, quiz)
+        newly_unlocked = []
+
+        stamp = (learned.catalog.version, learned.version)
+        if stamp != self._seen_learned:
+            catalog = learned.catalog
+            if self._seen_learned is None or stamp[0] != self._seen_learned[0]:
+                added = learned.bits  # first sight or catalog reload: every category may have changed
+            else:
+                added = learned.bits & ~self._seen_bits
+            categories = set()
+            while added:
+                low = added & -added
+                categories.add(catalog.category_key(catalog.get(low.bit_length() - 1).category))
+                added ^= low
+            newly_unlocked += self._evaluate((TERM_MASTERED, None), context)
+            for category in categories:
+                newly_unlocked += self._evaluate((TERM_MASTERED, category), context)
+            self._seen_learned = stamp
+            self._seen_bits = learned.bits
+
+        if quiz['total_attempts'] != self._seen_attempts:
+            newly_unlocked += self.emit(QUIZ_ANSWERED, context)
+            self._seen_attempts = quiz['total_attempts']
+        if quiz['streak'] != self._seen_streak:
+            newly_unlocked += self.emit(STREAK_CHANGED, context)
+            self._seen_streak = quiz['streak']
+        return newly_unlocked
+
+    def _unlock(self, achievement: Achievement) -> None:
+        when = datetime.now()
+        self.unlocked[achievement.key] = when
+        self.history.append({'key': achievement.key, 'name': achievement.name, 'unlocked_at': when})
@@ -0,0 +1,141 @@
+"""Per-learner mastery scores and recommendations, updated incrementally"""
+
+from typing import Dict, List, Optional, Tuple
+
+from cryptolearn.catalog import Importance, TermCatalog
+from cryptolearn.progress import LearnedSet
+
+MAX_RECOMMENDATIONS = 3
+
+# Share of the overall score contributed by each category (by display name)
+SKILL_WEIGHTS = {
+    "Memecoin Culture": 0.2,
+    "DeFi": 0.25,
+    "Trading": 0.25,
+    "Blockchain": 0.2,
+    "Security": 0.1,
+}
+DEFAULT_SKILL_WEIGHT = 0.2
+
+
+class LearningAnalytics:
+    """Mastery statistics for one learner, kept in step with their LearnedSet.
+
+    Per-category counters and a recommendation frontier (the first unlearned
+    critical term of each category) are updated per mastered or forgotten
+    term, found by diffing bitmaps, so each event is O(1). The derived
+    dictionaries are memoised against the learned set's version and only
+    rebuilt when progress actually changes.
+    """
+
+    def __init__(self, catalog: TermCatalog, skill_weights: Optional[Dict[str, float]] = None):
+        self.skill_weights = dict(SKILL_WEIGHTS if skill_weights is None else skill_weights)
+        self._reset(catalog)
+
+    def _reset(self, catalog: TermCatalog) -> None:
+        self.catalog = catalog
+        self._bits = 0
+        self._version: Optional[int] = None
+        self._mastery: Optional[dict] = None
+        self._recommendations: Optional[List[dict]] = None
+
+        self._category_of: Dict[int, str] = {}
+        self._category_counts: Dict[str, int] = {}
+        for category in catalog.category_keys():
+            self._category_counts[category] = 0
+            for term_id in catalog.category_ids(category):
+                self._category_of[term_id] = category
+
+        # Critical terms per category in catalog order, plus a cursor at the
+        # first one not yet learned
+        self._critical: Dict[str, Tuple[int, ...]] = {}
+        self._critical_position: Dict[int, int] = {}
+        self._frontier: Dict[str, int] = {}
+        for category in catalog.category_keys():
+            ids = catalog.select_ids(category=category, importance=Importance.CRITICAL)
+            self._critical[category] = ids
+            self._frontier[category] = 0
+            for position, term_id in enumerate(ids):
+                self._critical_position[term_id] = position
+
+    def sync(self, learned: LearnedSet) -> None:
+        """Apply whatever changed in ``learned`` since the last call"""
+        if learned.catalog is not self.catalog:
+            self._reset(learned.catalog)
+        elif learned.version == self._version:
+            return
+
+        changed = learned.bits ^ self._bits
+        while changed:
+            low = changed & -changed
+            term_id = low.bit_length() - 1
+            if learned.bits & low:
+                self._on_learned(term_id, learned.bits)
+            else:
+                self._on_forgotten(term_id)
+            changed ^= low
+
+        self._bits = learned.bits
+        self._version = learned.version
+        self._mastery = None
+        self._recommendations = None
+
+    def _on_learned(self, term_id: int, bits: int) -> None:
+        category = self._category_of[term_id]
+        self._category_counts[category] += 1
+        position = self._critical_position.get(term_id)
+        if position is not None and position == self._frontier[category]:
+            # Each critical term is stepped over at most once per learning
+            ids = self._critical[category]
+            while position < len(ids) and bits >> ids[position] & 1:
+                position += 1
+            self._frontier[category] = position
+
+    def _on_forgotten(self, term_id: int) -> None:
+        category = self._category_of[term_id]
+        self._category_counts[category] -= 1
+        position = self._critical_position.get(term_id)
+        if position is not None and position < self._frontier[category]:
+            self._frontier[category] = position
+
+    def calculate_mastery_score(self, learned_terms: LearnedSet) -> dict:
+        self.sync(learned_terms)
+        if self._mastery is None:
+            total_terms = len(self.catalog)
+            learned_count = sum(self._category_counts.values())
+
+            category_scores = {
+                category: count / len(self.catalog.category_ids(category)) * 100
+                for category, count in self._category_counts.items()
+            }
+            overall_score = sum(
+                score * self.skill_weights.get(self.catalog.category_name(category), DEFAULT_SKILL_WEIGHT)
+                for category, score in category_scores.items()
+            )
+
+            self._mastery = {
+                "overall_score": overall_score,
+                "category_scores": category_scores,
+                "total_learned": learned_count,
+                "total_available": total_terms,
+                "completion_percentage": (learned_count / total_terms) * 100 if total_terms else 0.0,
+            }
+        return self._mastery
+
+    def get_personalized_recommendations(self, learned_terms: LearnedSet) -> List[dict]:
+        self.sync(learned_terms)
+        if self._recommendations is None:
+            recommendations = []
+            for category, ids in self._critical.items():
+                position = self._frontier[category]
+                if position < len(ids):
+                    recommendations.append({
+                        "type": "critical",
+                        "category": category,
+                        "term": self.catalog.get(ids[position]),
+                        "reason": f"Critical {category.lower()} knowledge gap",
+                    })
+                    if len(recommendations) >= MAX_RECOMMENDATIONS:
+                        break
+            self._recommendations = recommendations
+        return self._recommendations
@@ -0,0 +1,197 @@
+"""Typo-tolerant term suggestions from a prefix trie and trigram index"""
+
+import re
+from functools import lru_cache
+from typing import Dict, List, NamedTuple, Optional, Set, Tuple
+
+import numpy as np
+
+from cryptolearn.catalog import Importance, TermCatalog
+
+SUGGESTIONS_PER_NODE = 8
+MAX_FUZZY_CANDIDATES = 64
+PREFIX_CACHE_SIZE = 4096
+
+_NON_ALNUM_RE = re.compile(r"[^a-z0-9]+")
+
+
+def normalize(text: str) -> str:
+    """Fold case, spaces and punctuation so 'Rug pull' and 'rugpull' compare equal"""
+    return _NON_ALNUM_RE.sub('', text.lower())
+
+
+def trigrams(key: str) -> Set[str]:
+    padded = f"  {key} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def edit_distance(a: str, b: str, limit: int) -> int:
+    """Optimal-string-alignment distance, giving up early once it exceeds limit"""
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    previous_previous = None
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                current[j] = min(current[j], previous_previous[j - 2] + 1)
+        if min(current) > limit:
+            return limit + 1
+        previous_previous, previous = previous, current
+    return previous[-1]
+
+
+def within_typo_budget(key: str, label: str) -> bool:
+    """Whether a normalized label is the key give or take one typo per four characters
+
+    >>> within_typo_budget('impermanant loss', 'impermanent loss')
+    True
+    >>> within_typo_budget('liquidity pool', 'staking reward')  # unrelated, same length
+    False
+    """
+    limit = max(1, len(key) // 4)
+    return edit_distance(key, label, limit) <= limit
+
+
+class Suggestion(NamedTuple):
+    term_id: int
+    label: str
+    matched: str
+    distance: int
+
+
+class _Entry(NamedTuple):
+    key: str
+    term_id: int
+    rank: Tuple[int, int, int]
+
+
+# Entry kinds, best first: whole term name, a later word of the name, a tag
+_NAME, _NAME_WORD, _TAG = 0, 1, 2
+_MATCHED = {_NAME: 'term', _NAME_WORD: 'term', _TAG: 'tag'}
+
+
+class Autocomplete:
+    """Suggests catalog terms for partial or misspelled input.
+
+    Term names, the later words of multi-word names and tags are indexed
+    twice: a trie whose nodes keep their best completions (so a prefix lookup
+    is one walk down the trie), and a trigram index over distinct keys used
+    when the prefix matches nothing. Trigram overlap is counted with a single
+    bincount and only the best few candidates are re-ranked by edit
+    distance, which keeps a cold lookup bounded. Results are memoised per
+    normalized prefix with LRU eviction.
+    """
+
+    def __init__(self, catalog: TermCatalog, cache_size: int = PREFIX_CACHE_SIZE):
+        self.catalog = catalog
+        self.version = catalog.version
+
+        entries: List[_Entry] = []
+        for term_id, term in enumerate(catalog):
+            importance = Importance.CRITICAL - term.importance
+            words = [normalize(word) for word in term.name.split()]
+            name_key = ''.join(words)
+            entries.append(_Entry(name_key, term_id, (_NAME, importance, len(name_key))))
+            for start in range(1, len(words)):
+                word_key = ''.join(words[start:])
+                entries.append(_Entry(word_key, term_id, (_NAME_WORD, importance, len(word_key))))
+            for tag in term.tags:
+                tag_key = normalize(tag)
+                entries.append(_Entry(tag_key, term_id, (_TAG, importance, len(tag_key))))
+        entries.sort(key=lambda entry: entry.rank)
+        self._entries: Tuple[_Entry, ...] = tuple(entries)
+
+        # Entries are inserted best-first, so each node's list is already ranked
+        self._trie: Dict[str, dict] = {}
+        key_entries: Dict[str, List[int]] = {}
+        for index, entry in enumerate(self._entries):
+            node = self._trie
+            for char in entry.key:
+                node = node.setdefault(char, {'': []})
+                if len(node['']) < SUGGESTIONS_PER_NODE:
+                    node[''].append(index)
+            key_entries.setdefault(entry.key, []).append(index)
+
+        # Tags repeat across many terms, so fuzzy matching works on distinct keys
+        self._keys: Tuple[str, ...] = tuple(key_entries)
+        self._key_entries: Tuple[Tuple[int, ...], ...] = tuple(tuple(ids) for ids in key_entries.values())
+        grams: Dict[str, List[int]] = {}
+        for key_index, key in enumerate(self._keys):
+            for gram in trigrams(key):
+                grams.setdefault(gram, []).append(key_index)
+        self._trigrams = {gram: np.array(ids, dtype=np.int32) for gram, ids in grams.items()}
+
+        self._suggest_cached = lru_cache(maxsize=cache_size)(self._suggest)
+
+    def suggest(self, text: str, limit: int = 5) -> Tuple[Suggestion, ...]:
+        key = normalize(text)
+        if not key:
+            return ()
+        return self._suggest_cached(key)[:limit]
+
+    def resolve(self, name: str) -> Optional[int]:
+        """Term ID for a name, tolerating case, spacing and small typos"""
+        term_id = self.catalog.id_of(name)
+        if term_id is not None:
+            return term_id
+        key = normalize(name)
+        for suggestion in self.suggest(name, limit=SUGGESTIONS_PER_NODE):
+            if within_typo_budget(key, normalize(suggestion.label)):
+                return suggestion.term_id
+        return None
+
+    def cache_info(self):
+        return self._suggest_cached.cache_info()
+
+    def _suggest(self, key: str) -> Tuple[Suggestion, ...]:
+        node = self._trie
+        for char in key:
+            node = node.get(char)
+            if node is None:
+                break
+        if node is not None:
+            return self._dedupe((index, 0) for index in node[''])
+        return self._fuzzy(key)
+
+    def _fuzzy(self, key: str) -> Tuple[Suggestion, ...]:
+        postings = [self._trigrams[gram] for gram in trigrams(key) if gram in self._trigrams]
+        if not postings:
+            return ()
+
+        overlap = np.bincount(np.concatenate(postings), minlength=len(self._keys))
+        count = min(MAX_FUZZY_CANDIDATES, int(np.count_nonzero(overlap)))
+        candidates = np.argpartition(-overlap, count - 1)[:count]
+        candidates = candidates[np.lexsort((candidates, -overlap[candidates]))]
+
+        limit = max(1, len(key) // 3)
+        scored = []
+        for key_index in candidates.tolist():
+            candidate_key = self._keys[key_index]
+            # Compare against the same-length prefix so half-typed words still match
+            distance = min(
+                edit_distance(key, candidate_key, limit),
+                edit_distance(key, candidate_key[:len(key)], limit),
+            )
+            if distance <= limit:
+                for index in self._key_entries[key_index]:
+                    scored.append((distance, index))
+        scored.sort()
+        return self._dedupe((index, distance) for distance, index in scored)
+
+    def _dedupe(self, ranked) -> Tuple[Suggestion, ...]:
+        seen = set()
+        suggestions = []
+        for index, distance in ranked:
+            entry = self._entries[index]
+            if entry.term_id in seen:
+                continue
+            seen.add(entry.term_id)
+            term_name = self.catalog.get(entry.term_id).name
+            suggestions.append(Suggestion(entry.term_id, term_name, _MATCHED[entry.rank[0]], distance))
+            if len(suggestions) >= SUGGESTIONS_PER_NODE:
+                break
+        return tuple(suggestions)
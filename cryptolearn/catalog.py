@@ -0,0 +1,302 @@
+"""Read-only term catalog with prebuilt lookup indexes"""
+
+import sys
+from enum import IntEnum
+from types import MappingProxyType
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+
+class _LabelledEnum(IntEnum):
+    """Small-int code that still prints as its catalog label ('Very High')"""
+
+    @property
+    def label(self) -> str:
+        return self.name.replace('_', ' ').title()
+
+    @classmethod
+    def parse(cls, value: Union[str, int]) -> '_LabelledEnum':
+        if isinstance(value, cls):
+            return value
+        if isinstance(value, int):
+            return cls(value)
+        try:
+            return cls[value.strip().upper().replace(' ', '_')]
+        except KeyError:
+            raise ValueError(f"Unknown {cls.__name__.lower()} {value!r}") from None
+
+    def __str__(self) -> str:
+        return self.label
+
+    def __format__(self, spec: str) -> str:
+        return format(self.label, spec)
+
+
+class Difficulty(_LabelledEnum):
+    BEGINNER = 0
+    INTERMEDIATE = 1
+    ADVANCED = 2
+
+
+class Importance(_LabelledEnum):
+    MEDIUM = 0
+    HIGH = 1
+    CRITICAL = 2
+
+
+class EarningsTier(_LabelledEnum):
+    """Ordered by knowledge value, so tier >= HIGH means 'high value'"""
+    MEDIUM = 0
+    HIGH = 1
+    CRITICAL = 2
+    VERY_HIGH = 3
+
+
+# Estimated knowledge value ($) of mastering a term, by earnings tier
+KNOWLEDGE_VALUES = {
+    EarningsTier.MEDIUM: 200,
+    EarningsTier.HIGH: 500,
+    EarningsTier.CRITICAL: 800,
+    EarningsTier.VERY_HIGH: 1000,
+}
+
+
+def parse_earnings_tier(earnings_potential: str) -> EarningsTier:
+    """Tier from text like 'Very High - Passive income'"""
+    return EarningsTier.parse(earnings_potential.split(' - ', 1)[0])
+
+
+class TermRecord:
+    """One catalog term.
+
+    Slotted and immutable; repeated strings are interned and the
+    difficulty, importance and earnings tier are small-int enums parsed
+    once at load, so hot paths compare integers instead of scanning text.
+    """
+
+    __slots__ = (
+        'term_id', 'name', 'definition', 'example', 'category',
+        'difficulty', 'importance', 'earnings_tier', 'knowledge_value',
+        'real_world_value', 'earnings_potential', 'tags',
+    )
+
+    def __init__(
+        self,
+        term_id: int,
+        name: str,
+        definition: str,
+        example: str,
+        category: str,
+        difficulty: Union[str, int],
+        importance: Union[str, int],
+        real_world_value: str,
+        earnings_potential: str,
+        tags: Iterable[str],
+    ):
+        tier = parse_earnings_tier(earnings_potential)
+        for field, value in (
+            ('term_id', term_id),
+            ('name', name),
+            ('definition', definition),
+            ('example', example),
+            ('category', sys.intern(category)),
+            ('difficulty', Difficulty.parse(difficulty)),
+            ('importance', Importance.parse(importance)),
+            ('earnings_tier', tier),
+            ('knowledge_value', KNOWLEDGE_VALUES[tier]),
+            ('real_world_value', real_world_value),
+            ('earnings_potential', earnings_potential),
+            ('tags', tuple(sys.intern(tag) for tag in tags)),
+        ):
+            object.__setattr__(self, field, value)
+
+    @classmethod
+    def from_dict(cls, term_id: int, raw: dict) -> 'TermRecord':
+        return cls(
+            term_id,
+            raw['term'],
+            raw['definition'],
+            raw['example'],
+            raw['category'],
+            raw['difficulty'],
+            raw['importance'],
+            raw['real_world_value'],
+            raw['earnings_potential'],
+            raw.get('tags', ()),
+        )
+
+    def __setattr__(self, name, value):
+        raise AttributeError("TermRecord is read-only")
+
+    def __reduce__(self):
+        return (TermRecord, (
+            self.term_id, self.name, self.definition, self.example, self.category,
+            int(self.difficulty), int(self.importance), self.real_world_value,
+            self.earnings_potential, self.tags,
+        ))
+
+    def __repr__(self) -> str:
+        return f"TermRecord({self.term_id}, {self.name!r})"
+
+
+Selector = Union[None, str, int, Iterable[Union[str, int]]]
+
+
+def ids_to_mask(term_ids: Iterable[int]) -> int:
+    """Bitmap with bit i set for every term ID i"""
+    flags = bytearray()
+    for term_id in term_ids:
+        byte = term_id >> 3
+        if byte >= len(flags):
+            flags.extend(bytes(byte + 1 - len(flags)))
+        flags[byte] |= 1 << (term_id & 7)
+    return int.from_bytes(bytes(flags), 'little')
+
+
+class TermCatalog:
+    """Immutable term catalog indexed by integer term ID.
+
+    Built once per process and shared by every session, so pages query the
+    indexes here instead of scanning the raw category dict on each rerun.
+    """
+
+    def __init__(self, categories: Dict[str, List[dict]], version: str = '', locale: str = 'en'):
+        self.version = version
+        self.locale = locale
+        terms: List[TermRecord] = []
+        by_category: Dict[str, List[int]] = {}
+        category_names: Dict[str, str] = {}
+
+        for category_key, category_terms in categories.items():
+            ids = by_category.setdefault(sys.intern(category_key), [])
+            for raw in category_terms:
+                ids.append(len(terms))
+                terms.append(TermRecord.from_dict(len(terms), raw))
+                category_names.setdefault(category_key, terms[-1].category)
+
+        self._terms: Tuple[TermRecord, ...] = tuple(terms)
+        self._by_category = {key: tuple(ids) for key, ids in by_category.items()}
+        self._category_masks = {key: ids_to_mask(ids) for key, ids in by_category.items()}
+        self.all_mask = (1 << len(terms)) - 1
+        self._category_names = MappingProxyType(category_names)
+        self._category_keys = MappingProxyType({name: key for key, name in category_names.items()})
+
+        self._by_name: Dict[str, int] = {}
+        self._by_tag: Dict[str, List[int]] = {}
+        self._by_difficulty: Dict[int, List[int]] = {}
+        self._by_importance: Dict[int, List[int]] = {}
+        self._by_earnings_tier: Dict[int, List[int]] = {}
+
+        for term in self._terms:
+            self._by_name.setdefault(term.name, term.term_id)
+            self._by_name.setdefault(term.name.lower(), term.term_id)
+            for tag in term.tags:
+                self._by_tag.setdefault(tag, []).append(term.term_id)
+            self._by_difficulty.setdefault(term.difficulty, []).append(term.term_id)
+            self._by_importance.setdefault(term.importance, []).append(term.term_id)
+            self._by_earnings_tier.setdefault(term.earnings_tier, []).append(term.term_id)
+
+        for index in (self._by_tag, self._by_difficulty, self._by_importance, self._by_earnings_tier):
+            for key in index:
+                index[key] = tuple(index[key])
+
+    def __len__(self) -> int:
+        return len(self._terms)
+
+    def __iter__(self) -> Iterator[TermRecord]:
+        return iter(self._terms)
+
+    @property
+    def terms(self) -> Tuple[TermRecord, ...]:
+        return self._terms
+
+    def get(self, term_id: int) -> TermRecord:
+        return self._terms[term_id]
+
+    def id_of(self, name: str) -> Optional[int]:
+        """Term ID for an exact (or case-insensitive) term name"""
+        term_id = self._by_name.get(name)
+        if term_id is None:
+            term_id = self._by_name.get(name.lower())
+        return term_id
+
+    def find(self, name: str) -> Optional[TermRecord]:
+        term_id = self.id_of(name)
+        return None if term_id is None else self._terms[term_id]
+
+    # Categories are stored under database keys ('defi_revolution') while
+    # terms carry a display name ('DeFi'); both directions are indexed.
+    def category_keys(self) -> Tuple[str, ...]:
+        return tuple(self._by_category)
+
+    def category_name(self, category_key: str) -> str:
+        return self._category_names.get(category_key, category_key)
+
+    def category_key(self, category_name: str) -> Optional[str]:
+        if category_name in self._by_category:
+            return category_name
+        return self._category_keys.get(category_name)
+
+    def category_ids(self, category: str) -> Tuple[int, ...]:
+        """Term IDs for a category, given either its key or display name"""
+        return self._by_category.get(self.category_key(category) or '', ())
+
+    def category_mask(self, category: str) -> int:
+        """Bitmap of a category's term IDs, for popcount/AND progress checks"""
+        return self._category_masks.get(self.category_key(category) or '', 0)
+
+    def difficulties(self) -> Tuple[Difficulty, ...]:
+        return tuple(sorted(self._by_difficulty))
+
+    def importance_levels(self) -> Tuple[Importance, ...]:
+        return tuple(sorted(self._by_importance, reverse=True))
+
+    def in_category(self, category: str) -> Tuple[TermRecord, ...]:
+        return self._resolve(self.category_ids(category))
+
+    def with_tag(self, tag: str) -> Tuple[TermRecord, ...]:
+        return self._resolve(self._by_tag.get(tag, ()))
+
+    def select(
+        self,
+        category: Selector = None,
+        difficulty: Selector = None,
+        importance: Selector = None,
+        earnings_tier: Selector = None,
+        tag: Selector = None,
+    ) -> Tuple[TermRecord, ...]:
+        """Terms matching every given filter; each filter takes one value or several"""
+        return self._resolve(self.select_ids(category, difficulty, importance, earnings_tier, tag))
+
+    def select_ids(
+        self,
+        category: Selector = None,
+        difficulty: Selector = None,
+        importance: Selector = None,
+        earnings_tier: Selector = None,
+        tag: Selector = None,
+    ) -> Tuple[int, ...]:
+        candidates = None
+        filters = (
+            (category, lambda value: self.category_ids(value)),
+            (difficulty, lambda value: self._by_difficulty.get(Difficulty.parse(value), ())),
+            (importance, lambda value: self._by_importance.get(Importance.parse(value), ())),
+            (earnings_tier, lambda value: self._by_earnings_tier.get(EarningsTier.parse(value), ())),
+            (tag, lambda value: self._by_tag.get(value, ())),
+        )
+        for selector, lookup in filters:
+            if selector is None:
+                continue
+            values = (selector,) if isinstance(selector, (str, int)) else selector
+            matched = set()
+            for value in values:
+                matched.update(lookup(value))
+            candidates = matched if candidates is None else candidates & matched
+            if not candidates:
+                return ()
+
+        if candidates is None:
+            return tuple(range(len(self._terms)))
+        return tuple(sorted(candidates))
+
+    def _resolve(self, term_ids: Iterable[int]) -> Tuple[TermRecord, ...]:
+        return tuple(self._terms[term_id] for term_id in term_ids)
@@ -0,0 +1,137 @@
+"""File-backed term catalog with content-hash hot reload"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+from cryptolearn.catalog import TermCatalog
+
+CATALOG_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data', 'catalog')
+SCHEMA_VERSION = 1
+REQUIRED_FIELDS = (
+    'term', 'definition', 'example', 'category', 'difficulty',
+    'importance', 'real_world_value', 'earnings_potential', 'tags',
+)
+
+
+class CatalogError(ValueError):
+    """Raised when a catalog file is missing or fails validation"""
+
+
+def validate_catalog(document: dict) -> Dict[str, list]:
+    """Check a parsed catalog document and return its categories"""
+    if document.get('schema_version') != SCHEMA_VERSION:
+        raise CatalogError(f"Unsupported catalog schema: {document.get('schema_version')!r}")
+
+    categories = document.get('categories')
+    if not isinstance(categories, dict) or not categories:
+        raise CatalogError("Catalog has no categories")
+
+    seen = set()
+    for category_key, terms in categories.items():
+        if not isinstance(terms, list) or not terms:
+            raise CatalogError(f"Category '{category_key}' has no terms")
+        for term in terms:
+            missing = [field for field in REQUIRED_FIELDS if not term.get(field)]
+            if missing:
+                raise CatalogError(f"Term {term.get('term', '?')!r} in '{category_key}' is missing {', '.join(missing)}")
+            if not isinstance(term['tags'], list):
+                raise CatalogError(f"Term {term['term']!r} tags must be a list")
+            if term['term'] in seen:
+                raise CatalogError(f"Duplicate term {term['term']!r}")
+            seen.add(term['term'])
+
+    return categories
+
+
+def catalog_version(raw: bytes) -> str:
+    return hashlib.sha256(raw).hexdigest()[:16]
+
+
+def compile_catalog(raw: bytes, locale: str = 'en') -> TermCatalog:
+    """Parse, validate and index raw catalog bytes"""
+    try:
+        document = json.loads(raw.decode('utf-8'))
+    except (UnicodeDecodeError, json.JSONDecodeError) as e:
+        raise CatalogError(f"Catalog is not valid JSON: {e}") from e
+
+    categories = validate_catalog(document)
+    try:
+        return TermCatalog(categories, version=catalog_version(raw), locale=document.get('locale', locale))
+    except ValueError as e:
+        # Unknown difficulty, importance or earnings tier labels
+        raise CatalogError(str(e)) from e
+
+
+class CatalogStore:
+    """Serves the current catalog for a locale and swaps in edits to its file.
+
+    Readers always get a fully built catalog. The file is re-checked at most
+    every ``check_interval`` seconds; when its content hash changes one
+    caller rebuilds while everyone else keeps the previous catalog, so an edit
+    never stalls sessions or triggers parallel rebuilds. A file that fails
+    validation is reported and the last good catalog stays live.
+    """
+
+    def __init__(self, catalog_dir: str = CATALOG_DIR, check_interval: float = 2.0):
+        self.catalog_dir = catalog_dir
+        self.check_interval = check_interval
+        self.last_error: Optional[str] = None
+        self._catalogs: Dict[str, TermCatalog] = {}
+        self._stamps: Dict[str, Tuple[float, int]] = {}
+        self._checked_at: Dict[str, float] = {}
+        self._rebuild_lock = threading.Lock()
+
+    def path_for(self, locale: str) -> str:
+        return os.path.join(self.catalog_dir, f"{locale}.json")
+
+    def current(self, locale: str = 'en') -> TermCatalog:
+        catalog = self._catalogs.get(locale)
+        if catalog is None:
+            # First request for this locale has nothing to fall back on, so wait
+            with self._rebuild_lock:
+                if locale not in self._catalogs:
+                    self._reload(locale)
+            return self._catalogs[locale]
+
+        now = time.monotonic()
+        if now - self._checked_at.get(locale, 0) < self.check_interval:
+            return catalog
+        self._checked_at[locale] = now
+
+        if self._stamp(locale) != self._stamps.get(locale) and self._rebuild_lock.acquire(blocking=False):
+            try:
+                self._reload(locale)
+            except CatalogError as e:
+                self.last_error = str(e)
+            finally:
+                self._rebuild_lock.release()
+        return self._catalogs[locale]
+
+    def _stamp(self, locale: str) -> Tuple[float, int]:
+        try:
+            stat = os.stat(self.path_for(locale))
+        except OSError:
+            return (0.0, -1)
+        return (stat.st_mtime, stat.st_size)
+
+    def _reload(self, locale: str) -> None:
+        stamp = self._stamp(locale)
+        try:
+            with open(self.path_for(locale), 'rb') as f:
+                raw = f.read()
+        except OSError as e:
+            raise CatalogError(f"Cannot read catalog for locale '{locale}': {e}") from e
+
+        # Touching the file without changing it keeps the existing catalog
+        self._stamps[locale] = stamp
+        self._checked_at[locale] = time.monotonic()
+        previous = self._catalogs.get(locale)
+        if previous is not None and previous.version == catalog_version(raw):
+            return
+
+        self._catalogs[locale] = compile_catalog(raw, locale)
+        self.last_error = None
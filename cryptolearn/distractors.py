@@ -0,0 +1,123 @@
+"""Precomputed wrong-answer pools for multiple-choice questions"""
+
+import itertools
+import random
+from typing import List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+from cryptolearn.catalog import TermCatalog, TermRecord
+from cryptolearn.related import RelatedTerms
+
+DISTRACTOR_POOL_SIZE = 8
+DISTRACTORS_PER_QUESTION = 3
+# Distractors are drawn from this many of the best-ranked, so repeat
+# questions on a term do not always show the same three
+DISTRACTOR_DRAW_WINDOW = 6
+
+# Ranking of candidates: semantic similarity first, then same category,
+# then a definition of similar length (a much shorter or longer option
+# gives the answer away)
+SAME_CATEGORY_BONUS = 0.5
+LENGTH_BONUS = 0.25
+
+
+class QuizQuestion(NamedTuple):
+    """A question with its options frozen at creation, so reruns never reshuffle them"""
+    term: TermRecord
+    options: Tuple[TermRecord, ...]
+    answer: int  # index of ``term`` in ``options``
+
+
+class DistractorPool:
+    """Ranked plausible-but-wrong definitions for every term.
+
+    Candidates are a term's related-terms neighbours plus the terms of its
+    category whose definitions are closest in length; they are scored in one
+    vectorised pass at build time. Building a question afterwards only draws
+    from a stored row, so it costs the same whatever the catalog size.
+    """
+
+    def __init__(self, catalog: TermCatalog, related: RelatedTerms, pool_size: int = DISTRACTOR_POOL_SIZE):
+        self.catalog = catalog
+        self.version = catalog.version
+        count = len(catalog)
+        pool_size = max(0, min(pool_size, count - 1))
+        self._pools = np.full((count, pool_size), -1, dtype=np.int32)
+        if not pool_size:
+            return
+
+        lengths = np.fromiter((len(term.definition) for term in catalog), dtype=np.float32, count=count)
+        categories = np.empty(count, dtype=np.int32)
+        # Same-category candidates: a window around the term in its category
+        # ordered by definition length
+        window = pool_size
+        by_length = np.full((count, 2 * window), -1, dtype=np.int64)
+        for code, category in enumerate(catalog.category_keys()):
+            ids = np.array(catalog.category_ids(category), dtype=np.int64)
+            categories[ids] = code
+            ordered = ids[np.argsort(lengths[ids], kind='stable')]
+            positions = np.arange(len(ordered))
+            offsets = np.concatenate([np.arange(-window, 0), np.arange(1, window + 1)])
+            neighbours = positions[:, None] + offsets[None, :]
+            valid = (neighbours >= 0) & (neighbours < len(ordered))
+            by_length[ordered] = np.where(valid, ordered[np.clip(neighbours, 0, len(ordered) - 1)], -1)
+
+        related_ids, related_scores = related.neighbour_matrix()
+        candidates = np.concatenate([related_ids.astype(np.int64), by_length], axis=1)
+        similarity = np.concatenate([related_scores, np.zeros(by_length.shape, dtype=np.float32)], axis=1)
+
+        rows = np.arange(count)[:, None]
+        safe = np.clip(candidates, 0, None)
+        longest = np.maximum(lengths[rows], lengths[safe])
+        longest[longest == 0] = 1.0
+        scores = (
+            similarity
+            + SAME_CATEGORY_BONUS * (categories[safe] == categories[rows])
+            + LENGTH_BONUS * (1.0 - np.abs(lengths[safe] - lengths[rows]) / longest)
+        )
+        scores[(candidates < 0) | (candidates == rows)] = -np.inf
+        order = np.argsort(-scores, axis=1, kind='stable')
+        ranked = np.take_along_axis(candidates, order, axis=1)
+        ranked_scores = np.take_along_axis(scores, order, axis=1)
+
+        terms = catalog.terms
+        for term_id in range(count):
+            # A term can be both a neighbour and a length match; also skip
+            # terms that happen to share the answer's definition
+            definition = terms[term_id].definition
+            seen = set()
+            pool: List[int] = []
+            for candidate, score in zip(ranked[term_id].tolist(), ranked_scores[term_id].tolist()):
+                if score == -np.inf or len(pool) >= pool_size:
+                    break
+                if candidate in seen or terms[candidate].definition == definition:
+                    continue
+                seen.add(candidate)
+                pool.append(candidate)
+            self._pools[term_id, :len(pool)] = pool
+
+    def pool_ids(self, term_id: int) -> Tuple[int, ...]:
+        """Distractor term IDs for a term, most plausible first"""
+        pool = self._pools[term_id]
+        return tuple(int(candidate) for candidate in pool[pool >= 0])
+
+    def question(self, term: TermRecord, rng: Optional[random.Random] = None) -> QuizQuestion:
+        """Multiple-choice question for a term with its options already shuffled"""
+        rng = rng or random
+        # Looked up by name: a record held in session state may predate a catalog reload
+        term_id = self.catalog.id_of(term.name)
+        pool = list(self.pool_ids(term_id)) if term_id is not None else []
+        window = pool[:DISTRACTOR_DRAW_WINDOW]
+        drawn = rng.sample(window, min(DISTRACTORS_PER_QUESTION, len(window)))
+        if len(drawn) < DISTRACTORS_PER_QUESTION:
+            # Tiny catalog: top up from whatever other terms there are
+            spare = (
+                candidate for candidate in itertools.chain(pool, range(len(self.catalog)))
+                if candidate != term_id and candidate not in drawn
+            )
+            drawn += itertools.islice(spare, DISTRACTORS_PER_QUESTION - len(drawn))
+
+        options = [term] + [self.catalog.get(candidate) for candidate in drawn]
+        rng.shuffle(options)
+        return QuizQuestion(term, tuple(options), options.index(term))
@@ -0,0 +1,208 @@
+"""Quiz answer events in a fixed-size columnar ring buffer, flushed in batches"""
+
+import time
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from cryptolearn.catalog import TermCatalog
+from cryptolearn.scheduler import GRADE_CORRECT, GRADE_WRONG
+
+HISTORY_CAPACITY = 2048
+MAX_OPTIONS = 4
+FLUSH_BATCH = 32
+FLUSH_INTERVAL = 60.0  # seconds an answer may wait before it is flushed
+
+# Columns handed to a sink: one row per answer, oldest first
+Batch = Dict[str, list]
+Sink = Callable[[Batch], None]
+
+
+class AnswerLog:
+    """Recent quiz answers for one learner, stored column by column.
+
+    Each answer is a row of fixed-width NumPy columns (term ID, mode code,
+    correct, SM-2 grade, latency, timestamp and the option term IDs shown), so memory
+    is bounded by ``capacity`` however long a session runs, and per-term
+    statistics over the window are single bincounts. Rows not yet written
+    to durable storage are handed to ``sink`` in batches; the ring never
+    overwrites a row that has not been flushed.
+    """
+
+    def __init__(self, catalog: TermCatalog, sink: Optional[Sink] = None, capacity: int = HISTORY_CAPACITY):
+        self.catalog = catalog
+        self.sink = sink
+        self.capacity = capacity
+        self.term_id = np.zeros(capacity, dtype=np.int32)
+        self.mode = np.zeros(capacity, dtype=np.uint8)
+        self.correct = np.zeros(capacity, dtype=bool)
+        self.grade = np.zeros(capacity, dtype=np.uint8)  # as given to the review scheduler
+        self.latency = np.zeros(capacity, dtype=np.float32)  # seconds
+        self.answered_at = np.zeros(capacity, dtype=np.float64)
+        self.options = np.full((capacity, MAX_OPTIONS), -1, dtype=np.int32)
+        self._modes: List[str] = []
+        self._mode_codes: Dict[str, int] = {}
+        self._total = 0  # answers ever appended
+        self._flushed = 0  # answers handed to the sink
+        self._first_pending_at = 0.0
+
+    def __len__(self) -> int:
+        return min(self._total, self.capacity)
+
+    @property
+    def total(self) -> int:
+        return self._total
+
+    @property
+    def pending(self) -> int:
+        return self._total - self._flushed
+
+    def mode_code(self, mode: str) -> int:
+        code = self._mode_codes.get(mode)
+        if code is None:
+            code = self._mode_codes[mode] = len(self._modes)
+            self._modes.append(mode)
+        return code
+
+    def append(
+        self,
+        term_id: int,
+        mode: str,
+        correct: bool,
+        latency: float,
+        options: Sequence[int] = (),
+        answered_at: Optional[float] = None,
+        grade: Optional[int] = None,
+    ) -> None:
+        answered_at = time.time() if answered_at is None else answered_at
+        if grade is None:
+            grade = GRADE_CORRECT if correct else GRADE_WRONG
+        if self.pending >= self.capacity:
+            self.flush()  # the oldest pending row is about to be overwritten
+            if self.pending >= self.capacity:
+                self._flushed += 1  # no sink: oldest row is dropped
+
+        row = self._total % self.capacity
+        self.term_id[row] = term_id
+        self.mode[row] = self.mode_code(mode)
+        self.correct[row] = correct
+        self.grade[row] = grade
+        self.latency[row] = latency
+        self.answered_at[row] = answered_at
+        self.options[row] = -1
+        self.options[row, :min(len(options), MAX_OPTIONS)] = list(options)[:MAX_OPTIONS]
+        if not self.pending:
+            self._first_pending_at = answered_at
+        self._total += 1
+
+        if self.pending >= FLUSH_BATCH or answered_at - self._first_pending_at >= FLUSH_INTERVAL:
+            self.flush()
+
+    def extend(
+        self,
+        term_ids: Sequence[int],
+        mode: str,
+        correct: Sequence[bool],
+        latency: Sequence[float],
+        options: Optional[np.ndarray] = None,
+        answered_at: Optional[float] = None,
+        grade: Optional[Sequence[int]] = None,
+    ) -> None:
+        """Append a batch of answers (e.g. a scored lightning round) with one write per column"""
+        count = len(term_ids)
+        if count > self.capacity:
+            for index in range(count):
+                shown = () if options is None else options[index]
+                self.append(term_ids[index], mode, correct[index], latency[index], shown, answered_at,
+                            None if grade is None else grade[index])
+            return
+        answered_at = time.time() if answered_at is None else answered_at
+        if self.pending + count > self.capacity:
+            self.flush()
+            overflow = self.pending + count - self.capacity
+            if overflow > 0:
+                self._flushed += overflow  # no sink: oldest rows are dropped
+
+        rows = self._window(self._total, self._total + count)
+        self.term_id[rows] = term_ids
+        self.mode[rows] = self.mode_code(mode)
+        self.correct[rows] = correct
+        self.grade[rows] = np.where(correct, GRADE_CORRECT, GRADE_WRONG) if grade is None else grade
+        self.latency[rows] = latency
+        self.answered_at[rows] = answered_at
+        self.options[rows] = -1
+        if options is not None:
+            width = min(options.shape[1], MAX_OPTIONS)
+            self.options[rows, :width] = options[:, :width]
+        if not self.pending:
+            self._first_pending_at = answered_at
+        self._total += count
+
+        if self.pending >= FLUSH_BATCH or answered_at - self._first_pending_at >= FLUSH_INTERVAL:
+            self.flush()
+
+    def _window(self, start: int, stop: int) -> np.ndarray:
+        """Ring rows for absolute answer numbers [start, stop), oldest first"""
+        return np.arange(start, stop) % self.capacity
+
+    def recent(self) -> np.ndarray:
+        return self._window(self._total - len(self), self._total)
+
+    def flush(self) -> int:
+        """Hand pending rows to the sink; returns how many were written"""
+        if self.sink is None or not self.pending:
+            return 0
+        rows = self._window(self._flushed, self._total)
+        self.sink(self.batch(rows))
+        self._flushed = self._total
+        return len(rows)
+
+    def batch(self, rows: np.ndarray) -> Batch:
+        terms = self.catalog.terms
+
+        def name(term_id: int) -> str:
+            return terms[term_id].name if 0 <= term_id < len(terms) else ''
+
+        return {
+            'term': [name(term_id) for term_id in self.term_id[rows].tolist()],
+            'mode': [self._modes[code] for code in self.mode[rows].tolist()],
+            'correct': self.correct[rows].astype(int).tolist(),
+            'grade': self.grade[rows].astype(int).tolist(),
+            'latency_ms': np.round(self.latency[rows] * 1000).astype(int).tolist(),
+            'answered_at': self.answered_at[rows].tolist(),
+            'options': [
+                '|'.join(name(option) for option in shown if option >= 0)
+                for shown in self.options[rows].tolist()
+            ],
+        }
+
+    def rebind(self, catalog: TermCatalog) -> None:
+        """Switch to a reloaded catalog; pending rows are flushed under the old IDs first"""
+        if catalog is self.catalog:
+            return
+        self.flush()
+        if catalog.version != self.catalog.version:
+            # Term IDs may have moved: carry the window over by name
+            remap = np.array([
+                -1 if catalog.id_of(term.name) is None else catalog.id_of(term.name)
+                for term in self.catalog
+            ] + [-1], dtype=np.int32)
+            self.term_id[:] = remap[self.term_id]
+            self.options[:] = remap[self.options]
+        self.catalog = catalog
+
+    def term_stats(self) -> Tuple[np.ndarray, np.ndarray]:
+        """(attempts, correct) per term ID over the recent window"""
+        rows = self.recent()
+        term_ids = self.term_id[rows]
+        known = term_ids >= 0
+        attempts = np.bincount(term_ids[known], minlength=len(self.catalog))
+        correct = np.bincount(term_ids[known], weights=self.correct[rows][known], minlength=len(self.catalog))
+        return attempts, correct.astype(np.int64)
+
+    def accuracy(self, last: Optional[int] = None) -> Optional[float]:
+        rows = self.recent()
+        if last is not None:
+            rows = rows[-last:]
+        return float(self.correct[rows].mean()) if len(rows) else None
+
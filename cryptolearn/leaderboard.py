@@ -0,0 +1,216 @@
+"""Learner leaderboard kept as an incrementally updated sorted index"""
+
+import threading
+import time
+from bisect import bisect_left, insort
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+LEADERBOARD_SIZE = 10
+SNAPSHOT_INTERVAL = 30.0  # seconds between shared snapshots (and store syncs)
+SUBLIST_LOAD = 1000  # keys per sublist before it is split in two
+
+# Ascending order = best first: most terms, then accuracy, then knowledge value
+RankKey = Tuple[int, int, int, str]
+
+# (learner_id, terms mastered, accuracy 0-1, knowledge value, updated_at), as the store returns them
+StatsRow = Tuple[str, int, float, int, float]
+
+
+def rank_key(learner_id: str, terms: int, accuracy: float, knowledge_value: int) -> RankKey:
+    return (-terms, -round(accuracy * 1000), -knowledge_value, learner_id)
+
+
+class Standing(NamedTuple):
+    rank: int  # 1-based
+    learner_id: str
+    terms: int
+    accuracy: float
+    knowledge_value: int
+
+
+class LeaderboardSnapshot(NamedTuple):
+    top: Tuple[Standing, ...]
+    learners: int
+    taken_at: float
+
+
+class _RankIndex:
+    """Sorted keys split into sublists, with a Fenwick tree over sublist lengths.
+
+    Inserting or removing a key is two bisects plus a shift inside one
+    sublist of at most ``2 * SUBLIST_LOAD`` keys, and the rank of a key is a
+    Fenwick prefix sum plus a bisect, so neither depends on walking the
+    whole population.
+    """
+
+    def __init__(self, keys: Iterable[RankKey] = ()):
+        keys = sorted(keys)
+        self._lists = [keys[start:start + SUBLIST_LOAD] for start in range(0, len(keys), SUBLIST_LOAD)]
+        self._maxes = [sublist[-1] for sublist in self._lists]
+        self._len = len(keys)
+        self._rebuild_tree()
+
+    def __len__(self) -> int:
+        return self._len
+
+    def _rebuild_tree(self) -> None:
+        tree = [0] + [len(sublist) for sublist in self._lists]
+        for i in range(1, len(tree)):
+            parent = i + (i & -i)
+            if parent < len(tree):
+                tree[parent] += tree[i]
+        self._tree = tree
+
+    def _tree_add(self, position: int, delta: int) -> None:
+        i = position + 1
+        while i < len(self._tree):
+            self._tree[i] += delta
+            i += i & -i
+
+    def _before(self, position: int) -> int:
+        """Number of keys in the sublists before ``position``"""
+        total = 0
+        i = position
+        while i > 0:
+            total += self._tree[i]
+            i -= i & -i
+        return total
+
+    def add(self, key: RankKey) -> None:
+        if not self._lists:
+            self._lists, self._maxes, self._len = [[key]], [key], 1
+            self._rebuild_tree()
+            return
+        position = min(bisect_left(self._maxes, key), len(self._lists) - 1)
+        sublist = self._lists[position]
+        insort(sublist, key)
+        self._maxes[position] = sublist[-1]
+        self._len += 1
+        if len(sublist) > 2 * SUBLIST_LOAD:
+            self._lists[position:position + 1] = [sublist[:SUBLIST_LOAD], sublist[SUBLIST_LOAD:]]
+            self._maxes[position:position + 1] = [sublist[SUBLIST_LOAD - 1], sublist[-1]]
+            self._rebuild_tree()
+        else:
+            self._tree_add(position, 1)
+
+    def remove(self, key: RankKey) -> None:
+        position = bisect_left(self._maxes, key)
+        sublist = self._lists[position]
+        del sublist[bisect_left(sublist, key)]
+        self._len -= 1
+        if sublist:
+            self._maxes[position] = sublist[-1]
+            self._tree_add(position, -1)
+        else:
+            del self._lists[position], self._maxes[position]
+            self._rebuild_tree()
+
+    def rank(self, key: RankKey) -> int:
+        """How many keys sort before ``key``"""
+        position = bisect_left(self._maxes, key)
+        if position == len(self._lists):
+            return self._len
+        return self._before(position) + bisect_left(self._lists[position], key)
+
+    def first(self, count: int) -> List[RankKey]:
+        keys: List[RankKey] = []
+        for sublist in self._lists:
+            if len(keys) >= count:
+                break
+            keys.extend(sublist[:count - len(keys)])
+        return keys
+
+
+class Leaderboard:
+    """Ranking of every learner by terms mastered, accuracy and knowledge value.
+
+    Updates move one learner's key within the sorted index, so "your rank"
+    and the top of the board never sort the population. Learners saved by
+    other processes are pulled from the progress store, at most once per
+    ``SNAPSHOT_INTERVAL``, when a snapshot is taken; every session reads
+    the same immutable snapshot until then. The store is write-behind, so a
+    row is only applied if it is newer than the learner's last update here.
+    """
+
+    def __init__(self, rows: Iterable[StatsRow] = (), store=None):
+        self.store = store
+        self._keys: Dict[str, RankKey] = {}
+        self._updated_at: Dict[str, float] = {}  # when each learner's key was last set
+        for learner_id, terms, accuracy, knowledge_value, updated_at in rows:
+            self._keys[learner_id] = rank_key(learner_id, terms, accuracy, knowledge_value)
+            self._updated_at[learner_id] = updated_at
+        self._index = _RankIndex(self._keys.values())
+        self._lock = threading.Lock()
+        self._synced_at = time.time()
+        self._snapshot: Optional[LeaderboardSnapshot] = None
+
+    @classmethod
+    def from_store(cls, store) -> 'Leaderboard':
+        synced_at = time.time()
+        leaderboard = cls(store.leaderboard_rows(), store=store)
+        leaderboard._synced_at = synced_at
+        return leaderboard
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def update(
+        self,
+        learner_id: str,
+        terms: int,
+        accuracy: float,
+        knowledge_value: int,
+        updated_at: Optional[float] = None,
+    ) -> None:
+        """Move a learner to their new stats, unless ``updated_at`` is older than what we already have"""
+        key = rank_key(learner_id, terms, accuracy, knowledge_value)
+        updated_at = time.time() if updated_at is None else updated_at
+        with self._lock:
+            if updated_at < self._updated_at.get(learner_id, 0.0):
+                return
+            self._updated_at[learner_id] = updated_at
+            old = self._keys.get(learner_id)
+            if old == key:
+                return
+            if old is not None:
+                self._index.remove(old)
+            self._index.add(key)
+            self._keys[learner_id] = key
+
+    def rank(self, learner_id: str) -> Optional[int]:
+        key = self._keys.get(learner_id)
+        if key is None:
+            return None
+        with self._lock:
+            return self._index.rank(key) + 1
+
+    def standing(self, learner_id: str) -> Optional[Standing]:
+        key = self._keys.get(learner_id)
+        if key is None:
+            return None
+        return _standing(self.rank(learner_id), key)
+
+    def top(self, count: int = LEADERBOARD_SIZE) -> Tuple[Standing, ...]:
+        with self._lock:
+            keys = self._index.first(count)
+        return tuple(_standing(position + 1, key) for position, key in enumerate(keys))
+
+    def snapshot(self, count: int = LEADERBOARD_SIZE) -> LeaderboardSnapshot:
+        """Shared view of the top of the board, refreshed at most every SNAPSHOT_INTERVAL"""
+        snapshot = self._snapshot
+        now = time.time()
+        if snapshot is not None and now - snapshot.taken_at < SNAPSHOT_INTERVAL and len(snapshot.top) >= count:
+            return snapshot
+        if self.store is not None:
+            # Overlap by one interval so rows committed late aren't missed
+            rows = self.store.leaderboard_rows(since=self._synced_at - SNAPSHOT_INTERVAL)
+            self._synced_at = now
+            for row in rows:
+                self.update(*row)
+        self._snapshot = LeaderboardSnapshot(self.top(count), len(self), now)
+        return self._snapshot
+
+
+def _standing(rank: int, key: RankKey) -> Standing:
+    terms, accuracy, knowledge_value, learner_id = key
+    return Standing(rank, learner_id, -terms, -accuracy / 1000, -knowledge_value)
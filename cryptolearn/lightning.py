@@ -0,0 +1,74 @@
+"""Timed lightning rounds: a batch of questions built up front and scored in one pass"""
+
+import random
+import time
+from typing import NamedTuple, Optional, Sequence
+
+import numpy as np
+
+from cryptolearn.ability import ItemBank
+from cryptolearn.distractors import DistractorPool, QuizQuestion
+from cryptolearn.progress import LearnedSet
+
+LIGHTNING_ROUND_SIZE = 10
+SECONDS_PER_QUESTION = 8.0
+
+
+class RoundResult(NamedTuple):
+    correct: np.ndarray  # bool per question
+    answered: np.ndarray  # bool per question
+    elapsed: float  # seconds from start to submission
+    in_time: bool
+
+    @property
+    def score(self) -> int:
+        return int(self.correct.sum())
+
+
+class LightningRound:
+    """A fixed batch of multiple-choice questions answered against the clock.
+
+    Terms, options and the answer key are all drawn when the round is
+    built, so answering needs no further work per question; the responses
+    come back together and are scored against the key in one vectorised
+    comparison.
+    """
+
+    def __init__(self, questions: Sequence[QuizQuestion], time_limit: float, started_at: Optional[float] = None):
+        self.questions = tuple(questions)
+        self.answers = np.array([question.answer for question in self.questions], dtype=np.int64)
+        self.time_limit = time_limit
+        self.started_at = time.time() if started_at is None else started_at
+        self.result: Optional[RoundResult] = None
+
+    @classmethod
+    def build(
+        cls,
+        item_bank: ItemBank,
+        distractors: DistractorPool,
+        ability: float,
+        learned: Optional[LearnedSet] = None,
+        size: int = LIGHTNING_ROUND_SIZE,
+        seconds_per_question: float = SECONDS_PER_QUESTION,
+        rng: Optional[random.Random] = None,
+    ) -> 'LightningRound':
+        """Round of ``size`` questions pitched at the learner's ability, easiest first"""
+        catalog = item_bank.catalog
+        term_ids = item_bank.choose_many(ability, size, learned, rng=rng)
+        questions = [distractors.question(catalog.get(term_id), rng) for term_id in term_ids]
+        return cls(questions, time_limit=seconds_per_question * len(questions))
+
+    def __len__(self) -> int:
+        return len(self.questions)
+
+    @property
+    def deadline(self) -> float:
+        return self.started_at + self.time_limit
+
+    def score(self, responses: Sequence[Optional[int]], now: Optional[float] = None) -> RoundResult:
+        """Grade chosen option indices (None = skipped) against the answer key"""
+        now = time.time() if now is None else now
+        chosen = np.array([-1 if response is None else response for response in responses], dtype=np.int64)
+        elapsed = now - self.started_at
+        self.result = RoundResult(chosen == self.answers, chosen >= 0, elapsed, elapsed <= self.time_limit)
+        return self.result
@@ -0,0 +1,177 @@
+"""CoinGecko market-data client: pooled connections, retries with backoff and a circuit breaker"""
+
+import random
+import threading
+import time
+from typing import List, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+COINGECKO_API = "https://api.coingecko.com/api/v3"
+
+CONNECT_TIMEOUT = 3.05
+READ_TIMEOUT = 10.0
+MAX_RETRIES = 2  # on top of the first attempt
+BACKOFF_BASE = 0.5  # seconds; doubled per retry, with full jitter
+BACKOFF_MAX = 8.0
+MAX_PER_PAGE = 250  # the most coins/markets will return per page
+# Consecutive failed requests that open the circuit, and how long it stays open
+BREAKER_THRESHOLD = 5
+BREAKER_COOLDOWN = 60.0
+
+
+class MarketDataError(Exception):
+    """Raised when market data can't be fetched"""
+
+
+class UpstreamUnavailable(MarketDataError):
+    """Connection failure, timeout or 5xx from the API, after retries"""
+
+
+class RateLimited(MarketDataError):
+    """The API answered 429; ``retry_after`` is how long it asked us to wait"""
+
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class BadResponse(MarketDataError):
+    """A 4xx other than 429, or a body that isn't the JSON we expect; not retried"""
+
+
+class CircuitOpen(MarketDataError):
+    """Too many recent failures: calls fail fast until the cooldown has passed"""
+
+
+class CircuitBreaker:
+    """Fails fast after ``threshold`` consecutive failures, for ``cooldown`` seconds.
+
+    Once the cooldown has passed a single trial call is let through
+    (half-open); its success closes the circuit, its failure reopens it.
+    """
+
+    def __init__(self, threshold: int = BREAKER_THRESHOLD, cooldown: float = BREAKER_COOLDOWN):
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._trial_running = False
+        self._lock = threading.Lock()
+
+    @property
+    def is_open(self) -> bool:
+        return self._opened_at is not None and time.monotonic() - self._opened_at < self.cooldown
+
+    def before_call(self) -> None:
+        with self._lock:
+            if self._opened_at is None:
+                return
+            remaining = self.cooldown - (time.monotonic() - self._opened_at)
+            if remaining > 0 or self._trial_running:
+                raise CircuitOpen(f"Market data API circuit open; retrying in {max(remaining, 0):.0f}s")
+            self._trial_running = True
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._trial_running = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._trial_running or self._failures >= self.threshold:
+                self._opened_at = time.monotonic()
+            self._trial_running = False
+
+
+class CoinGeckoClient:
+    """Thread-safe client sharing one pooled HTTP session across all callers.
+
+    Connection failures, timeouts, 5xx and 429 responses are retried up to
+    ``max_retries`` times with jittered exponential backoff (honouring
+    ``Retry-After``); every call that still fails counts against the
+    circuit breaker. ``base_url`` can point at a local stub server.
+    """
+
+    max_per_page = MAX_PER_PAGE
+
+    def __init__(
+        self,
+        base_url: str = COINGECKO_API,
+        max_retries: int = MAX_RETRIES,
+        breaker: Optional[CircuitBreaker] = None,
+        pool_size: int = 10,
+        session: Optional[requests.Session] = None,
+    ):
+        self.base_url = base_url.rstrip('/')
+        self.max_retries = max_retries
+        self.breaker = breaker or CircuitBreaker()
+        self.session = session or requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.session.headers.setdefault('Accept', 'application/json')
+
+    def get_json(self, path: str, params: Optional[dict] = None):
+        self.breaker.before_call()
+        try:
+            result = self._get_with_retries(path, params)
+        except BadResponse:
+            self.breaker.record_success()  # the API is up; the request was wrong
+            raise
+        except Exception:
+            self.breaker.record_failure()
+            raise
+        self.breaker.record_success()
+        return result
+
+    def _get_with_retries(self, path: str, params: Optional[dict]):
+        url = f"{self.base_url}/{path.lstrip('/')}"
+        for attempt in range(self.max_retries + 1):
+            retry_after = None
+            try:
+                response = self.session.get(url, params=params, timeout=(CONNECT_TIMEOUT, READ_TIMEOUT))
+            except (requests.ConnectionError, requests.Timeout) as e:
+                error: MarketDataError = UpstreamUnavailable(f"Market data API unreachable: {e}")
+            else:
+                if response.status_code == 429:
+                    retry_after = _retry_after(response)
+                    error = RateLimited("Market data API rate limit hit", retry_after)
+                elif response.status_code >= 500:
+                    error = UpstreamUnavailable(f"Market data API returned {response.status_code}")
+                elif response.status_code >= 400:
+                    raise BadResponse(f"Market data API returned {response.status_code} for {path}")
+                else:
+                    try:
+                        return response.json()
+                    except ValueError as e:
+                        raise BadResponse(f"Market data API returned invalid JSON: {e}") from e
+
+            if attempt == self.max_retries or (retry_after is not None and retry_after > BACKOFF_MAX):
+                raise error
+            delay = random.uniform(0, min(BACKOFF_MAX, BACKOFF_BASE * 2 ** attempt))
+            time.sleep(max(delay, retry_after or 0))
+
+    def markets(self, vs_currency: str = 'usd', per_page: int = 10, page: int = 1, price_change: str = '24h,7d') -> List[dict]:
+        """One page of coins ordered by market cap"""
+        data = self.get_json('coins/markets', {
+            'vs_currency': vs_currency,
+            'order': 'market_cap_desc',
+            'per_page': per_page,
+            'page': page,
+            'sparkline': 'false',
+            'price_change_percentage': price_change,
+        })
+        if not isinstance(data, list):
+            raise BadResponse("Market data API returned an unexpected payload for coins/markets")
+        return data
+
+
+def _retry_after(response: requests.Response) -> Optional[float]:
+    try:
+        return max(0.0, float(response.headers['Retry-After']))
+    except (KeyError, ValueError):
+        return None
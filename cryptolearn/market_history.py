@@ -0,0 +1,244 @@
+"""Local time series of polled market snapshots: columnar, partitioned by day, downsampled with age"""
+
+import calendar
+import json
+import os
+import shutil
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+HISTORY_DIR = Path(__file__).resolve().parent.parent / "data" / "market_history"
+
+DAY = 86400
+MINUTE = 60
+HOUR = 3600
+# Stored per coin and time slot, in this order
+FIELDS = ('price', 'market_cap', 'volume')
+SNAPSHOT_FIELDS = ('current_price', 'market_cap', 'total_volume')
+# Minute data is kept this long, then averaged down to hourly; hourly data is dropped after RETENTION_DAYS
+MINUTE_DAYS = 31
+RETENTION_DAYS = 365
+
+
+class PriceHistory(NamedTuple):
+    """One field for a set of coins on a regular time grid; NaN where nothing was recorded"""
+    coins: Tuple[str, ...]
+    times: np.ndarray  # (T,) slot start, epoch seconds
+    values: np.ndarray  # (coins, T)
+
+    def row(self, coin_id: str) -> np.ndarray:
+        return self.values[self.coins.index(coin_id)]
+
+    def log_returns(self) -> np.ndarray:
+        """Slot-to-slot log returns; NaN wherever either end is missing"""
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return np.diff(np.log(self.values), axis=1)
+
+    def volatility(self) -> np.ndarray:
+        """Standard deviation of log returns per coin, in percent per slot; NaN with fewer than two returns"""
+        returns = self.log_returns()
+        valid = ~np.isnan(returns)
+        count = valid.sum(axis=1)
+        filled = np.where(valid, returns, 0.0)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            mean = filled.sum(axis=1) / count
+            variance = (np.where(valid, returns - mean[:, None], 0.0) ** 2).sum(axis=1) / (count - 1)
+        return np.where(count > 1, np.sqrt(variance) * 100, np.nan)
+
+    def rebased(self) -> np.ndarray:
+        """Every value as a percent change from the coin's first recorded one"""
+        valid = ~np.isnan(self.values)
+        first = self.values[np.arange(len(self.coins)), np.argmax(valid, axis=1)]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return (self.values / first[:, None] - 1) * 100
+
+    def change(self) -> np.ndarray:
+        """Percent change from each coin's first to its last recorded value"""
+        valid = ~np.isnan(self.values)
+        has_data = valid.any(axis=1)
+        first = np.argmax(valid, axis=1)
+        last = self.values.shape[1] - 1 - np.argmax(valid[:, ::-1], axis=1)
+        rows = np.arange(len(self.coins))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            change = (self.values[rows, last] / self.values[rows, first] - 1) * 100
+        return np.where(has_data, change, np.nan)
+
+
+class _Partition(NamedTuple):
+    coins: Tuple[str, ...]
+    index: Dict[str, int]
+    resolution: int  # seconds per slot
+    values: np.ndarray  # (fields, coins, slots), memory-mapped
+
+
+def _day_of(timestamp: float) -> str:
+    return time.strftime('%Y-%m-%d', time.gmtime(timestamp))
+
+
+def _day_start(day: str) -> int:
+    return calendar.timegm(time.strptime(day, '%Y-%m-%d'))
+
+
+def _resample(values: np.ndarray, resolution: int, step: int) -> np.ndarray:
+    """Average (coins, slots) down to ``step``, or repeat it up; NaN-aware"""
+    if step == resolution:
+        return values
+    if step < resolution:
+        return np.repeat(values, resolution // step, axis=-1)
+    grouped = values.reshape(values.shape[0], -1, step // resolution)
+    valid = ~np.isnan(grouped)
+    with np.errstate(invalid='ignore'):
+        return np.where(valid, grouped, 0.0).sum(axis=-1) / valid.sum(axis=-1)
+
+
+class MarketHistory:
+    """Append-only store of market snapshots in one directory per UTC day.
+
+    Each day holds ``coins.json`` and a float32 array shaped (field, coin,
+    slot): 1440 minute slots while the day is recent, 24 hourly slots once
+    compacted. A coin's series for one field is contiguous, so a range
+    query is a slice per day followed by a vectorised resample, and memory
+    mapping keeps a month of minute data for hundreds of coins cheap to read.
+    Compaction and retention run whenever a new day starts.
+    """
+
+    def __init__(
+        self,
+        directory: Union[str, Path] = HISTORY_DIR,
+        minute_days: int = MINUTE_DAYS,
+        retention_days: int = RETENTION_DAYS,
+    ):
+        self.directory = Path(directory)
+        self.minute_days = minute_days
+        self.retention_days = retention_days
+        self._partitions: Dict[str, _Partition] = {}
+        self._today: Optional[str] = None
+        self._lock = threading.RLock()
+
+    # Writing
+
+    def append(self, coins: Iterable[dict], timestamp: Optional[float] = None) -> None:
+        """Record one snapshot; later snapshots in the same minute overwrite earlier ones"""
+        timestamp = time.time() if timestamp is None else timestamp
+        coins = [coin for coin in coins if coin.get('id')]
+        day = _day_of(timestamp)
+        with self._lock:
+            if day != self._today:
+                self._today = day
+                self.compact(timestamp)
+            partition = self._partition(day)
+            if partition is None or partition.resolution != MINUTE:
+                partition = self._create(day, [coin['id'] for coin in coins])
+            missing = [coin['id'] for coin in coins if coin['id'] not in partition.index]
+            if missing:
+                partition = self._grow(day, partition, missing)
+            columns = [partition.index[coin['id']] for coin in coins]
+            row = np.array(
+                [[coin.get(field) for field in SNAPSHOT_FIELDS] for coin in coins], dtype=np.float64
+            ).T  # None becomes NaN
+            partition.values[:, columns, int(timestamp - _day_start(day)) // MINUTE] = row
+            partition.values.flush()
+
+    def compact(self, now: Optional[float] = None) -> None:
+        """Average minute days past ``minute_days`` down to hourly, and drop days past ``retention_days``"""
+        now = time.time() if now is None else now
+        with self._lock:
+            for day in self.days():
+                age = (now - _day_start(day)) / DAY
+                path = self.directory / day
+                if age > self.retention_days + 1:
+                    self._partitions.pop(day, None)
+                    shutil.rmtree(path, ignore_errors=True)
+                elif age > self.minute_days + 1 and (path / 'minute.npy').exists():
+                    minute = np.load(path / 'minute.npy')
+                    hourly = np.stack([_resample(field, MINUTE, HOUR) for field in minute]).astype(np.float32)
+                    _save(path / 'hourly.npy', hourly)
+                    self._partitions.pop(day, None)
+                    (path / 'minute.npy').unlink()
+
+    def _create(self, day: str, coin_ids: Sequence[str]) -> _Partition:
+        path = self.directory / day
+        path.mkdir(parents=True, exist_ok=True)
+        values = np.full((len(FIELDS), len(coin_ids), DAY // MINUTE), np.nan, dtype=np.float32)
+        _save(path / 'minute.npy', values)
+        (path / 'coins.json').write_text(json.dumps(list(coin_ids)), encoding='utf-8')
+        self._partitions.pop(day, None)
+        return self._partition(day)
+
+    def _grow(self, day: str, partition: _Partition, coin_ids: Sequence[str]) -> _Partition:
+        path = self.directory / day
+        extra = np.full((len(FIELDS), len(coin_ids), partition.values.shape[2]), np.nan, dtype=np.float32)
+        _save(path / 'minute.npy', np.concatenate([partition.values, extra], axis=1))
+        (path / 'coins.json').write_text(json.dumps(list(partition.coins) + list(coin_ids)), encoding='utf-8')
+        self._partitions.pop(day, None)
+        return self._partition(day)
+
+    # Reading
+
+    def days(self) -> List[str]:
+        """Recorded days, oldest first"""
+        if not self.directory.exists():
+            return []
+        return sorted(path.name for path in self.directory.iterdir() if (path / 'coins.json').exists())
+
+    def _partition(self, day: str) -> Optional[_Partition]:
+        partition = self._partitions.get(day)
+        if partition is None:
+            path = self.directory / day
+            try:
+                coins = tuple(json.loads((path / 'coins.json').read_text(encoding='utf-8')))
+                if (path / 'minute.npy').exists():
+                    resolution, values = MINUTE, np.load(path / 'minute.npy', mmap_mode='r+')
+                else:
+                    resolution, values = HOUR, np.load(path / 'hourly.npy', mmap_mode='r')
+            except (OSError, ValueError):
+                return None
+            partition = _Partition(coins, {coin: i for i, coin in enumerate(coins)}, resolution, values)
+            self._partitions[day] = partition
+        return partition
+
+    def query(
+        self,
+        coin_ids: Sequence[str],
+        start: float,
+        end: float,
+        step: int = HOUR,
+        field: str = 'price',
+    ) -> PriceHistory:
+        """``field`` for ``coin_ids`` over [start, end), averaged into ``step``-second slots"""
+        if step % MINUTE or DAY % step:
+            raise ValueError(f"step must be a whole number of minutes dividing a day, got {step}")
+        coin_ids = tuple(coin_ids)
+        field_index = FIELDS.index(field)
+        first_day = _day_start(_day_of(start))
+        n_days = max(0, int((end - 1 - first_day) // DAY) + 1)
+        slots = DAY // step
+        values = np.full((len(coin_ids), n_days * slots), np.nan)
+
+        with self._lock:
+            for k in range(n_days):
+                partition = self._partition(_day_of(first_day + k * DAY))
+                if partition is None:
+                    continue
+                if max(step, partition.resolution) % min(step, partition.resolution):
+                    raise ValueError(f"step {step}s doesn't line up with {partition.resolution}s history")
+                rows = [i for i, coin in enumerate(coin_ids) if coin in partition.index]
+                if rows:
+                    columns = [partition.index[coin_ids[i]] for i in rows]
+                    data = np.asarray(partition.values[field_index, columns], dtype=np.float64)
+                    values[rows, k * slots:(k + 1) * slots] = _resample(data, partition.resolution, step)
+
+        times = first_day + np.arange(n_days * slots) * step
+        keep = (times + step > start) & (times < end)
+        return PriceHistory(coin_ids, times[keep], values[:, keep])
+
+
+def _save(path: Path, values: np.ndarray) -> None:
+    """Write an array atomically, so memory-mapped readers never see half a file"""
+    temporary = path.with_suffix('.tmp.npy')
+    np.save(temporary, values)
+    os.replace(temporary, path)
@@ -0,0 +1,131 @@
+"""Process-wide background polling of market data into immutable snapshots"""
+
+import logging
+import threading
+import time
+from types import MappingProxyType
+from typing import Callable, Iterable, Mapping, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+POLL_INTERVAL = 60.0  # seconds between upstream fetches
+# Snapshot table column -> coin field it is built from
+COLUMNS = {
+    'price': 'current_price',
+    'market_cap': 'market_cap',
+    'volume': 'total_volume',
+    'change_24h': 'price_change_percentage_24h',
+    'change_7d': 'price_change_percentage_7d_in_currency',
+}
+
+
+def _column(coins: Sequence[Mapping], field: str) -> np.ndarray:
+    values = np.array([coin.get(field) for coin in coins], dtype=np.float64)  # missing -> NaN
+    values.flags.writeable = False
+    return values
+
+
+class MarketSnapshot(NamedTuple):
+    """One poll's worth of coins; read-only, so every session can share it.
+
+    ``table`` holds the numeric fields as NumPy columns in rank order, so
+    market-wide figures are computed over every coin without a Python loop.
+    """
+    coins: Tuple[Mapping, ...]
+    fetched_at: float
+    table: Mapping[str, np.ndarray]
+
+    @classmethod
+    def from_coins(cls, coins: Iterable[dict], fetched_at: Optional[float] = None) -> 'MarketSnapshot':
+        coins = tuple(MappingProxyType(dict(coin)) for coin in coins)
+        return cls(
+            coins,
+            time.time() if fetched_at is None else fetched_at,
+            MappingProxyType({column: _column(coins, field) for column, field in COLUMNS.items()}),
+        )
+
+    def age(self, now: Optional[float] = None) -> float:
+        return (time.time() if now is None else now) - self.fetched_at
+
+    def breadth(self) -> float:
+        """Share of coins (with a 24h change) that are up over the last 24h"""
+        change = self.table['change_24h']
+        known = ~np.isnan(change)
+        return float((change[known] > 0).mean()) if known.any() else 0.0
+
+    def average_change(self) -> float:
+        """Unweighted mean 24h change across every coin, in percent"""
+        change = self.table['change_24h']
+        return float(np.nanmean(change)) if (~np.isnan(change)).any() else 0.0
+
+    def total_market_cap(self) -> float:
+        return float(np.nansum(self.table['market_cap']))
+
+
+class MarketPoller:
+    """Fetches market data on a fixed schedule in one daemon thread.
+
+    Each successful poll replaces ``latest`` with a new immutable snapshot
+    (a single reference assignment, so readers never need a lock). Pages
+    only read ``latest``, so rendering does no network I/O and upstream
+    traffic is one request per interval however many sessions are open.
+    A failed poll keeps the previous snapshot and is retried after the
+    interval, or after the error's ``retry_after`` if that is longer.
+    ``on_snapshot`` is called with every new snapshot once it is published;
+    if it raises, the error is logged and kept in ``consumer_error`` until
+    the consumer next succeeds, and the feed carries on.
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[], Iterable[dict]],
+        interval: float = POLL_INTERVAL,
+        on_snapshot: Optional[Callable[[MarketSnapshot], None]] = None,
+    ):
+        self._fetch = fetch
+        self.interval = interval
+        self.on_snapshot = on_snapshot
+        self.latest: Optional[MarketSnapshot] = None
+        self.last_error: Optional[BaseException] = None
+        self.consumer_error: Optional[BaseException] = None
+        self.polls = 0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> 'MarketPoller':
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name='market-poller', daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    def poll_once(self) -> Optional[MarketSnapshot]:
+        """Fetch now and publish the result; returns None if the fetch failed"""
+        self.polls += 1
+        try:
+            snapshot = MarketSnapshot.from_coins(self._fetch())
+        except Exception as error:
+            self.last_error = error
+            return None
+        self.latest = snapshot
+        self.last_error = None
+        if self.on_snapshot is not None:
+            try:
+                self.on_snapshot(snapshot)
+            except Exception as error:
+                logger.exception("Market snapshot consumer failed")
+                self.consumer_error = error  # a failing consumer mustn't stop the feed
+            else:
+                self.consumer_error = None
+        return snapshot
+
+    def _run(self) -> None:
+        delay = 0.0
+        while not self._stop.wait(delay):
+            delay = self.interval
+            if self.poll_once() is None:
+                delay = max(delay, getattr(self.last_error, 'retry_after', None) or 0.0)
@@ -0,0 +1,264 @@
+"""Pluggable market-data providers: live CoinGecko, recorded-fixture replay and synthetic coins
+
+Every provider answers ``markets(vs_currency, per_page, page)`` with a list of
+CoinGecko-shaped coin dicts, so the poller and the pages can't tell them apart.
+Pick one with a spec string (see ``provider_from_spec``), e.g. through the
+``MARKET_PROVIDER`` environment variable:
+
+    coingecko                      live API (the default)
+    coingecko:http://localhost:8000  live API shape from a stub server
+    replay:data/market_fixtures/bull  recorded snapshots, cycled
+    replay:data/market_fixtures/bull:0.5  ... with 0.5% random price drift per frame
+    synthetic:250:bear             250 generated coins in a bear market
+"""
+
+import argparse
+import json
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import List, Optional, Protocol, Union
+
+import numpy as np
+
+from cryptolearn.market_client import COINGECKO_API, BadResponse, CoinGeckoClient, MarketDataError
+
+FIXTURES_DIR = Path(__file__).resolve().parent.parent / "data" / "market_fixtures"
+
+# Page requests in flight at once when fetching more coins than fit on one page
+MAX_CONCURRENT_PAGES = 4
+
+# Mean and spread of the synthetic 24h change (%) per market regime
+REGIMES = {
+    'bull': (10.0, 3.0),
+    'bear': (-10.0, 3.0),
+    'flat': (0.0, 3.0),
+}
+# Coins that carry lessons, so synthetic markets still exercise those branches
+SEED_COINS = (
+    ('bitcoin', 'btc', 'Bitcoin', 60000.0),
+    ('ethereum', 'eth', 'Ethereum', 3000.0),
+    ('dogecoin', 'doge', 'Dogecoin', 0.15),
+)
+
+
+class MarketProvider(Protocol):
+    """Anything that can serve a page of coins ordered by market cap"""
+
+    max_per_page: Optional[int]  # None when any page size can be served in one call
+
+    def markets(self, vs_currency: str = 'usd', per_page: int = 10, page: int = 1) -> List[dict]:
+        ...
+
+
+def _page(coins: List[dict], per_page: int, page: int) -> List[dict]:
+    start = (page - 1) * per_page
+    return coins[start:start + per_page]
+
+
+class ReplayProvider:
+    """Serves recorded ``markets`` responses from a directory of JSON files.
+
+    Files are replayed in name order and cycled; the frame moves on with
+    every page-1 request, so each poll sees the next recording. With
+    ``drift`` (percent per frame) prices, caps and volumes follow a seeded
+    random walk on top of the recording, so a short fixture can stand in for
+    a long, still reproducible, session.
+    """
+
+    max_per_page = None
+
+    def __init__(self, path: Union[str, Path], drift: float = 0.0, seed: int = 0):
+        self.path = Path(path)
+        files = sorted(self.path.glob('*.json'))
+        if not files:
+            raise FileNotFoundError(f"No recorded market snapshots in {self.path}")
+        self.frames = [json.loads(file.read_text(encoding='utf-8')) for file in files]
+        for file, frame in zip(files, self.frames):
+            if not isinstance(frame, list):
+                raise BadResponse(f"{file} is not a recorded coins/markets response")
+        self.drift = drift
+        self._rng = np.random.default_rng(seed)
+        self._frame = -1
+        self._walk = np.zeros(0)
+        self._coins: List[dict] = []
+
+    def markets(self, vs_currency: str = 'usd', per_page: int = 10, page: int = 1) -> List[dict]:
+        if page == 1 or not self._coins:
+            self._advance()
+        return [dict(coin) for coin in _page(self._coins, per_page, page)]
+
+    def _advance(self) -> None:
+        self._frame += 1
+        coins = [dict(coin) for coin in self.frames[self._frame % len(self.frames)]]
+        if self.drift and coins:
+            # Cumulative log-normal walk per coin, one step per frame
+            steps = self._rng.normal(0.0, self.drift / 100, len(coins))
+            if len(self._walk) != len(coins):
+                self._walk = np.zeros(len(coins))
+            self._walk = self._walk + steps
+            for coin, factor, step in zip(coins, np.exp(self._walk), steps):
+                for field in ('current_price', 'market_cap', 'total_volume'):
+                    if coin.get(field) is not None:
+                        coin[field] = type(coin[field])(coin[field] * factor)
+                if coin.get('price_change_percentage_24h') is not None:
+                    coin['price_change_percentage_24h'] += float(step) * 100
+        self._coins = coins
+
+
+class SyntheticProvider:
+    """Generates ``n_coins`` plausible coins for a bull, bear or flat market.
+
+    Output is a pure function of ``seed``, ``regime`` and the frame number
+    (which, as with replay, moves on with every page-1 request), so the
+    bull/bear branches of the market pages can be reproduced exactly.
+    """
+
+    max_per_page = None
+
+    def __init__(self, n_coins: int = 100, regime: str = 'flat', seed: int = 0):
+        if regime not in REGIMES:
+            raise ValueError(f"Unknown market regime {regime!r}; expected one of {sorted(REGIMES)}")
+        self.n_coins = n_coins
+        self.regime = regime
+        self.seed = seed
+        self._frame = -1
+        self._coins: List[dict] = []
+
+    def markets(self, vs_currency: str = 'usd', per_page: int = 10, page: int = 1) -> List[dict]:
+        if page == 1 or not self._coins:
+            self._frame += 1
+            self._coins = self.generate(self._frame)
+        return [dict(coin) for coin in _page(self._coins, per_page, page)]
+
+    def generate(self, frame: int = 0) -> List[dict]:
+        """Every coin for one frame, ordered by market cap"""
+        n = self.n_coins
+        base = np.random.default_rng([self.seed, n])
+        tick = np.random.default_rng([self.seed, n, frame + 1])
+        mean, spread = REGIMES[self.regime]
+
+        # Zipf-like caps keep the ordering stable; prices jitter per frame
+        market_cap = 1.2e12 / np.arange(1, n + 1) ** 1.3 * base.uniform(0.9, 1.1, n)
+        market_cap = np.sort(market_cap)[::-1] * np.exp(tick.normal(0.0, 0.002, n))
+        price = np.exp(base.uniform(np.log(0.001), np.log(500.0), n))
+        seeded = min(n, len(SEED_COINS))
+        price[:seeded] = [coin[3] for coin in SEED_COINS[:seeded]]
+        price *= np.exp(tick.normal(0.0, 0.005, n))
+        volume = market_cap * base.uniform(0.01, 0.15, n)
+        change_24h = tick.normal(mean, spread, n)
+        change_7d = change_24h * base.uniform(0.5, 2.5, n) + tick.normal(0.0, spread, n)
+
+        coins = []
+        for i in range(n):
+            coin_id, symbol, name = SEED_COINS[i][:3] if i < seeded else (f'synth-{i}', f's{i}', f'Synth Coin {i}')
+            coins.append({
+                'id': coin_id,
+                'symbol': symbol,
+                'name': name,
+                'current_price': float(price[i]),
+                'market_cap': int(market_cap[i]),
+                'market_cap_rank': i + 1,
+                'total_volume': int(volume[i]),
+                'price_change_percentage_24h': float(change_24h[i]),
+                'price_change_percentage_7d_in_currency': float(change_7d[i]),
+            })
+        return coins
+
+
+def fetch_top(
+    provider: MarketProvider,
+    count: int,
+    vs_currency: str = 'usd',
+    workers: int = MAX_CONCURRENT_PAGES,
+) -> List[dict]:
+    """The top ``count`` coins by market cap, requesting all the pages at once.
+
+    Wall-clock time is one page's round trip for up to ``workers`` pages.
+    The client already retries each page (honouring ``Retry-After``); if a
+    page still fails, pages not yet sent are cancelled so a rate limit isn't
+    hammered further, and the coins ranked above the failed page are kept.
+    Only a failure of the first page is raised.
+    """
+    per_page = min(count, provider.max_per_page or count)
+    pages = -(-count // per_page)
+    if pages == 1:
+        return provider.markets(vs_currency, per_page=per_page)[:count]
+
+    coins: List[dict] = []
+    pool = ThreadPoolExecutor(max_workers=min(workers, pages), thread_name_prefix='market-page')
+    futures = [pool.submit(provider.markets, vs_currency, per_page, page) for page in range(1, pages + 1)]
+    try:
+        for page, future in enumerate(futures, 1):
+            try:
+                batch = future.result()
+            except MarketDataError:
+                if page == 1:
+                    raise
+                break
+            coins.extend(batch)
+            if len(batch) < per_page:
+                break  # ran out of coins
+    finally:
+        # Pages not yet sent are dropped; any still in flight finish in the background
+        for future in futures:
+            future.cancel()
+        pool.shutdown(wait=False)
+    return coins[:count]
+
+
+def provider_from_spec(spec: Optional[str] = None) -> MarketProvider:
+    """Build a provider from ``kind[:arg[:arg]]``; see the module docstring"""
+    kind, _, rest = (spec or 'coingecko').partition(':')
+    if kind == 'coingecko':
+        return CoinGeckoClient(rest or COINGECKO_API)
+    if kind == 'replay':
+        path, _, drift = rest.rpartition(':')
+        try:
+            drift = float(drift)
+        except ValueError:
+            path, drift = rest, 0.0
+        return ReplayProvider(path or FIXTURES_DIR, drift)
+    if kind == 'synthetic':
+        parts = [part for part in rest.split(':') if part]
+        n_coins = int(parts[0]) if parts else 100
+        regime = parts[1] if len(parts) > 1 else 'flat'
+        return SyntheticProvider(n_coins, regime)
+    raise ValueError(f"Unknown market provider {spec!r}")
+
+
+def record(provider: MarketProvider, directory: Union[str, Path], frames: int = 1, per_page: int = 10) -> List[Path]:
+    """Save ``frames`` page-1 responses from a provider as replayable fixtures"""
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    start = len(list(directory.glob('*.json')))
+    paths = []
+    for i in range(start, start + frames):
+        path = directory / f"{i:04d}.json"
+        path.write_text(json.dumps(provider.markets(per_page=per_page)), encoding='utf-8')
+        paths.append(path)
+    return paths
+
+
+def main(argv=None) -> None:
+    """Record market snapshots from a provider into a replay fixture directory"""
+    import time
+
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument('directory', help=f"fixture directory, e.g. {FIXTURES_DIR / 'bull'}")
+    parser.add_argument('--provider', default='coingecko', help="provider spec to record from")
+    parser.add_argument('--frames', type=int, default=1)
+    parser.add_argument('--per-page', type=int, default=10)
+    parser.add_argument('--interval', type=float, default=0.0, help="seconds between frames")
+    args = parser.parse_args(argv)
+
+    provider = provider_from_spec(args.provider)
+    paths = []
+    for i in range(args.frames):
+        if i and args.interval:
+            time.sleep(args.interval)
+        paths += record(provider, args.directory, per_page=args.per_page)
+    print(f"Recorded {len(paths)} snapshots from {args.provider} -> {args.directory}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,117 @@
+"""Learned-term state as a bitmap keyed by catalog term ID"""
+
+from typing import Iterable, Iterator, Union
+
+from cryptolearn.catalog import TermCatalog, TermRecord, ids_to_mask
+
+try:
+    _popcount = int.bit_count
+except AttributeError:  # Python < 3.10
+    def _popcount(value: int) -> int:
+        return bin(value).count('1')
+
+
+class LearnedSet:
+    """Set of mastered terms stored as one integer bitmap.
+
+    Bit ``i`` is set when catalog term ``i`` is mastered, so category counts
+    and "all DeFi terms mastered" checks are a popcount or AND against the
+    catalog's precomputed category masks, and the whole state serializes to
+    one bit per term. Membership accepts term records or term names.
+    ``version`` increases on every change, so derived statistics can be
+    cached against it.
+    """
+
+    __slots__ = ('_catalog', '_bits', '_version')
+
+    def __init__(self, catalog: TermCatalog, bits: int = 0):
+        self._catalog = catalog
+        self._bits = bits & catalog.all_mask
+        self._version = 0
+
+    @classmethod
+    def from_names(cls, catalog: TermCatalog, names: Iterable[str]) -> 'LearnedSet':
+        ids = (catalog.id_of(name) for name in names)
+        return cls(catalog, ids_to_mask(term_id for term_id in ids if term_id is not None))
+
+    @classmethod
+    def from_bytes(cls, catalog: TermCatalog, data: bytes) -> 'LearnedSet':
+        return cls(catalog, int.from_bytes(data, 'little'))
+
+    def to_bytes(self) -> bytes:
+        return self._bits.to_bytes((len(self._catalog) + 7) // 8, 'little')
+
+    @property
+    def catalog(self) -> TermCatalog:
+        return self._catalog
+
+    @property
+    def bits(self) -> int:
+        return self._bits
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    def _set_bits(self, bits: int) -> None:
+        if bits != self._bits:
+            self._bits = bits
+            self._version += 1
+
+    def rebind(self, catalog: TermCatalog) -> None:
+        """Re-key the bitmap after a catalog reload, matching terms by name"""
+        if catalog is self._catalog:
+            return
+        if catalog.version != self._catalog.version:
+            names = [term.name for term in self]
+            self._set_bits(LearnedSet.from_names(catalog, names).bits)
+        self._catalog = catalog
+
+    def _term_id(self, item: Union[TermRecord, str]):
+        if isinstance(item, TermRecord):
+            term_id = item.term_id
+            if term_id < len(self._catalog) and self._catalog.get(term_id).name == item.name:
+                return term_id
+            item = item.name
+        return self._catalog.id_of(item)
+
+    def add(self, item: Union[TermRecord, str]) -> None:
+        term_id = self._term_id(item)
+        if term_id is not None:
+            self._set_bits(self._bits | 1 << term_id)
+
+    def update(self, items: Iterable[Union[TermRecord, str]]) -> None:
+        """Add several terms with a single change of version"""
+        ids = (self._term_id(item) for item in items)
+        self._set_bits(self._bits | ids_to_mask(term_id for term_id in ids if term_id is not None))
+
+    def discard(self, item: Union[TermRecord, str]) -> None:
+        term_id = self._term_id(item)
+        if term_id is not None:
+            self._set_bits(self._bits & ~(1 << term_id))
+
+    def __contains__(self, item: Union[TermRecord, str]) -> bool:
+        term_id = self._term_id(item)
+        return term_id is not None and bool(self._bits >> term_id & 1)
+
+    def __len__(self) -> int:
+        return _popcount(self._bits)
+
+    def __iter__(self) -> Iterator[TermRecord]:
+        bits = self._bits
+        while bits:
+            low = bits & -bits
+            yield self._catalog.get(low.bit_length() - 1)
+            bits ^= low
+
+    def count_in(self, mask: int) -> int:
+        return _popcount(self._bits & mask)
+
+    def covers(self, mask: int) -> bool:
+        return self._bits & mask == mask
+
+    def category_count(self, category: str) -> int:
+        return self.count_in(self._catalog.category_mask(category))
+
+    def category_complete(self, category: str) -> bool:
+        return self.covers(self._catalog.category_mask(category))
@@ -0,0 +1,254 @@
+"""Prebuilt true/false and fill-in-the-blank questions compiled from the catalog.
+
+Questions are derived offline from each term's definition and example,
+deduplicated and quality-filtered, and stored per locale under
+data/question_bank/ so the quiz only looks items up. Compile (optionally
+across several processes) with::
+
+    python -m cryptolearn.question_bank --locale en --workers 4
+"""
+
+import argparse
+import hashlib
+import json
+import math
+import re
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from cryptolearn.autocomplete import edit_distance, normalize
+from cryptolearn.catalog import TermCatalog
+from cryptolearn.distractors import DistractorPool
+from cryptolearn.search import tokenize
+
+QUESTION_BANK_DIR = Path(__file__).resolve().parent.parent / 'data' / 'question_bank'
+BANK_SCHEMA_VERSION = 2  # bumped whenever generation rules change, so saved banks are rebuilt
+
+TRUE_FALSE = 'true_false'
+CLOZE = 'cloze'
+KINDS = (TRUE_FALSE, CLOZE)
+
+BLANK = '_____'
+MIN_PROMPT_WORDS = 6  # fewer and a statement gives too little to reason about
+MIN_KEYWORD_LENGTH = 4
+COMPILE_CHUNK_SIZE = 256
+
+
+class BankQuestion(NamedTuple):
+    qid: str
+    term: str  # term name, so items survive catalog reloads
+    kind: str  # TRUE_FALSE or CLOZE
+    prompt: str
+    answer: str  # 'true' / 'false', or the word(s) that fill the blank
+    source: str  # field the question was derived from
+
+    def check(self, response: str) -> bool:
+        """Whether a response is right; cloze answers tolerate case, spacing and one typo"""
+        if self.kind == TRUE_FALSE:
+            return response.strip().lower() == self.answer
+        given, expected = normalize(response), normalize(self.answer)
+        if not given:
+            return False
+        return given == expected or (len(expected) >= 5 and edit_distance(given, expected, 1) <= 1)
+
+
+def _question(term: str, kind: str, prompt: str, answer: str, source: str) -> BankQuestion:
+    digest = hashlib.sha1(f"{kind}\0{' '.join(prompt.lower().split())}".encode('utf-8')).hexdigest()
+    return BankQuestion(digest[:12], term, kind, prompt, answer, source)
+
+
+def _words(text: str) -> int:
+    return len(text.split())
+
+
+def _mentions(text: str, name: str) -> bool:
+    return re.search(rf"(?<!\w){re.escape(name)}(?!\w)", text, re.IGNORECASE) is not None
+
+
+# Per-process state for compile workers: the corpus-wide IDF table
+_idf: Dict[str, float] = {}
+
+
+def _init_worker(idf: Dict[str, float]) -> None:
+    global _idf
+    _idf = idf
+
+
+def generate_for_term(item: dict) -> List[BankQuestion]:
+    """Questions for one term, from plain data so it can run in a worker process.
+
+    ``item`` holds the term's name, definition, example and tags plus
+    ``false_definitions`` and ``false_examples``: (name, text) pairs of
+    plausible wrong answers, best first.
+    """
+    name, definition, example = item['name'], item['definition'], item['example']
+    questions = []
+
+    # True/false statements never name the term in their body: every false
+    # one is drawn from a text that doesn't, so a true one that did would
+    # give itself away. Definition first: one true statement, one built from
+    # the most plausible wrong definition
+    if _words(definition) >= MIN_PROMPT_WORDS and not _mentions(definition, name):
+        questions.append(_question(name, TRUE_FALSE, f"“{name}” means: {definition}", 'true', 'definition'))
+        for other_name, other_definition in item['false_definitions']:
+            if other_definition != definition and not _mentions(other_definition, other_name) and not _mentions(other_definition, name):
+                questions.append(_question(name, TRUE_FALSE, f"“{name}” means: {other_definition}", 'false', 'definition'))
+                break
+
+    # True/false on the example, same rules; examples that name the term
+    # become cloze questions below instead
+    if _words(example) >= MIN_PROMPT_WORDS and not _mentions(example, name):
+        questions.append(_question(name, TRUE_FALSE, f"This is an example of “{name}”: {example}", 'true', 'example'))
+        for other_name, other_example in item['false_examples']:
+            if other_example != example and not _mentions(other_example, other_name) and not _mentions(other_example, name):
+                questions.append(_question(name, TRUE_FALSE, f"This is an example of “{name}”: {other_example}", 'false', 'example'))
+                break
+
+    # Cloze on the example: blank out the term itself
+    if _mentions(example, name):
+        prompt = re.sub(rf"(?<!\w){re.escape(name)}(?!\w)", BLANK, example, flags=re.IGNORECASE)
+        if _words(prompt) >= MIN_PROMPT_WORDS:
+            questions.append(_question(name, CLOZE, prompt, name, 'example'))
+
+    # Cloze on the definition: blank out its most distinctive word, preferring
+    # words the term is tagged with
+    name_tokens = set(tokenize(name))
+    tag_tokens = set(tokenize(' '.join(item['tags'])))
+    keywords = [
+        token for token in dict.fromkeys(tokenize(definition))
+        if len(token) >= MIN_KEYWORD_LENGTH and token not in name_tokens and not token.isdigit()
+    ]
+    if keywords and _words(definition) >= MIN_PROMPT_WORDS:
+        keyword = max(keywords, key=lambda token: (token in tag_tokens, _idf.get(token, 0.0), len(token)))
+        match = re.search(rf"(?<![A-Za-z0-9]){re.escape(keyword)}(?![A-Za-z0-9])", definition, re.IGNORECASE)
+        if match:
+            prompt = f"“{name}”: {definition[:match.start()]}{BLANK}{definition[match.end():]}"
+            questions.append(_question(name, CLOZE, prompt, match.group(0), 'definition'))
+
+    return questions
+
+
+def _generate_chunk(items: List[dict]) -> List[BankQuestion]:
+    questions = []
+    for item in items:
+        questions.extend(generate_for_term(item))
+    return questions
+
+
+class QuestionBank:
+    """Compiled questions indexed by (term name, kind)"""
+
+    def __init__(self, questions: Iterable[BankQuestion], catalog_version: str = ''):
+        self.catalog_version = catalog_version
+        self.questions: Tuple[BankQuestion, ...] = tuple(questions)
+        index: Dict[Tuple[str, str], List[int]] = {}
+        for position, question in enumerate(self.questions):
+            index.setdefault((question.term, question.kind), []).append(position)
+        self._index = {key: tuple(positions) for key, positions in index.items()}
+
+    def __len__(self) -> int:
+        return len(self.questions)
+
+    def for_term(self, name: str, kind: str) -> Tuple[BankQuestion, ...]:
+        return tuple(self.questions[position] for position in self._index.get((name, kind), ()))
+
+    def kinds_for(self, name: str) -> Tuple[str, ...]:
+        return tuple(kind for kind in KINDS if (name, kind) in self._index)
+
+    def save(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open('w', encoding='utf-8') as handle:
+            json.dump({
+                'schema_version': BANK_SCHEMA_VERSION,
+                'catalog_version': self.catalog_version,
+                'questions': [question._asdict() for question in self.questions],
+            }, handle, ensure_ascii=False, indent=1)
+
+    @classmethod
+    def load(cls, path: Path, catalog: TermCatalog) -> Optional['QuestionBank']:
+        """Saved bank, or None if missing or compiled from another catalog version"""
+        if not path.exists():
+            return None
+        with path.open(encoding='utf-8') as handle:
+            raw = json.load(handle)
+        if raw.get('schema_version') != BANK_SCHEMA_VERSION or raw.get('catalog_version') != catalog.version:
+            return None
+        return cls((BankQuestion(**question) for question in raw['questions']), raw['catalog_version'])
+
+
+def bank_path(locale: str) -> Path:
+    return QUESTION_BANK_DIR / f"{locale}.json"
+
+
+def compile_question_bank(
+    catalog: TermCatalog,
+    distractors: DistractorPool,
+    workers: int = 1,
+    chunk_size: int = COMPILE_CHUNK_SIZE,
+) -> QuestionBank:
+    """Generate, deduplicate and index questions for every term.
+
+    Terms are split into chunks of plain data, so with ``workers > 1`` the
+    chunks are generated in parallel processes; results are merged in
+    catalog order, so the bank is the same either way.
+    """
+    document_frequency: Dict[str, int] = {}
+    for term in catalog:
+        for token in set(tokenize(term.definition)):
+            document_frequency[token] = document_frequency.get(token, 0) + 1
+    idf = {token: math.log((1 + len(catalog)) / (1 + count)) for token, count in document_frequency.items()}
+
+    items = []
+    for term in catalog:
+        others = [catalog.get(term_id) for term_id in distractors.pool_ids(term.term_id)]
+        items.append({
+            'name': term.name,
+            'definition': term.definition,
+            'example': term.example,
+            'tags': list(term.tags),
+            'false_definitions': [(other.name, other.definition) for other in others],
+            'false_examples': [(other.name, other.example) for other in others],
+        })
+    chunks = [items[start:start + chunk_size] for start in range(0, len(items), chunk_size)]
+
+    if workers > 1 and len(chunks) > 1:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(idf,)) as pool:
+            results = list(pool.map(_generate_chunk, chunks))
+    else:
+        _init_worker(idf)
+        results = [_generate_chunk(chunk) for chunk in chunks]
+
+    seen = set()
+    questions = []
+    for chunk in results:
+        for question in chunk:
+            if question.qid not in seen:
+                seen.add(question.qid)
+                questions.append(question)
+    return QuestionBank(questions, catalog.version)
+
+
+def main(argv=None) -> None:
+    """Compile the question bank for a locale and save it under data/question_bank/"""
+    import os
+
+    from cryptolearn.catalog_store import CatalogStore
+    from cryptolearn.related import RelatedTerms
+
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument('--locale', default='en')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args(argv)
+
+    catalog = CatalogStore().current(args.locale)
+    distractors = DistractorPool(catalog, RelatedTerms(catalog))
+    bank = compile_question_bank(catalog, distractors, workers=args.workers)
+    path = bank_path(args.locale)
+    bank.save(path)
+    counts = {kind: sum(1 for question in bank.questions if question.kind == kind) for kind in KINDS}
+    print(f"Compiled {len(bank)} questions {counts} for {len(catalog)} terms -> {path}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,130 @@
+"""Precomputed "related terms" graph from TF-IDF cosine similarity"""
+
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+from scipy import sparse
+
+from cryptolearn.catalog import TermCatalog, TermRecord
+from cryptolearn.search import tokenize
+
+NEIGHBOURS_PER_TERM = 8
+SIMILARITY_BLOCK_ROWS = 512
+# Below this many matrix cells a dense float32 copy is cheaper to multiply
+DENSE_CELL_LIMIT = 32_000_000
+# Words shared by more than this share of a large catalog say little about
+# relatedness but turn the similarity product dense, so they are left out
+MAX_DOCUMENT_FREQUENCY = 0.1
+MIN_PRUNED_FREQUENCY = 50
+
+# How much each field contributes to a term's vector
+FIELD_WEIGHTS = {
+    'definition': 1.0,
+    'example': 0.5,
+    'real_world_value': 0.5,
+    'tags': 2.0,
+}
+
+
+def build_tfidf_matrix(catalog: TermCatalog) -> sparse.csr_matrix:
+    """L2-normalised TF-IDF rows, one per term, over definitions, examples and tags"""
+    vocabulary: Dict[str, int] = {}
+    rows: List[int] = []
+    columns: List[int] = []
+    values: List[float] = []
+
+    for term_id, term in enumerate(catalog):
+        weights: Dict[int, float] = {}
+        for field, field_weight in FIELD_WEIGHTS.items():
+            value = getattr(term, field)
+            text = ' '.join(tag.replace('_', ' ') for tag in value) if field == 'tags' else value
+            for token in tokenize(text):
+                column = vocabulary.setdefault(token, len(vocabulary))
+                weights[column] = weights.get(column, 0.0) + field_weight
+        rows.extend([term_id] * len(weights))
+        columns.extend(weights)
+        values.extend(weights.values())
+
+    matrix = sparse.csr_matrix(
+        (np.asarray(values, dtype=np.float32), (rows, columns)),
+        shape=(len(catalog), len(vocabulary)),
+    )
+    # Sublinear term frequency, smoothed IDF
+    matrix.data = 1.0 + np.log(matrix.data)
+    document_frequency = np.bincount(matrix.indices, minlength=len(vocabulary))
+    idf = np.log((1 + len(catalog)) / (1 + document_frequency)) + 1.0
+    matrix = matrix @ sparse.diags(idf.astype(np.float32))
+
+    norms = np.sqrt(np.asarray(matrix.multiply(matrix).sum(axis=1)).ravel())
+    norms[norms == 0] = 1.0
+    return sparse.csr_matrix(sparse.diags(1.0 / norms) @ matrix, dtype=np.float32)
+
+
+def _prune_columns(matrix: sparse.csr_matrix) -> sparse.csr_matrix:
+    """Drop words that cannot link two terms (seen once) or link too many.
+
+    Rows are already normalised, so the kept columns still give cosine
+    similarity over the full vectors.
+    """
+    document_frequency = np.bincount(matrix.indices, minlength=matrix.shape[1])
+    ceiling = max(MIN_PRUNED_FREQUENCY, MAX_DOCUMENT_FREQUENCY * matrix.shape[0])
+    keep = np.flatnonzero((document_frequency >= 2) & (document_frequency <= ceiling))
+    return matrix[:, keep].tocsr()
+
+
+class RelatedTerms:
+    """Top-k cosine neighbours for every term, computed once per catalog version.
+
+    Similarities are computed block by block (matrix product, then a partial
+    sort of each dense block) so memory stays bounded while the whole build
+    remains vectorised. Small vocabularies are multiplied densely through
+    BLAS; large ones stay sparse. Lookups afterwards are a row read.
+    """
+
+    def __init__(self, catalog: TermCatalog, k: int = NEIGHBOURS_PER_TERM):
+        self.catalog = catalog
+        self.version = catalog.version
+        count = len(catalog)
+        k = max(0, min(k, count - 1))
+
+        self._neighbours = np.zeros((count, k), dtype=np.int32)
+        self._scores = np.zeros((count, k), dtype=np.float32)
+        if not k:
+            return
+
+        matrix = _prune_columns(build_tfidf_matrix(catalog))
+        if matrix.shape[0] * matrix.shape[1] <= DENSE_CELL_LIMIT:
+            matrix = matrix.toarray()
+            transposed = matrix.T
+        else:
+            transposed = matrix.T.tocsc()
+
+        for start in range(0, count, SIMILARITY_BLOCK_ROWS):
+            stop = min(start + SIMILARITY_BLOCK_ROWS, count)
+            block = matrix[start:stop] @ transposed
+            if sparse.issparse(block):
+                block = block.toarray()
+            block[np.arange(stop - start), np.arange(start, stop)] = -1.0  # never your own neighbour
+
+            top = np.argpartition(-block, k - 1, axis=1)[:, :k]
+            top_scores = np.take_along_axis(block, top, axis=1)
+            order = np.argsort(-top_scores, axis=1, kind='stable')
+            self._neighbours[start:stop] = np.take_along_axis(top, order, axis=1)
+            self._scores[start:stop] = np.take_along_axis(top_scores, order, axis=1)
+
+    def neighbour_matrix(self) -> Tuple[np.ndarray, np.ndarray]:
+        """(terms, k) arrays of neighbour IDs and cosine scores, best first; treat as read-only"""
+        return self._neighbours, self._scores
+
+    def related_ids(self, term_id: int, k: Optional[int] = None) -> Tuple[int, ...]:
+        """Neighbour IDs, most similar first, skipping terms with nothing in common"""
+        neighbours = self._neighbours[term_id, :k]
+        scores = self._scores[term_id, :k]
+        return tuple(int(neighbour) for neighbour in neighbours[scores > 0])
+
+    def related(self, term: TermRecord, k: Optional[int] = None) -> Tuple[TermRecord, ...]:
+        # Looked up by name: a record held in session state may predate a catalog reload
+        term_id = self.catalog.id_of(term.name)
+        if term_id is None:
+            return ()
+        return tuple(self.catalog.get(neighbour) for neighbour in self.related_ids(term_id, k))
@@ -0,0 +1,121 @@
+"""SM-2 spaced-repetition scheduling with a heap-backed due queue"""
+
+import heapq
+import itertools
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+DAY = 86400.0
+
+DEFAULT_EASE = 2.5
+MIN_EASE = 1.3
+# A missed card comes back within the session instead of SM-2's one day
+LAPSE_DELAY = 10 * 60.0
+FIRST_INTERVAL = 1.0  # days
+SECOND_INTERVAL = 6.0  # days
+
+# Answer grades on SM-2's 0-5 scale
+GRADE_CORRECT = 4
+GRADE_HINTED = 3  # correct, but only after a hint
+GRADE_WRONG = 1
+
+
+class _Card:
+    __slots__ = ('ease', 'interval', 'repetitions', 'due', 'lapses')
+
+    def __init__(self):
+        self.ease = DEFAULT_EASE
+        self.interval = 0.0  # days
+        self.repetitions = 0
+        self.due = 0.0
+        self.lapses = 0
+
+
+class ReviewScheduler:
+    """Per-learner review state: ease, interval and due time for each term.
+
+    Cards are keyed by term name so they survive catalog reloads. Every
+    review pushes the card's new due time onto a heap; superseded entries
+    are skipped lazily when they surface and the heap is compacted once
+    they outnumber live cards, so both reviewing and asking for the next
+    due card are O(log n) however many cards a learner has.
+    """
+
+    def __init__(self):
+        self._cards: Dict[str, _Card] = {}
+        self._heap: List[Tuple[float, int, str]] = []
+        self._sequence = itertools.count()
+
+    @classmethod
+    def from_history(cls, reviews: Iterable[Tuple[str, int, float]]) -> 'ReviewScheduler':
+        """Rebuild state by replaying (term name, grade, timestamp) reviews in order"""
+        scheduler = cls()
+        for name, grade, reviewed_at in reviews:
+            scheduler.review(name, grade, reviewed_at)
+        return scheduler
+
+    def __len__(self) -> int:
+        return len(self._cards)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._cards
+
+    def card(self, name: str) -> Optional[dict]:
+        card = self._cards.get(name)
+        if card is None:
+            return None
+        return {slot: getattr(card, slot) for slot in _Card.__slots__}
+
+    def review(self, name: str, grade: int, now: Optional[float] = None) -> float:
+        """Record an answer graded 0-5 and return the card's next due time"""
+        now = time.time() if now is None else now
+        card = self._cards.get(name)
+        if card is None:
+            card = self._cards[name] = _Card()
+
+        if grade < 3:
+            card.repetitions = 0
+            card.interval = 0.0
+            card.lapses += 1
+            card.due = now + LAPSE_DELAY
+        else:
+            card.repetitions += 1
+            if card.repetitions == 1:
+                card.interval = FIRST_INTERVAL
+            elif card.repetitions == 2:
+                card.interval = SECOND_INTERVAL
+            else:
+                card.interval = round(card.interval * card.ease, 2)
+            card.due = now + card.interval * DAY
+        card.ease = max(MIN_EASE, card.ease + 0.1 - (5 - grade) * (0.08 + (5 - grade) * 0.02))
+
+        heapq.heappush(self._heap, (card.due, next(self._sequence), name))
+        if len(self._heap) > 2 * len(self._cards) + 64:
+            self._compact()
+        return card.due
+
+    def forget(self, name: str) -> None:
+        """Drop a card (e.g. its term left the catalog); its heap entry is skipped later"""
+        self._cards.pop(name, None)
+
+    def peek_due(self, now: Optional[float] = None) -> Optional[str]:
+        """Most overdue term name, or None if nothing is due yet"""
+        now = time.time() if now is None else now
+        heap = self._heap
+        while heap:
+            due, _, name = heap[0]
+            card = self._cards.get(name)
+            if card is None or card.due != due:
+                heapq.heappop(heap)  # superseded by a later review
+                continue
+            return name if due <= now else None
+        return None
+
+    def next_review_at(self) -> Optional[float]:
+        """When the earliest card falls due, or None if there are no cards"""
+        self.peek_due(float('-inf'))  # drops superseded entries off the top
+        return self._heap[0][0] if self._heap else None
+
+    def _compact(self) -> None:
+        self._heap = [(card.due, next(self._sequence), name) for name, card in self._cards.items()]
+        heapq.heapify(self._heap)
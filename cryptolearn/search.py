@@ -0,0 +1,165 @@
+"""Ranked full-text search over the term catalog"""
+
+import bisect
+import math
+import re
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+from cryptolearn.catalog import Selector, TermCatalog, TermRecord
+
+# Field weights for BM25F-style scoring: a hit in the term name matters more
+# than one buried in an example sentence.
+FIELD_WEIGHTS = {
+    'name': 3.0,
+    'tags': 2.0,
+    'definition': 1.0,
+    'real_world_value': 0.6,
+    'example': 0.5,
+}
+BM25_K1 = 1.2
+BM25_B = 0.75
+MAX_PREFIX_EXPANSIONS = 20
+
+STOPWORDS = frozenset("""
+a an and are as at be by for from has in is it its of on or that the this to
+was were will with without
+""".split())
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+def tokenize(text: str) -> List[str]:
+    return [token for token in _TOKEN_RE.findall(text.lower()) if token not in STOPWORDS]
+
+
+class SearchHit(NamedTuple):
+    term_id: int
+    score: float
+    term: TermRecord
+
+
+class SearchResults(NamedTuple):
+    hits: List[SearchHit]
+    total: int
+    page: int
+    pages: int
+
+
+class SearchIndex:
+    """Inverted index with precomputed BM25 impacts per posting.
+
+    Scoring a query is a handful of NumPy scatter-adds over the postings of
+    its tokens, so cost depends on posting length rather than catalog size.
+    """
+
+    def __init__(self, catalog: TermCatalog):
+        self.catalog = catalog
+        self.version = catalog.version
+        doc_count = len(catalog)
+
+        weighted_tf: List[Dict[str, float]] = []
+        doc_lengths = np.zeros(doc_count, dtype=np.float64)
+        for term_id, term in enumerate(catalog):
+            frequencies: Dict[str, float] = {}
+            for field, weight in FIELD_WEIGHTS.items():
+                value = getattr(term, field)
+                text = ' '.join(tag.replace('_', ' ') for tag in value) if field == 'tags' else value
+                for token in tokenize(text):
+                    frequencies[token] = frequencies.get(token, 0.0) + weight
+                    doc_lengths[term_id] += weight
+            weighted_tf.append(frequencies)
+
+        avg_length = doc_lengths.mean() if doc_count else 1.0
+        postings: Dict[str, List[Tuple[int, float]]] = {}
+        for term_id, frequencies in enumerate(weighted_tf):
+            for token, tf in frequencies.items():
+                postings.setdefault(token, []).append((term_id, tf))
+
+        self._postings: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
+        for token, entries in postings.items():
+            ids = np.fromiter((term_id for term_id, _ in entries), dtype=np.int32, count=len(entries))
+            tf = np.fromiter((tf for _, tf in entries), dtype=np.float64, count=len(entries))
+            idf = math.log(1 + (doc_count - len(entries) + 0.5) / (len(entries) + 0.5))
+            norm = BM25_K1 * (1 - BM25_B + BM25_B * doc_lengths[ids] / avg_length)
+            self._postings[token] = (ids, (idf * tf * (BM25_K1 + 1) / (tf + norm)).astype(np.float32))
+
+        self._vocabulary = sorted(self._postings)
+
+    def _expand(self, token: str, allow_prefix: bool) -> List[str]:
+        """Exact token, or vocabulary words it prefixes when typing is in progress"""
+        if token in self._postings or not allow_prefix:
+            return [token] if token in self._postings else []
+        start = bisect.bisect_left(self._vocabulary, token)
+        expansions = []
+        for word in self._vocabulary[start:start + MAX_PREFIX_EXPANSIONS]:
+            if not word.startswith(token):
+                break
+            expansions.append(word)
+        return expansions
+
+    def score(self, query: str) -> Optional[np.ndarray]:
+        """Per-term BM25 scores for a query, or None if the query has no tokens"""
+        tokens = tokenize(query)
+        if not tokens:
+            return None
+
+        scores = np.zeros(len(self.catalog), dtype=np.float32)
+        for position, token in enumerate(tokens):
+            for word in self._expand(token, allow_prefix=position == len(tokens) - 1):
+                ids, impacts = self._postings[word]
+                scores[ids] += impacts
+        return scores
+
+    def search(
+        self,
+        query: str,
+        page: int = 1,
+        per_page: int = 10,
+        category: Selector = None,
+        difficulty: Selector = None,
+        importance: Selector = None,
+    ) -> SearchResults:
+        """Ranked, filtered and paginated matches for a free-text query"""
+        scores = self.score(query)
+        filtered = category is not None or difficulty is not None or importance is not None
+        if filtered:
+            allowed = np.array(
+                self.catalog.select_ids(category=category, difficulty=difficulty, importance=importance),
+                dtype=np.int64,
+            )
+        else:
+            allowed = np.arange(len(self.catalog))
+
+        if scores is None:
+            # Empty query browses the filtered catalog in its natural order
+            ranked = allowed
+            ranked_scores = np.zeros(len(ranked), dtype=np.float32)
+        else:
+            candidate_scores = scores[allowed]
+            matched = candidate_scores > 0
+            ranked = allowed[matched]
+            ranked_scores = candidate_scores[matched]
+
+        total = len(ranked)
+        pages = max(1, math.ceil(total / per_page))
+        page = min(max(1, page), pages)
+        stop = page * per_page
+
+        if scores is not None and total:
+            # Only order as much of the result list as this page needs
+            if stop < total:
+                top = np.argpartition(-ranked_scores, stop - 1)[:stop]
+            else:
+                top = np.arange(total)
+            order = top[np.lexsort((ranked[top], -ranked_scores[top]))]
+            ranked = ranked[order]
+            ranked_scores = ranked_scores[order]
+
+        window = slice(stop - per_page, stop)
+        hits = [
+            SearchHit(int(term_id), float(score), self.catalog.get(int(term_id)))
+            for term_id, score in zip(ranked[window], ranked_scores[window])
+        ]
+        return SearchResults(hits, total, page, pages)
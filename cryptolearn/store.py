@@ -0,0 +1,264 @@
+"""Durable learner progress in SQLite (WAL mode) with write-behind batching"""
+
+import atexit
+import json
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from cryptolearn.history import Batch, Sink
+from cryptolearn.scheduler import GRADE_CORRECT, GRADE_WRONG
+
+PROGRESS_DB = Path(__file__).resolve().parent.parent / 'data' / 'progress' / 'progress.db'
+FLUSH_INTERVAL = 2.0  # seconds staged writes may wait before they are committed
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS learners (
+    learner_id TEXT PRIMARY KEY,
+    profile TEXT NOT NULL,
+    quiz TEXT NOT NULL,
+    engagement TEXT NOT NULL,
+    theta REAL NOT NULL DEFAULT 0,
+    answers INTEGER NOT NULL DEFAULT 0,
+    updated_at REAL NOT NULL,
+    terms_mastered INTEGER NOT NULL DEFAULT 0,
+    accuracy REAL NOT NULL DEFAULT 0,
+    knowledge_value INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS learners_by_update ON learners (updated_at);
+CREATE TABLE IF NOT EXISTS mastered_terms (
+    learner_id TEXT NOT NULL,
+    term TEXT NOT NULL,
+    PRIMARY KEY (learner_id, term)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS quiz_events (
+    id INTEGER PRIMARY KEY,
+    learner_id TEXT NOT NULL,
+    term TEXT NOT NULL,
+    mode TEXT NOT NULL,
+    correct INTEGER NOT NULL,
+    latency_ms INTEGER NOT NULL,
+    answered_at REAL NOT NULL,
+    options TEXT NOT NULL,
+    grade INTEGER
+);
+CREATE INDEX IF NOT EXISTS quiz_events_by_learner ON quiz_events (learner_id, id);
+CREATE TABLE IF NOT EXISTS achievements (
+    learner_id TEXT NOT NULL,
+    key TEXT NOT NULL,
+    name TEXT NOT NULL,
+    unlocked_at TEXT NOT NULL,
+    PRIMARY KEY (learner_id, key)
+) WITHOUT ROWID;
+"""
+# Columns added to learners after its first release: (name, declaration)
+LEARNER_MIGRATIONS = (
+    ('terms_mastered', 'INTEGER NOT NULL DEFAULT 0'),
+    ('accuracy', 'REAL NOT NULL DEFAULT 0'),
+    ('knowledge_value', 'INTEGER NOT NULL DEFAULT 0'),
+)
+# Columns added to quiz_events after its first release; rows from before have no grade
+QUIZ_EVENT_MIGRATIONS = (
+    ('grade', 'INTEGER'),
+)
+LEARNER_COLUMNS = (
+    'learner_id', 'profile', 'quiz', 'engagement', 'theta', 'answers', 'updated_at',
+    'terms_mastered', 'accuracy', 'knowledge_value',
+)
+
+
+class LearnerState(NamedTuple):
+    profile: dict
+    quiz: dict
+    engagement: dict
+    theta: float
+    answers: int
+    mastered: List[str]  # term names
+    achievements: List[dict]  # AchievementTracker history entries
+    reviews: List[Tuple[str, int, float]]  # (term, grade, answered_at), oldest first
+
+
+class ProgressStore:
+    """Process-wide store for every learner's progress.
+
+    Saves only stage the latest state in memory, coalesced per learner, so
+    a button click never waits on the disk; a background thread commits
+    whatever is staged every ``flush_interval`` seconds in one transaction.
+    WAL mode lets sessions read while that write is in progress. Each
+    thread gets its own connection.
+    """
+
+    def __init__(self, path: Optional[Path] = None, flush_interval: float = FLUSH_INTERVAL):
+        self.path = Path(path or PROGRESS_DB)
+        self.flush_interval = flush_interval
+        self._local = threading.local()
+        self._lock = threading.Lock()  # guards the staged writes
+        self._flush_lock = threading.Lock()  # one transaction at a time
+        self._learners: Dict[str, tuple] = {}
+        self._mastered: Dict[str, List[str]] = {}
+        self._achievements: Dict[str, List[tuple]] = {}
+        self._events: List[tuple] = []
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        connection = self._connection()
+        for table, migrations in (('learners', LEARNER_MIGRATIONS), ('quiz_events', QUIZ_EVENT_MIGRATIONS)):
+            existing = {column for _, column, *_ in connection.execute(f"PRAGMA table_info({table})")}
+            if existing:
+                for column, declaration in migrations:
+                    if column not in existing:
+                        connection.execute(f"ALTER TABLE {table} ADD COLUMN {column} {declaration}")
+        connection.executescript(SCHEMA)
+
+        self._closed = threading.Event()
+        self._flusher = threading.Thread(target=self._run, name='progress-store-flush', daemon=True)
+        self._flusher.start()
+        atexit.register(self.close)
+
+    def _connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=30)
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute('PRAGMA synchronous=NORMAL')  # WAL keeps this crash-safe
+            self._local.connection = connection
+        return connection
+
+    # Staging: in-memory only, latest state wins
+
+    def save_learner(
+        self,
+        learner_id: str,
+        profile: dict,
+        quiz: dict,
+        engagement: dict,
+        theta: float,
+        answers: int,
+        terms_mastered: int = 0,
+        accuracy: float = 0.0,
+        knowledge_value: int = 0,
+    ) -> None:
+        row = (
+            learner_id, json.dumps(profile, default=str), json.dumps(quiz, default=str),
+            json.dumps(engagement, default=str), theta, answers, time.time(),
+            terms_mastered, accuracy, knowledge_value,
+        )
+        with self._lock:
+            self._learners[learner_id] = row
+
+    def save_mastered(self, learner_id: str, names: Iterable[str]) -> None:
+        names = list(names)
+        with self._lock:
+            self._mastered[learner_id] = names
+
+    def save_achievements(self, learner_id: str, history: Iterable[dict]) -> None:
+        rows = [(learner_id, entry['key'], entry['name'], entry['unlocked_at'].isoformat()) for entry in history]
+        with self._lock:
+            self._achievements[learner_id] = rows
+
+    def answer_sink(self, learner_id: str) -> Sink:
+        """Sink for an AnswerLog that stages its batches as quiz_events rows"""
+        def stage(batch: Batch) -> None:
+            rows = [
+                (learner_id, term, mode, correct, latency_ms, answered_at, options, grade)
+                for term, mode, correct, latency_ms, answered_at, options, grade in zip(
+                    batch['term'], batch['mode'], batch['correct'],
+                    batch['latency_ms'], batch['answered_at'], batch['options'], batch['grade'],
+                )
+            ]
+            with self._lock:
+                self._events.extend(rows)
+        return stage
+
+    # Committing
+
+    def flush(self) -> None:
+        """Commit everything staged so far in one transaction"""
+        with self._flush_lock:
+            with self._lock:
+                learners, self._learners = self._learners, {}
+                mastered, self._mastered = self._mastered, {}
+                achievements, self._achievements = self._achievements, {}
+                events, self._events = self._events, []
+            if not (learners or mastered or achievements or events):
+                return
+            try:
+                with self._connection() as connection:
+                    connection.executemany(
+                        f"INSERT INTO learners ({', '.join(LEARNER_COLUMNS)}) "
+                        f"VALUES ({', '.join('?' * len(LEARNER_COLUMNS))}) ON CONFLICT (learner_id) DO UPDATE SET "
+                        + ', '.join(f"{column} = excluded.{column}" for column in LEARNER_COLUMNS[1:]),
+                        learners.values(),
+                    )
+                    for learner_id, names in mastered.items():
+                        connection.execute("DELETE FROM mastered_terms WHERE learner_id = ?", (learner_id,))
+                        connection.executemany(
+                            "INSERT INTO mastered_terms VALUES (?, ?)", ((learner_id, name) for name in names)
+                        )
+                    for rows in achievements.values():
+                        connection.executemany("INSERT OR IGNORE INTO achievements VALUES (?, ?, ?, ?)", rows)
+                    connection.executemany(
+                        "INSERT INTO quiz_events (learner_id, term, mode, correct, latency_ms, answered_at, options, grade) "
+                        "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                        events,
+                    )
+            except sqlite3.Error:
+                # Put it back behind anything staged meanwhile, which is newer
+                with self._lock:
+                    for staged, failed in ((self._learners, learners), (self._mastered, mastered), (self._achievements, achievements)):
+                        for learner_id, value in failed.items():
+                            staged.setdefault(learner_id, value)
+                    self._events[:0] = events
+                raise
+
+    def _run(self) -> None:
+        while not self._closed.wait(self.flush_interval):
+            try:
+                self.flush()
+            except sqlite3.Error:
+                pass  # kept staged; retried on the next tick
+
+    def close(self) -> None:
+        self._closed.set()
+        self.flush()
+
+    # Loading
+
+    def leaderboard_rows(self, since: Optional[float] = None) -> List[Tuple[str, int, float, int, float]]:
+        """(learner_id, terms_mastered, accuracy, knowledge_value, updated_at) rows, optionally only those saved after ``since``"""
+        query = "SELECT learner_id, terms_mastered, accuracy, knowledge_value, updated_at FROM learners"
+        if since is None:
+            return self._connection().execute(query).fetchall()
+        return self._connection().execute(query + " WHERE updated_at > ?", (since,)).fetchall()
+
+    def load(self, learner_id: str) -> Optional[LearnerState]:
+        """A returning learner's saved state, or None if they have never been saved"""
+        self.flush()  # a reload right after a click must see that click
+        connection = self._connection()
+        row = connection.execute(
+            "SELECT profile, quiz, engagement, theta, answers FROM learners WHERE learner_id = ?", (learner_id,)
+        ).fetchone()
+        if row is None:
+            return None
+        profile, quiz, engagement, theta, answers = row
+        mastered = [name for name, in connection.execute(
+            "SELECT term FROM mastered_terms WHERE learner_id = ?", (learner_id,)
+        )]
+        achievements = [
+            {'key': key, 'name': name, 'unlocked_at': datetime.fromisoformat(unlocked_at)}
+            for key, name, unlocked_at in connection.execute(
+                "SELECT key, name, unlocked_at FROM achievements WHERE learner_id = ? ORDER BY unlocked_at", (learner_id,)
+            )
+        ]
+        reviews = [
+            (term, grade if grade is not None else GRADE_CORRECT if correct else GRADE_WRONG, answered_at)
+            for term, correct, grade, answered_at in connection.execute(
+                "SELECT term, correct, grade, answered_at FROM quiz_events WHERE learner_id = ? ORDER BY id", (learner_id,)
+            )
+        ]
+        return LearnerState(
+            json.loads(profile), json.loads(quiz), json.loads(engagement),
+            theta, answers, mastered, achievements, reviews,
+        )
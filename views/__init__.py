@@ -0,0 +1,70 @@
+"""Page modules for the CryptoLearn Pro app, imported on first visit.
+
+Each page lives in its own module with a ``render(ctx)`` function, so a run
+only loads the page being shown, and heavy chart libraries are imported only
+by the pages that draw charts. (Deliberately not named ``pages/``: Streamlit
+would turn that directory into its own multipage navigation.)
+"""
+
+import importlib
+from typing import Callable, Optional
+
+from cryptolearn.autocomplete import Autocomplete
+from cryptolearn.catalog import TermCatalog, TermRecord
+from cryptolearn.progress import LearnedSet
+from cryptolearn.related import RelatedTerms
+
+# Sidebar label -> module in this package, in navigation order
+PAGES = {
+    "🏠 Learning Dashboard": "dashboard",
+    "🔍 Term Explorer": "explorer",
+    "🎯 Personalized Learning": "personalized",
+    "📊 Market + Education": "market",
+    "🧠 Adaptive Quiz System": "quiz",
+    "💡 Discovery & Insights": "discovery",
+    "🏆 Achievements & Progress": "achievements",
+    "💰 Earning Opportunities": "earning",
+}
+
+
+class PageContext:
+    """Everything a page reads from the app shell for the current run"""
+
+    def __init__(
+        self,
+        catalog: TermCatalog,
+        learned_terms: LearnedSet,
+        autocomplete: Autocomplete,
+        related_terms: RelatedTerms,
+        resolve_term: Callable[[str], Optional[TermRecord]],
+        mastery_stats: dict,
+        recommendations: list,
+        level: str,
+        on_progress: Callable[[], None] = lambda: None,
+    ):
+        self.catalog = catalog
+        self.all_terms = catalog.terms
+        self.learned_terms = learned_terms
+        self.autocomplete = autocomplete
+        self.related_terms = related_terms
+        self.resolve_term = resolve_term
+        self.mastery_stats = mastery_stats
+        self.overall_score = mastery_stats['overall_score']
+        self.recommendations = recommendations
+        self.level = level
+        self._on_progress = on_progress
+
+    def progress_changed(self) -> None:
+        """Tell the shell that session progress changed during a fragment rerun.
+
+        Mastery stats are memoised on the learned set's version and pick the
+        change up on their own; this runs what must not wait for the next
+        full run, such as announcing newly unlocked achievements.
+        """
+        self._on_progress()
+
+
+def render_page(label: str, ctx: PageContext) -> None:
+    """Import the page's module (once per process) and render it"""
+    module = importlib.import_module(f"{__name__}.{PAGES[label]}")
+    module.render(ctx)
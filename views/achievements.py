@@ -0,0 +1,148 @@
+"""Achievements & Progress: unlocks, progress analytics and leaderboard"""
+
+import time
+from datetime import datetime, timedelta
+
+import streamlit as st
+import pandas as pd
+import plotly.express as px
+
+from views import PageContext
+from views.resources import get_leaderboard
+
+
+def render(ctx: PageContext):
+    catalog = ctx.catalog
+    learned_terms = ctx.learned_terms
+
+    st.header("🏆 Achievements & Progress Tracking")
+
+    tracker = st.session_state.achievements
+    achievements = tracker.achievements
+
+    # Display achievements grid
+    st.subheader("🏆 Your Achievement Collection")
+
+    unlocked_count = len(tracker.unlocked)
+    st.progress(unlocked_count / len(achievements))
+    st.caption(f"Progress: {unlocked_count}/{len(achievements)} achievements unlocked")
+
+    cols = st.columns(3)
+    for i, achievement in enumerate(achievements):
+        with cols[i % 3]:
+            unlocked_at = tracker.unlocked_at(achievement.key)
+
+            if unlocked_at is not None:
+                st.markdown(f"""
+                <div class="achievement-badge">
+                    {achievement.icon} <strong>{achievement.name}</strong><br>
+                    {achievement.description}<br>
+                    <small>🎁 {achievement.reward}</small><br>
+                    <small>🗓️ Unlocked {unlocked_at:%b %d, %H:%M}</small>
+                </div>
+                """, unsafe_allow_html=True)
+            else:
+                st.markdown(f"""
+                <div style="background: #f8f9fa; border: 2px dashed #dee2e6; padding: 1rem; border-radius: 10px; text-align: center; margin: 0.5rem 0; opacity: 0.6;">
+                    🔒 <strong>{achievement.name}</strong><br>
+                    <small>{achievement.description}</small><br>
+                    <small>🎁 {achievement.reward}</small>
+                </div>
+                """, unsafe_allow_html=True)
+
+    # Detailed progress tracking
+    st.subheader("📊 Detailed Progress Analytics")
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        # Learning velocity chart
+        if len(learned_terms) > 0:
+            # Simulate learning dates (in real app, this would be stored)
+            dates = []
+            cumulative_learned = []
+
+            for i in range(len(learned_terms)):
+                dates.append(datetime.now() - timedelta(days=len(learned_terms)-i))
+                cumulative_learned.append(i + 1)
+
+            fig = px.line(
+                x=dates,
+                y=cumulative_learned,
+                title="Learning Velocity Over Time",
+                labels={'x': 'Date', 'y': 'Cumulative Terms Learned'}
+            )
+            st.plotly_chart(fig, use_container_width=True)
+
+        # Category mastery breakdown
+        st.markdown("#### 📂 Category Mastery Levels")
+        for category_name in catalog.category_keys():
+            learned_in_category = learned_terms.category_count(category_name)
+            total_in_category = len(catalog.category_ids(category_name))
+            percentage = (learned_in_category / total_in_category) * 100
+
+            st.progress(percentage / 100)
+            st.caption(f"{category_name.replace('_', ' ').title()}: {learned_in_category}/{total_in_category} ({percentage:.1f}%)")
+
+    with col2:
+        # Knowledge value accumulation
+        total_value = 0
+        category_values = {}
+
+        for category_name in catalog.category_keys():
+            terms = catalog.in_category(category_name)
+            category_value = 0
+            for term in terms:
+                if term in learned_terms:
+                    category_value += term.knowledge_value
+                    total_value += term.knowledge_value
+
+            if category_value > 0:
+                category_values[category_name.replace('_', ' ').title()] = category_value
+
+        if category_values:
+            fig = px.pie(
+                values=list(category_values.values()),
+                names=list(category_values.keys()),
+                title=f"Knowledge Value Distribution (${total_value:,} total)"
+            )
+            st.plotly_chart(fig, use_container_width=True)
+
+        # Next milestones
+        st.markdown("#### 🎯 Next Milestones")
+
+        next_achievements = [a for a in achievements if not tracker.is_unlocked(a.key)][:3]
+        for achievement in next_achievements:
+            st.info(f"{achievement.icon} **{achievement.name}** - {achievement.description}")
+
+        if tracker.history:
+            st.markdown("#### 🗓️ Unlock History")
+            for entry in reversed(tracker.history[-5:]):
+                st.caption(f"{entry['unlocked_at']:%b %d, %H:%M} — {entry['name']}")
+
+    # Community leaderboard: the shared top-of-board snapshot plus this learner's live rank
+    st.subheader("🏅 Community Leaderboard")
+
+    leaderboard = get_leaderboard()
+    snapshot = leaderboard.snapshot()
+    learner_id = st.session_state.learner_id
+    standings = list(snapshot.top)
+    you = leaderboard.standing(learner_id)
+    if you is not None and all(standing.learner_id != learner_id for standing in standings):
+        standings.append(you)
+
+    leaderboard_data = [
+        {
+            "Rank": standing.rank,
+            "User": "You" if standing.learner_id == learner_id else f"Learner {standing.learner_id[:6]}",
+            "Terms": standing.terms,
+            "Accuracy": f"{standing.accuracy * 100:.0f}%",
+            "Value": f"${standing.knowledge_value:,}",
+        }
+        for standing in standings
+    ]
+
+    df_leaderboard = pd.DataFrame(leaderboard_data)
+    st.dataframe(df_leaderboard, use_container_width=True, hide_index=True)
+    if you is not None:
+        st.caption(f"You're #{you.rank:,} of {len(leaderboard):,} learners · board refreshed {int(time.time() - snapshot.taken_at)} s ago")
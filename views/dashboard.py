@@ -0,0 +1,166 @@
+"""Learning Dashboard: earning potential, live market snapshot and recommendations"""
+
+import streamlit as st
+
+from views import PageContext
+from views.resources import get_market_data, market_data_age
+
+
+def render(ctx: PageContext):
+    all_terms = ctx.all_terms
+    learned_terms = ctx.learned_terms
+    resolve_term = ctx.resolve_term
+    recommendations = ctx.recommendations
+    level = ctx.level
+    overall_score = ctx.overall_score
+
+    # Value proposition section
+    col1, col2, col3 = st.columns(3)
+
+    with col1:
+        st.markdown("""
+        <div class="value-prop-card">
+            <h3>💰 Learn & Earn</h3>
+            <h2>$2,847</h2>
+            <p>Average additional income potential from DeFi knowledge</p>
+        </div>
+        """, unsafe_allow_html=True)
+
+    with col2:
+        st.markdown("""
+        <div class="value-prop-card">
+            <h3>🎯 Personalized</h3>
+            <h2>AI-Driven</h2>
+            <p>Adaptive learning paths based on your goals and progress</p>
+        </div>
+        """, unsafe_allow_html=True)
+
+    with col3:
+        st.markdown("""
+        <div class="value-prop-card">
+            <h3>📊 Real-Time</h3>
+            <h2>Live Data</h2>
+            <p>Market data integrated with learning for practical application</p>
+        </div>
+        """, unsafe_allow_html=True)
+
+    # Quick stats
+    st.subheader("📈 Your Learning Impact")
+
+    col1, col2, col3, col4 = st.columns(4)
+
+    with col1:
+        st.metric(
+            "Terms Mastered", 
+            f"{len(learned_terms)}/{len(all_terms)}", 
+            f"+{len(learned_terms) - st.session_state.get('last_learned_count', 0)}"
+        )
+
+    with col2:
+        quiz_accuracy = 0
+        if st.session_state.quiz_system['total_attempts'] > 0:
+            quiz_accuracy = (st.session_state.quiz_system['score'] / st.session_state.quiz_system['total_attempts']) * 100
+
+        st.metric(
+            "Quiz Accuracy",
+            f"{quiz_accuracy:.1f}%",
+            f"🔥 {st.session_state.quiz_system['streak']} streak"
+        )
+
+    with col3:
+        earning_potential = len(learned_terms) * 150  # Estimated earning potential per term
+        st.metric(
+            "Earning Potential",
+            f"${earning_potential:,}",
+            "Based on mastered skills"
+        )
+
+    with col4:
+        st.metric(
+            "Learning Level",
+            level.split()[0],
+            f"{overall_score:.1f}% mastery"
+        )
+
+    # Personalized recommendations
+    st.subheader("🎯 AI-Powered Recommendations for You")
+
+    if recommendations:
+        for i, rec in enumerate(recommendations):
+            term = rec['term']
+
+            with st.expander(f"🚨 Priority: Learn '{term.name}' - {rec['reason']}", expanded=i==0):
+                col1, col2 = st.columns([2, 1])
+
+                with col1:
+                    st.markdown(f"""
+                    **📖 Definition:** {term.definition}
+
+                    **💡 Real-World Value:** {term.real_world_value}
+
+                    **💰 Earning Potential:** {term.earnings_potential}
+
+                    **🎯 Example:** {term.example}
+                    """)
+
+                with col2:
+                    if st.button(f"✅ Master This Term", key=f"rec_{i}"):
+                        st.session_state.learning_progress['terms_learned'].add(term)
+                        st.balloons()
+                        st.success(f"🎉 Mastered '{term.name}'! Earning potential increased!")
+                        st.rerun()
+
+                    if st.button(f"🎯 Quiz Me", key=f"quiz_rec_{i}"):
+                        from views.quiz import set_question  # loads the quiz page only when asked
+                        set_question(term)
+                        st.info("Quiz ready! Go to Adaptive Quiz System.")
+    else:
+        st.success("🎉 Amazing! You've mastered all critical terms. You're ready for advanced strategies!")
+
+    # Recent market movements with learning opportunities
+    st.subheader("📊 Market Movements + Learning Opportunities")
+
+    snapshot = get_market_data()
+    market_data = snapshot.coins if snapshot is not None else None
+
+    if market_data:
+        st.caption(market_data_age(snapshot))
+        for coin in market_data[:3]:
+            price_change_24h = coin.get('price_change_percentage_24h', 0)
+
+            col1, col2, col3 = st.columns([1, 2, 1])
+
+            with col1:
+                st.markdown(f"""
+                <div class="market-card">
+                    <h3>{coin['name']}</h3>
+                    <h2>${coin['current_price']:,.2f}</h2>
+                    <p style="color: {'green' if price_change_24h > 0 else 'red'}">
+                        {price_change_24h:+.2f}% (24h)
+                    </p>
+                </div>
+                """, unsafe_allow_html=True)
+
+            with col2:
+                if 'lesson' in coin:
+                    st.info(f"💡 **Learning Opportunity:** {coin['lesson']} - {coin['learning_focus']}")
+
+                # Suggest relevant terms to learn
+                if price_change_24h > 10:
+                    st.success("🚀 Big pump! Perfect time to learn: 'To the Moon', 'FOMO', 'Diamond Hands'")
+                elif price_change_24h < -10:
+                    st.warning("📉 Correction happening. Learn about: 'FUD', 'HODL', 'Dollar Cost Averaging'")
+
+            with col3:
+                if st.button(f"Learn about {coin['name']}", key=f"learn_{coin['id']}"):
+                    # Find related terms
+                    if coin['id'] == 'bitcoin':
+                        suggested_terms = ['HODL', 'Digital Gold', 'Store of Value']
+                    elif coin['id'] == 'ethereum':
+                        suggested_terms = ['Smart Contract', 'DeFi', 'Gas Fees']
+                    else:
+                        suggested_terms = ['Market Cap', 'Trading', 'Volatility']
+
+                    # Link suggestions to catalog spellings where we have the term
+                    suggested_terms = [getattr(resolve_term(name), 'name', name) for name in suggested_terms]
+                    st.info(f"💡 Study these terms: {', '.join(suggested_terms)}")
@@ -0,0 +1,273 @@
+"""Discovery & Insights: term discovery, learning patterns and trend links"""
+
+import random
+
+import streamlit as st
+import plotly.express as px
+
+from cryptolearn.catalog import Difficulty, EarningsTier, Importance
+from views import PageContext
+from views.resources import get_market_data
+
+
+def render(ctx: PageContext):
+    catalog = ctx.catalog
+    all_terms = ctx.all_terms
+    learned_terms = ctx.learned_terms
+    related_terms = ctx.related_terms
+
+    st.header("💡 Discovery & Deep Insights")
+
+    # Advanced discovery modes
+    col1, col2, col3 = st.columns(3)
+
+    with col1:
+        if st.button("🧠 AI Discovery", type="primary", use_container_width=True):
+            # AI-powered term discovery based on user profile
+            unlearned = [t for t in all_terms if t not in learned_terms]
+
+            if unlearned:
+                # Score terms by relevance to user goals
+                user_goal = st.session_state.user_profile.get('learning_goals', [''])[0]
+
+                scored_terms = []
+                for term in unlearned:
+                    score = 0
+
+                    # Goal alignment scoring
+                    if 'DeFi' in user_goal and term.category == 'DeFi':
+                        score += 3
+                    elif 'Trading' in user_goal and term.category == 'Trading':
+                        score += 3
+                    elif 'Memecoin' in user_goal and term.category == 'Memecoin Culture':
+                        score += 3
+
+                    # Importance scoring
+                    if term.importance == Importance.CRITICAL:
+                        score += 2
+                    elif term.importance == Importance.HIGH:
+                        score += 1
+
+                    # Earning potential scoring
+                    if term.earnings_tier == EarningsTier.VERY_HIGH:
+                        score += 2
+                    elif term.earnings_tier == EarningsTier.HIGH:
+                        score += 1
+
+                    scored_terms.append((term, score))
+
+                # Select highest scoring term
+                if scored_terms:
+                    best_term = max(scored_terms, key=lambda x: x[1])[0]
+                    st.session_state.discovery_term = best_term
+                    st.session_state.discovery_type = "🧠 AI Recommendation"
+            else:
+                st.success("🎉 You've discovered all available terms!")
+
+    with col2:
+        if st.button("💎 Hidden Gems", use_container_width=True):
+            # Find lesser-known but valuable terms
+            hidden_gems = [
+                t for t in catalog.select(
+                    difficulty=[Difficulty.INTERMEDIATE, Difficulty.ADVANCED],
+                    earnings_tier=[EarningsTier.HIGH, EarningsTier.VERY_HIGH]
+                )
+                if t not in learned_terms
+            ]
+
+            if hidden_gems:
+                gem = random.choice(hidden_gems)
+                st.session_state.discovery_term = gem
+                st.session_state.discovery_type = "💎 Hidden Gem"
+            else:
+                st.info("No hidden gems available - you're well on your way!")
+
+    with col3:
+        if st.button("🔥 Trending Now", use_container_width=True):
+            # Terms related to current market conditions
+            snapshot = get_market_data()
+
+            if snapshot is not None and snapshot.coins:
+                # Determine trending terms based on market conditions
+                avg_change = snapshot.average_change()
+
+                if avg_change > 5:
+                    trending_categories = ['memecoin_culture', 'trading_mastery']
+                    focus = "Bull market psychology"
+                elif avg_change < -5:
+                    trending_categories = ['trading_mastery', 'security_essentials']
+                    focus = "Bear market strategies"
+                else:
+                    trending_categories = ['defi_revolution', 'blockchain_fundamentals']
+                    focus = "Fundamental building"
+
+                trending_terms = catalog.select(category=trending_categories)
+
+                unlearned_trending = [t for t in trending_terms if t not in learned_terms]
+
+                if unlearned_trending:
+                    trending_term = random.choice(unlearned_trending)
+                    st.session_state.discovery_term = trending_term
+                    st.session_state.discovery_type = f"🔥 Trending: {focus}"
+
+    # Display discovered term
+    if hasattr(st.session_state, 'discovery_term') and st.session_state.discovery_term:
+        term = st.session_state.discovery_term
+        discovery_type = getattr(st.session_state, 'discovery_type', 'Discovery')
+
+        st.markdown(f"""
+        <div class="term-card">
+            <div style="background: linear-gradient(90deg, #667eea, #764ba2); color: white; padding: 1rem; border-radius: 10px; margin-bottom: 1rem;">
+                <h2>{discovery_type}</h2>
+                <h1>🎯 {term.name}</h1>
+            </div>
+
+            <div style="padding: 1rem;">
+                <h3>📖 Definition</h3>
+                <p style="font-size: 1.1rem; margin-bottom: 1rem;">{term.definition}</p>
+
+                <h3>💡 Real-World Example</h3>
+                <p style="font-style: italic; margin-bottom: 1rem;">{term.example}</p>
+
+                <div style="display: grid; grid-template-columns: 1fr 1fr; gap: 1rem; margin: 1rem 0;">
+                    <div>
+                        <h4>💰 Earning Potential</h4>
+                        <p>{term.earnings_potential}</p>
+                    </div>
+                    <div>
+                        <h4>🎯 Real-World Value</h4>
+                        <p>{term.real_world_value}</p>
+                    </div>
+                </div>
+
+                <div style="background: #f8f9fa; padding: 1rem; border-radius: 8px; margin: 1rem 0;">
+                    <strong>📂 Category:</strong> {term.category} | 
+                    <strong>⭐ Difficulty:</strong> {term.difficulty} | 
+                    <strong>🚨 Importance:</strong> {term.importance}
+                </div>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+
+        # Action buttons
+        col1, col2, col3, col4 = st.columns(4)
+
+        is_learned = term in learned_terms
+
+        with col1:
+            if not is_learned:
+                if st.button("✅ Master This Term", type="primary"):
+                    st.session_state.learning_progress['terms_learned'].add(term)
+
+                    # Calculate value added
+                    if term.importance == Importance.CRITICAL:
+                        value_added = "$500+"
+                        st.balloons()
+                    elif term.importance == Importance.HIGH:
+                        value_added = "$300+"
+                    else:
+                        value_added = "$150+"
+
+                    st.success(f"🎉 Mastered! Estimated knowledge value added: {value_added}")
+                    st.rerun()
+            else:
+                st.success("✅ Already Mastered!")
+
+        with col2:
+            if st.button("🎯 Quiz Me On This"):
+                from views.quiz import set_question  # loads the quiz page only when asked
+                set_question(term)
+                st.info("Quiz ready! Check the Adaptive Quiz System tab.")
+
+        with col3:
+            if st.button("🔄 Discover Another"):
+                # Follow the related-terms graph first, keeping to the same discovery type
+                neighbours = [
+                    t for t in related_terms.related(term)
+                    if t not in learned_terms and not ('Hidden' in discovery_type and t.difficulty == Difficulty.BEGINNER)
+                ]
+                if neighbours:
+                    st.session_state.discovery_term = neighbours[0]
+                    st.session_state.discovery_type = f"🔗 Related to {term.name}"
+                elif 'AI' in discovery_type:
+                    unlearned = [t for t in all_terms if t not in learned_terms]
+                    if unlearned:
+                        st.session_state.discovery_term = random.choice(unlearned)
+                elif 'Hidden' in discovery_type:
+                    hidden_gems = [
+                        t for t in catalog.select(difficulty=[Difficulty.INTERMEDIATE, Difficulty.ADVANCED])
+                        if t not in learned_terms
+                    ]
+                    if hidden_gems:
+                        st.session_state.discovery_term = random.choice(hidden_gems)
+                else:
+                    unlearned = [t for t in all_terms if t not in learned_terms]
+                    if unlearned:
+                        st.session_state.discovery_term = random.choice(unlearned)
+                st.rerun()
+
+        with col4:
+            # Share button (simulate social sharing)
+            if st.button("📤 Share Discovery"):
+                share_text = f"Just learned about '{term.name}' on CryptoLearn Pro! 💡 {term.real_world_value}"
+                st.info(f"📱 Share this: {share_text}")
+
+    # Advanced insights section
+    st.subheader("📊 Advanced Learning Insights")
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.markdown("#### 🎯 Your Learning Pattern Analysis")
+
+        # Analyze learning preferences
+        if len(learned_terms) > 0:
+            learned_categories = {}
+            for category_name in catalog.category_keys():
+                learned_in_category = learned_terms.category_count(category_name)
+                if learned_in_category > 0:
+                    learned_categories[category_name.replace('_', ' ').title()] = learned_in_category
+
+            if learned_categories:
+                fig = px.pie(
+                    values=list(learned_categories.values()),
+                    names=list(learned_categories.keys()),
+                    title="Your Learning Distribution"
+                )
+                st.plotly_chart(fig, use_container_width=True)
+        else:
+            st.info("Start learning terms to see your learning pattern analysis!")
+
+    with col2:
+        st.markdown("#### 💰 Earning Potential Analysis")
+
+        if len(learned_terms) > 0:
+            # Calculate potential earnings by category
+            earnings_potential = {}
+
+            for category_name in catalog.category_keys():
+                terms = catalog.in_category(category_name)
+                category_earnings = 0
+                learned_in_category = 0
+
+                for term in terms:
+                    if term in learned_terms:
+                        learned_in_category += 1
+                        category_earnings += term.knowledge_value
+
+                if learned_in_category > 0:
+                    earnings_potential[category_name.replace('_', ' ').title()] = category_earnings
+
+            if earnings_potential:
+                fig = px.bar(
+                    x=list(earnings_potential.keys()),
+                    y=list(earnings_potential.values()),
+                    title="Estimated Earning Potential by Category"
+                )
+                fig.update_layout(yaxis_title="Potential Value ($)")
+                st.plotly_chart(fig, use_container_width=True)
+
+                total_potential = sum(earnings_potential.values())
+                st.success(f"💰 **Total Knowledge Value:** ${total_potential:,}")
+        else:
+            st.info("Start mastering terms to see your earning potential!")
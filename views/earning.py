@@ -0,0 +1,207 @@
+"""Earning Opportunities: income paths unlocked by mastered terms"""
+
+import streamlit as st
+
+from views import PageContext
+
+
+def render(ctx: PageContext):
+    learned_terms = ctx.learned_terms
+    resolve_term = ctx.resolve_term
+
+    st.header("💰 Turn Your Crypto Knowledge Into Real Income")
+
+    # Income potential calculator
+    st.subheader("📊 Your Income Potential Calculator")
+
+    col1, col2, col3 = st.columns(3)
+
+    with col1:
+        knowledge_score = len(learned_terms) * 200  # Base knowledge value
+        st.metric("Knowledge Value", f"${knowledge_score:,}")
+
+    with col2:
+        # DeFi earning potential
+        defi_terms_learned = learned_terms.category_count('defi_revolution')
+        defi_potential = defi_terms_learned * 500  # $500 per DeFi term
+        st.metric("DeFi Earning Potential", f"${defi_potential:,}/year")
+
+    with col3:
+        # Trading potential
+        trading_terms_learned = learned_terms.category_count('trading_mastery')
+        trading_potential = trading_terms_learned * 300  # $300 per trading term
+        st.metric("Trading Improvement", f"${trading_potential:,}/year")
+
+    # Detailed earning opportunities
+    st.subheader("🎯 Specific Earning Opportunities Based on Your Knowledge")
+
+    opportunities = [
+        {
+            "title": "💰 DeFi Yield Farming",
+            "description": "Use your DeFi knowledge to earn 5-20% APY on crypto holdings",
+            "requirements": ["DeFi", "Yield Farming", "Impermanent Loss", "TVL"],
+            "potential": "$2,000-10,000/year",
+            "difficulty": "Intermediate",
+            "risk": "Medium"
+        },
+        {
+            "title": "📈 Crypto Trading",
+            "description": "Apply technical analysis and market psychology for active trading",
+            "requirements": ["HODL", "Support and Resistance", "Market Cap", "Dollar Cost Averaging"],
+            "potential": "$1,000-50,000/year",
+            "difficulty": "Advanced",
+            "risk": "High"
+        },
+        {
+            "title": "🐕 Memecoin Early Detection",
+            "description": "Use culture knowledge to identify promising memecoins early",
+            "requirements": ["Diamond Hands", "Rugpull", "To the Moon", "Ape In"],
+            "potential": "$500-100,000/year",
+            "difficulty": "Beginner",
+            "risk": "Very High"
+        },
+        {
+            "title": "🛡️ Crypto Security Consulting",
+            "description": "Help others secure their crypto assets and avoid scams",
+            "requirements": ["Private Key", "Hardware Wallet", "Seed Phrase"],
+            "potential": "$50-200/hour",
+            "difficulty": "Intermediate",
+            "risk": "Low"
+        },
+        {
+            "title": "🎓 Crypto Education",
+            "description": "Teach others and create educational content",
+            "requirements": ["Blockchain", "Smart Contract", "Gas Fees"],
+            "potential": "$30-150/hour",
+            "difficulty": "Beginner",
+            "risk": "Low"
+        }
+    ]
+
+    def is_requirement_known(requirement: str) -> bool:
+        found = resolve_term(requirement)
+        return found is not None and found in learned_terms
+
+    for opportunity in opportunities:
+        # Check if user has required knowledge
+        learned_requirements = sum(1 for req in opportunity['requirements'] if is_requirement_known(req))
+        total_requirements = len(opportunity['requirements'])
+        readiness = (learned_requirements / total_requirements) * 100
+
+        with st.expander(f"{opportunity['title']} - {readiness:.0f}% Ready"):
+            col1, col2 = st.columns([2, 1])
+
+            with col1:
+                st.markdown(f"""
+                **Description:** {opportunity['description']}
+
+                **Income Potential:** {opportunity['potential']}
+
+                **Required Knowledge:**
+                """)
+
+                for req in opportunity['requirements']:
+                    # Check if user knows this requirement
+                    is_known = is_requirement_known(req)
+                    status = "✅" if is_known else "❌"
+                    st.write(f"{status} {req}")
+
+                st.markdown(f"""
+                **Difficulty:** {opportunity['difficulty']} | **Risk Level:** {opportunity['risk']}
+                """)
+
+            with col2:
+                st.progress(readiness / 100)
+                st.caption(f"Readiness: {readiness:.0f}%")
+
+                if readiness >= 75:
+                    st.success("🚀 You're ready to start!")
+                    if st.button(f"Start {opportunity['title'].split()[1]}", key=f"start_{opportunity['title']}"):
+                        st.balloons()
+                        st.success("🎉 Opportunity unlocked! You have the knowledge to begin!")
+                elif readiness >= 50:
+                    st.warning("📚 Almost ready! Learn a few more terms.")
+                else:
+                    st.info("📖 Keep learning to unlock this opportunity.")
+
+    # Success stories and testimonials
+    st.subheader("🌟 Success Stories from CryptoLearn Pro Users")
+
+    testimonials = [
+        {
+            "name": "Sarah K.",
+            "achievement": "Earned $15,000 in DeFi yield farming",
+            "story": "After mastering DeFi concepts on CryptoLearn Pro, I started yield farming and now earn $1,200+ monthly passive income.",
+            "terms_learned": 28
+        },
+        {
+            "name": "Mike R.",
+            "achievement": "Avoided $50,000 rugpull",
+            "story": "Learning about rugpulls saved me from investing in a scam token. That knowledge literally saved my portfolio!",
+            "terms_learned": 15
+        },
+        {
+            "name": "Alex T.",
+            "achievement": "Started crypto consulting business",
+            "story": "My knowledge from CryptoLearn Pro helped me start a consulting business. Now earning $150/hour helping others with crypto security.",
+            "terms_learned": 35
+        }
+    ]
+
+    for testimonial in testimonials:
+        st.markdown(f"""
+        <div class="testimonial-card">
+            <h4>💬 {testimonial['name']} - {testimonial['achievement']}</h4>
+            <p>"{testimonial['story']}"</p>
+            <small>📚 Terms Mastered: {testimonial['terms_learned']}</small>
+        </div>
+        """, unsafe_allow_html=True)
+
+    # Action plan generator
+    st.subheader("🎯 Your Personal Income Action Plan")
+
+    if st.button("🚀 Generate My Action Plan", type="primary"):
+        # Generate personalized action plan based on user's current knowledge
+
+        user_strengths = []
+        if learned_terms.category_count('defi_revolution') >= 2:
+            user_strengths.append("DeFi Knowledge")
+        if learned_terms.category_count('trading_mastery') >= 2:
+            user_strengths.append("Trading Skills")
+        if learned_terms.category_count('security_essentials') >= 2:
+            user_strengths.append("Security Expertise")
+        if learned_terms.category_count('memecoin_culture') >= 3:
+            user_strengths.append("Memecoin Culture")
+
+        st.markdown(f"""
+        <div style="background: linear-gradient(135deg, #56ab2f 0%, #a8e6cf 100%); color: white; padding: 2rem; border-radius: 15px; margin: 1rem 0;">
+            <h3>🎯 Your Personalized 30-Day Income Action Plan</h3>
+
+            <h4>🚀 Your Current Strengths:</h4>
+            <ul>
+                {''.join([f'<li>{strength}</li>' for strength in user_strengths]) if user_strengths else '<li>Building foundational knowledge</li>'}
+            </ul>
+
+            <h4>📅 Week 1-2: Knowledge Acceleration</h4>
+            <ul>
+                <li>🎯 Master 5 high-value terms per week</li>
+                <li>📊 Focus on DeFi and Trading categories</li>
+                <li>🧠 Achieve 90%+ quiz accuracy</li>
+            </ul>
+
+            <h4>📅 Week 3-4: Practical Application</h4>
+            <ul>
+                <li>💰 Start with low-risk DeFi protocols (if ready)</li>
+                <li>📈 Practice trading strategies with small amounts</li>
+                <li>🛡️ Implement advanced security measures</li>
+            </ul>
+
+            <h4>🎯 Expected Outcomes:</h4>
+            <ul>
+                <li>💡 40+ terms mastered</li>
+                <li>💰 $500-2000 monthly income potential</li>
+                <li>🛡️ Portfolio protected from common mistakes</li>
+                <li>🚀 Ready for advanced opportunities</li>
+            </ul>
+        </div>
+        """, unsafe_allow_html=True)
@@ -0,0 +1,110 @@
+"""Term Explorer: ranked search with filters, suggestions and pagination"""
+
+import streamlit as st
+
+from views import PageContext
+from views.resources import get_search_index
+
+
+def render(ctx: PageContext):
+    catalog = ctx.catalog
+    learned_terms = ctx.learned_terms
+    autocomplete = ctx.autocomplete
+
+    st.header("🔍 Term Explorer")
+
+    search_index = get_search_index(catalog, catalog.version)
+
+    query = st.text_input(
+        "Search terms, definitions, examples and tags:",
+        placeholder="e.g. liquidity risk, private key, scam",
+        key="explorer_query"
+    )
+
+    # Suggestion box: prefix and typo-tolerant matches on names and tags
+    suggestions = autocomplete.suggest(query, limit=5)
+    exact = len(suggestions) == 1 and suggestions[0].label.lower() == query.strip().lower()
+    if suggestions and not exact:
+        def use_suggestion(label: str):
+            st.session_state.explorer_query = label
+
+        st.caption("💡 Did you mean:")
+        suggestion_cols = st.columns(len(suggestions))
+        for col, suggestion in zip(suggestion_cols, suggestions):
+            with col:
+                st.button(
+                    suggestion.label,
+                    key=f"explorer_suggest_{suggestion.term_id}",
+                    on_click=use_suggestion,
+                    args=(suggestion.label,),
+                    use_container_width=True
+                )
+
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        category_filter = st.multiselect(
+            "📂 Category",
+            [catalog.category_name(key) for key in catalog.category_keys()]
+        )
+    with col2:
+        difficulty_filter = st.multiselect("⭐ Difficulty", catalog.difficulties())
+    with col3:
+        importance_filter = st.multiselect("🚨 Importance", catalog.importance_levels())
+
+    # Start from the first page whenever the search itself changes
+    search_key = (query, tuple(category_filter), tuple(difficulty_filter), tuple(importance_filter))
+    if st.session_state.get('explorer_search_key') != search_key:
+        st.session_state.explorer_search_key = search_key
+        st.session_state.explorer_page = 1
+
+    results = search_index.search(
+        query,
+        page=st.session_state.explorer_page,
+        per_page=10,
+        category=category_filter or None,
+        difficulty=difficulty_filter or None,
+        importance=importance_filter or None
+    )
+
+    st.caption(f"📚 {results.total} matching terms • Page {results.page} of {results.pages}")
+
+    if not results.hits:
+        st.info("No terms match your search. Try fewer words or clear a filter.")
+
+    for hit in results.hits:
+        term = hit.term
+        is_learned = term in learned_terms
+
+        with st.expander(f"{'✅' if is_learned else '📖'} {term.name} • {term.category} • {term.difficulty}"):
+            col1, col2 = st.columns([3, 1])
+
+            with col1:
+                st.markdown(f"""
+                **📖 Definition:** {term.definition}
+
+                **🎯 Example:** {term.example}
+
+                **💡 Real-World Value:** {term.real_world_value}
+
+                **💰 Earning Potential:** {term.earnings_potential}
+                """)
+                st.caption(f"🏷️ {', '.join(term.tags)}")
+
+            with col2:
+                if is_learned:
+                    st.success("✅ Mastered")
+                elif st.button("✅ Master This Term", key=f"explorer_master_{hit.term_id}"):
+                    st.session_state.learning_progress['terms_learned'].add(term)
+                    st.success(f"🎉 Mastered '{term.name}'!")
+                    st.rerun()
+
+    if results.pages > 1:
+        col1, col2, col3 = st.columns([1, 2, 1])
+        with col1:
+            if st.button("⬅️ Previous", disabled=results.page <= 1, use_container_width=True):
+                st.session_state.explorer_page = results.page - 1
+                st.rerun()
+        with col3:
+            if st.button("Next ➡️", disabled=results.page >= results.pages, use_container_width=True):
+                st.session_state.explorer_page = results.page + 1
+                st.rerun()
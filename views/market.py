@@ -0,0 +1,170 @@
+"""Market + Education: live prices paired with the concepts behind them"""
+
+import numpy as np
+import pandas as pd
+import plotly.express as px
+import streamlit as st
+
+from views import PageContext
+from views.resources import get_market_data, get_market_trends, get_search_index, market_data_age
+
+# Daily volatility (%) above which a coin's week counts as wild
+HIGH_VOLATILITY = 5.0
+
+
+def render(ctx: PageContext):
+    catalog = ctx.catalog
+    learned_terms = ctx.learned_terms
+    related_terms = ctx.related_terms
+    resolve_term = ctx.resolve_term
+
+    st.header("📊 Live Market Data with Educational Context")
+
+    # Market overview with learning integration
+    snapshot = get_market_data()
+    market_data = snapshot.coins if snapshot is not None else None
+
+    if market_data:
+        st.subheader("💰 Top Cryptocurrencies + Learning Opportunities")
+        st.caption(market_data_age(snapshot))
+
+        # Market sentiment analysis, over every tracked coin
+        breadth = snapshot.breadth()
+        market_sentiment = "Bullish 🐂" if breadth >= 0.5 else "Bearish 🐻"
+
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("Market Sentiment", market_sentiment, help=f"{breadth:.0%} of the top {len(market_data)} coins are up over 24h")
+        with col2:
+            st.metric("Avg 24h Change", f"{snapshot.average_change():+.2f}%", help=f"Across the top {len(market_data)} coins")
+        with col3:
+            st.metric("Total Market Cap", f"${snapshot.total_market_cap() / 1e12:.2f}T", help=f"Across the top {len(market_data)} coins")
+
+        # Price history recorded locally from every poll: no extra API calls
+        trends = get_market_trends(snapshot, snapshot.fetched_at)
+        last_week, volatility = trends.last_week, trends.volatility
+
+        st.dataframe(
+            pd.DataFrame({
+                'Coin': [coin['name'] for coin in market_data],
+                'Price': snapshot.table['price'],
+                '24h Change': snapshot.table['change_24h'],
+                'Last 24h': trends.sparklines,
+                '7d Volatility': volatility,
+            }),
+            column_config={
+                'Price': st.column_config.NumberColumn(format="$%.2f"),
+                '24h Change': st.column_config.NumberColumn(format="%+.2f%%"),
+                'Last 24h': st.column_config.LineChartColumn(),
+                '7d Volatility': st.column_config.NumberColumn(format="%.2f%%", help="Daily volatility of hourly prices over the last week"),
+            },
+            use_container_width=True,
+            hide_index=True,
+        )
+        if np.isnan(volatility).all():
+            st.caption("📈 Sparklines and volatility fill in as prices are recorded each minute")
+
+        # Individual coin analysis with educational context
+        for i, coin in enumerate(market_data[:5]):
+            price_change = coin.get('price_change_percentage_24h', 0)
+
+            with st.expander(f"📈 {coin['name']} (${coin['current_price']:,.2f}) - {price_change:+.2f}%"):
+                col1, col2, col3 = st.columns([2, 2, 1])
+
+                with col1:
+                    st.markdown(f"""
+                    **Current Price:** ${coin['current_price']:,.2f}
+                    **Market Cap:** ${coin['market_cap']:,}
+                    **24h Volume:** ${coin['total_volume']:,}
+                    **7d Change:** {coin.get('price_change_percentage_7d_in_currency', 0):+.2f}%
+                    """)
+
+                with col2:
+                    # Educational context based on coin performance
+                    if price_change > 15:
+                        st.success("🚀 **Strong Pump!** Learn about: FOMO, To the Moon, Market Manipulation")
+                        educational_focus = "Study bubble psychology and risk management"
+                    elif price_change > 5:
+                        st.info("📈 **Steady Growth** Learn about: Technical Analysis, Support Levels")
+                        educational_focus = "Good time to study trend analysis"
+                    elif price_change < -15:
+                        st.error("📉 **Major Correction** Learn about: FUD, Diamond Hands, Dollar Cost Averaging")
+                        educational_focus = "Perfect time to understand bear market psychology"
+                    elif price_change < -5:
+                        st.warning("📊 **Minor Dip** Learn about: Buying the Dip, Volatility")
+                        educational_focus = "Study accumulation strategies"
+                    else:
+                        st.info("😴 **Sideways Action** Learn about: Consolidation, Range Trading")
+                        educational_focus = "Good time for fundamental analysis study"
+
+                    st.caption(f"💡 {educational_focus}")
+                    if volatility[i] > HIGH_VOLATILITY:
+                        st.caption(f"🌪️ Swinging {volatility[i]:.1f}% a day this week - study Volatility and Risk Management")
+
+                with col3:
+                    if 'lesson' in coin:
+                        if st.button(f"Learn {coin['lesson']}", key=f"learn_market_{coin['id']}"):
+                            # Best match for the coin's key concept, plus its closest neighbours
+                            concept_hits = get_search_index(catalog, catalog.version).search(coin['key_concept'], per_page=1).hits
+                            relevant_terms = []
+                            if concept_hits:
+                                anchor = concept_hits[0].term
+                                relevant_terms = [anchor.name] + [t.name for t in related_terms.related(anchor, 2)]
+
+                            if relevant_terms:
+                                st.info(f"💡 Study: {', '.join(relevant_terms[:3])}")
+
+        # A week of recorded prices, rebased so coins of any price share one axis
+        rebased = last_week.rebased()[:5]
+        if np.isfinite(rebased).sum(axis=1).max(initial=0) > 1:
+            st.subheader("📉 7-Day Price History")
+            fig = px.line(
+                pd.DataFrame({
+                    'Time': np.tile(pd.to_datetime(last_week.times, unit='s'), len(rebased)),
+                    'Change (%)': rebased.ravel(),
+                    'Coin': np.repeat([coin['name'] for coin in market_data[:5]], len(last_week.times)),
+                }).dropna(),
+                x='Time',
+                y='Change (%)',
+                color='Coin',
+                title="Price change since the start of the week",
+            )
+            st.plotly_chart(fig, use_container_width=True)
+            st.caption("💡 Steeper, choppier lines mean higher volatility - the risk side of every big gain")
+
+        # Market-based learning suggestions
+        st.subheader("🎯 Today's Market-Based Learning Plan")
+
+        if market_sentiment == "Bullish 🐂":
+            st.success("""
+            **🐂 Bull Market Learning Focus:**
+            - Study 'FOMO' and 'Bubble Psychology' to avoid overinvestment
+            - Learn 'Profit Taking' strategies 
+            - Understand 'Market Cycles' for better timing
+            """)
+            suggested_terms = ['FOMO', 'To the Moon', 'Market Cap']
+        else:
+            st.info("""
+            **🐻 Bear Market Learning Focus:**
+            - Master 'Dollar Cost Averaging' for accumulation
+            - Study 'Diamond Hands' psychology
+            - Learn about 'Fundamental Analysis' for long-term value
+            """)
+            suggested_terms = ['Diamond Hands', 'Dollar Cost Averaging', 'HODL']
+
+        # Quick learning buttons
+        col1, col2, col3 = st.columns(3)
+        for i, term_name in enumerate(suggested_terms):
+            # Find the term in our database
+            found_term = resolve_term(term_name)
+
+            with [col1, col2, col3][i]:
+                if found_term and st.button(f"📚 Learn '{term_name}'", key=f"market_learn_{i}"):
+                    if found_term not in learned_terms:
+                        st.session_state.learning_progress['terms_learned'].add(found_term)
+                        st.success(f"🎉 Mastered '{term_name}'!")
+                        st.rerun()
+                    else:
+                        st.info(f"✅ You already know '{term_name}'!")
+    else:
+        st.info("⏳ Live market data is on its way - check back in a moment.")
@@ -0,0 +1,126 @@
+"""Personalized Learning: goal-driven learning paths"""
+
+import streamlit as st
+
+from views import PageContext
+
+
+def render(ctx: PageContext):
+    catalog = ctx.catalog
+    learned_terms = ctx.learned_terms
+    mastery_stats = ctx.mastery_stats
+    overall_score = ctx.overall_score
+
+    st.header("🎯 Your Personalized Learning Journey")
+
+    # Learning path assessment
+    if not st.session_state.user_profile.get('learning_goals'):
+        st.subheader("🎨 Customize Your Learning Experience")
+
+        col1, col2 = st.columns(2)
+
+        with col1:
+            st.markdown("#### 🎯 What's Your Primary Goal?")
+            goal = st.selectbox(
+                "Choose your main objective:",
+                [
+                    "💰 Generate Passive Income through DeFi",
+                    "📈 Become a Profitable Trader", 
+                    "🏗️ Understand Blockchain Technology",
+                    "🐕 Master Memecoin Culture",
+                    "🛡️ Secure My Crypto Assets",
+                    "🚀 Build a Web3 Career"
+                ]
+            )
+
+        with col2:
+            st.markdown("#### ⭐ Current Experience Level?")
+            experience = st.selectbox(
+                "Be honest about your current level:",
+                [
+                    "🌱 Complete Beginner",
+                    "📚 Some Basic Knowledge", 
+                    "📊 Intermediate Understanding",
+                    "🎯 Advanced but Want to Fill Gaps",
+                    "🥇 Expert Looking for Latest Trends"
+                ]
+            )
+
+        if st.button("🚀 Create My Learning Path", type="primary"):
+            st.session_state.user_profile['learning_goals'] = [goal]
+            st.session_state.user_profile['experience_level'] = experience
+            st.success("🎉 Learning path created! Refresh to see your personalized curriculum.")
+            st.rerun()
+
+    else:
+        # Show personalized curriculum
+        user_goal = st.session_state.user_profile['learning_goals'][0]
+        user_level = st.session_state.user_profile['experience_level']
+
+        st.markdown(f"""
+        <div class="learning-path-card">
+            <h2>🎯 Your Learning Path: {user_goal}</h2>
+            <p><strong>Experience Level:</strong> {user_level}</p>
+            <p><strong>Progress:</strong> {overall_score:.1f}% Complete</p>
+        </div>
+        """, unsafe_allow_html=True)
+
+        # Generate curriculum based on goals
+        if "DeFi" in user_goal:
+            curriculum = ["DeFi", "Trading", "Security", "Blockchain"]
+            focus_message = "Master DeFi to unlock passive income opportunities worth $1000s annually"
+        elif "Trading" in user_goal:
+            curriculum = ["Trading", "Memecoin Culture", "Blockchain", "DeFi"]
+            focus_message = "Develop trading skills that could generate 20%+ annual returns"
+        elif "Blockchain" in user_goal:
+            curriculum = ["Blockchain", "Security", "DeFi", "Trading"]
+            focus_message = "Build fundamental knowledge for Web3 career opportunities"
+        elif "Memecoin" in user_goal:
+            curriculum = ["Memecoin Culture", "Trading", "Security", "DeFi"]
+            focus_message = "Understand memecoin dynamics to spot 100x opportunities early"
+        elif "Secure" in user_goal:
+            curriculum = ["Security", "Blockchain", "DeFi", "Trading"]
+            focus_message = "Protect your crypto assets from the $3B+ lost annually to hacks"
+        else:
+            curriculum = ["Blockchain", "DeFi", "Trading", "Security"]
+            focus_message = "Build comprehensive Web3 knowledge for career advancement"
+
+        st.info(f"💡 **Focus:** {focus_message}")
+
+        # Show curriculum with progress
+        for i, category in enumerate(curriculum):
+            category_score = mastery_stats['category_scores'].get(catalog.category_key(category), 0)
+            category_terms = catalog.in_category(category)
+
+            with st.expander(f"📚 Module {i+1}: {category} ({category_score:.1f}% Complete)", expanded=i==0):
+                col1, col2 = st.columns([3, 1])
+
+                with col1:
+                    st.progress(category_score / 100)
+
+                    # Show next term to learn
+                    unlearned = [t for t in category_terms if t not in learned_terms]
+                    if unlearned:
+                        next_term = unlearned[0]
+                        st.markdown(f"""
+                        **🎯 Next to Master:** {next_term.name}
+
+                        **Definition:** {next_term.definition}
+
+                        **💰 Earning Potential:** {next_term.earnings_potential}
+                        """)
+
+                        if st.button(f"✅ Master '{next_term.name}'", key=f"master_{category}_{i}"):
+                            st.session_state.learning_progress['terms_learned'].add(next_term)
+                            st.success(f"🎉 Mastered! Your {category} knowledge increased!")
+                            st.rerun()
+                    else:
+                        st.success(f"🎉 {category} module completed! Moving to next level...")
+
+                with col2:
+                    completed = learned_terms.category_count(category)
+                    st.metric("Progress", f"{completed}/{len(category_terms)}")
+
+                    if category_score > 0:
+                        estimated_earning = int(category_score * 50)  # $50 per percentage point
+                        st.metric("Est. Value", f"${estimated_earning}")
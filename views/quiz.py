@@ -0,0 +1,505 @@
+"""Adaptive Quiz System: difficulty-aware multiple choice, true/false and fill-in-the-blank quiz, plus lightning rounds"""
+
+import random
+import time
+from typing import Optional, Sequence
+
+import numpy as np
+import streamlit as st
+import plotly.graph_objects as go
+
+from cryptolearn.catalog import EarningsTier, TermRecord
+from cryptolearn.history import MAX_OPTIONS
+from cryptolearn.lightning import LightningRound
+from cryptolearn.question_bank import CLOZE, TRUE_FALSE
+from cryptolearn.scheduler import DAY, GRADE_CORRECT, GRADE_HINTED, GRADE_WRONG
+from views import PageContext
+from views.resources import get_distractors, get_item_bank, get_question_bank
+
+FORMAT_LABELS = {TRUE_FALSE: "True/False", CLOZE: "Fill in the Blank"}
+
+
+def set_question(question: TermRecord, quiz_type: Optional[str] = None):
+    """Make ``question`` the next one asked, with freshly drawn options, format and timing"""
+    quiz = st.session_state.quiz_system
+    quiz['current_question'] = question
+    quiz['answered'] = False
+    quiz['hint_used'] = False
+    # Frozen per question, not per term: the same term can come up twice in a row
+    for key in ('choices', 'bank_question', 'asked_at'):
+        quiz.pop(key, None)
+    st.session_state.pop('adaptive_quiz_answer', None)
+    st.session_state.pop('lightning_round', None)
+    if quiz_type is not None:
+        st.session_state.quiz_type = quiz_type
+
+
+def _due_review(ctx: PageContext) -> Optional[TermRecord]:
+    """Most overdue term from the learner's review queue, if any is due"""
+    scheduler = st.session_state.scheduler
+    quiz = st.session_state.quiz_system
+    while True:
+        name = scheduler.peek_due()
+        if name is None:
+            return None
+        term = ctx.catalog.find(name)
+        if term is None:
+            scheduler.forget(name)  # dropped from the catalog
+            continue
+        current = quiz.get('current_question')
+        if current is not None and current.name == name and not quiz['answered']:
+            return None  # skipped just now; don't serve it straight back
+        return term
+
+
+def _start_adaptive_quiz(ctx: PageContext):
+    catalog = ctx.catalog
+    all_terms = ctx.all_terms
+    learned_terms = ctx.learned_terms
+
+    # Reviews that have fallen due come before anything new
+    due = _due_review(ctx)
+    if due is not None:
+        set_question(due, "🔁 Spaced Review")
+        return
+
+    # Pick the unlearned term the learner is most likely to get right about
+    # TARGET_SUCCESS of the time, given their current ability estimate
+    item_bank = get_item_bank(catalog, catalog.version)
+    term_id = item_bank.choose(st.session_state.ability.theta, learned_terms)
+    quiz_type = "🎯 Adaptive Challenge" if len(learned_terms) < len(all_terms) else "🔄 Mastery Review"
+    set_question(catalog.get(term_id), quiz_type)
+
+
+def _start_earning_quiz(ctx: PageContext):
+    # Focus on terms with highest earning potential
+    high_earning_terms = ctx.catalog.select(earnings_tier=[EarningsTier.CRITICAL, EarningsTier.VERY_HIGH])
+
+    if high_earning_terms:
+        unlearned_high_value = [t for t in high_earning_terms if t not in ctx.learned_terms]
+        question = random.choice(unlearned_high_value if unlearned_high_value else high_earning_terms)
+        set_question(question, "💰 Earning-Focused Quiz")
+
+
+def _start_memecoin_quiz(ctx: PageContext):
+    # Focus on memecoin culture
+    memecoin_terms = ctx.catalog.in_category('memecoin_culture')
+
+    if memecoin_terms:
+        set_question(random.choice(memecoin_terms), "🐕 Memecoin Culture Quiz")
+
+
+def _start_lightning_round(ctx: PageContext):
+    catalog = ctx.catalog
+    lightning = LightningRound.build(
+        get_item_bank(catalog, catalog.version),
+        get_distractors(catalog, catalog.version),
+        st.session_state.ability.theta,
+        ctx.learned_terms,
+    )
+    for key in [key for key in st.session_state if str(key).startswith('lightning_answer_')]:
+        del st.session_state[key]
+    st.session_state.quiz_system['current_question'] = None
+    st.session_state.lightning_round = lightning
+
+
+def _next_question(ctx: PageContext, quiz_type: str):
+    # Generate next question with same quiz type
+    if 'Earning-Focused' in quiz_type:
+        high_earning = ctx.catalog.select(earnings_tier=EarningsTier.VERY_HIGH)
+        next_question = random.choice(high_earning)
+    elif 'Memecoin' in quiz_type:
+        next_question = random.choice(ctx.catalog.in_category('memecoin_culture'))
+    else:
+        # Adaptive selection, due reviews first
+        next_question = _due_review(ctx)
+        if next_question is None:
+            item_bank = get_item_bank(ctx.catalog, ctx.catalog.version)
+            term_id = item_bank.choose(st.session_state.ability.theta, ctx.learned_terms)
+            next_question = ctx.catalog.get(term_id)
+
+    set_question(next_question)
+
+
+def _record_answer(
+    ctx: PageContext,
+    question: TermRecord,
+    mode: str,
+    correct: bool,
+    grade: int,
+    shown: Sequence[TermRecord] = (),
+):
+    term_id = ctx.catalog.id_of(question.name)
+    if term_id is None:
+        return  # the catalog was reloaded without this term
+    options = [ctx.catalog.id_of(option.name) for option in shown]
+    asked_at = st.session_state.quiz_system.get('asked_at') or time.time()
+    st.session_state.learning_progress['quiz_history'].append(
+        term_id,
+        mode,
+        correct,
+        latency=time.time() - asked_at,
+        options=[-1 if option is None else option for option in options],
+        grade=grade,
+    )
+
+
+def _apply_round(ctx: PageContext, lightning: LightningRound):
+    """Fold a scored lightning round into scores, reviews, ability and history in one pass"""
+    catalog = ctx.catalog
+    result = lightning.result
+    quiz = st.session_state.quiz_system
+    item_bank = get_item_bank(catalog, catalog.version)
+
+    term_ids = np.array([
+        -1 if catalog.id_of(question.term.name) is None else catalog.id_of(question.term.name)
+        for question in lightning.questions
+    ], dtype=np.int32)
+    options = np.full((len(lightning), MAX_OPTIONS), -1, dtype=np.int32)
+    for row, question in enumerate(lightning.questions):
+        shown = [catalog.id_of(option.name) for option in question.options][:MAX_OPTIONS]
+        options[row, :len(shown)] = [-1 if option is None else option for option in shown]
+
+    # Skipped questions only cost points; answered ones are learning evidence
+    # whether or not the round beat the clock
+    answered = result.answered & (term_ids >= 0)
+    for index in np.flatnonzero(answered).tolist():
+        question, correct = lightning.questions[index], bool(result.correct[index])
+        st.session_state.scheduler.review(question.term.name, GRADE_CORRECT if correct else GRADE_WRONG)
+        st.session_state.ability.update(item_bank.difficulty_of(question.term.name), correct)
+    if answered.any():
+        st.session_state.learning_progress['quiz_history'].extend(
+            term_ids[answered],
+            "⚡ Lightning Round",
+            result.correct[answered],
+            latency=np.full(int(answered.sum()), result.elapsed / len(lightning)),
+            options=options[answered],
+        )
+
+    if result.in_time:
+        quiz['score'] += result.score
+        quiz['total_attempts'] += len(lightning)
+        for correct in result.correct.tolist():
+            quiz['streak'] = quiz['streak'] + 1 if correct else 0
+            quiz['best_streak'] = max(quiz.get('best_streak', 0), quiz['streak'])
+        st.session_state.learning_progress['terms_learned'].update(
+            question.term for question, correct in zip(lightning.questions, result.correct.tolist()) if correct
+        )
+    ctx.progress_changed()
+
+
+def _render_lightning_round(ctx: PageContext, lightning: LightningRound):
+    st.markdown(f"""
+    <div class="quiz-card">
+        <h3>⚡ Lightning Round</h3>
+        <h2>{len(lightning)} questions · {lightning.time_limit:.0f} seconds</h2>
+        <p>Answer as many as you can, then submit once: the whole round is scored together.</p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    if lightning.result is None:
+        st.caption(f"⏱️ Finish by {time.strftime('%H:%M:%S', time.localtime(lightning.deadline))}")
+        # Inside a form, picking answers doesn't rerun anything; the only
+        # round trip is the final submit
+        with st.form("lightning_round_form"):
+            for index, question in enumerate(lightning.questions):
+                st.radio(
+                    f"**{index + 1}. {question.term.name}**",
+                    range(len(question.options)),
+                    format_func=lambda option, question=question: question.options[option].definition,
+                    index=None,
+                    key=f"lightning_answer_{index}",
+                )
+            submitted = st.form_submit_button("⚡ Submit Round", type="primary")
+        if submitted:
+            lightning.score([st.session_state.get(f"lightning_answer_{index}") for index in range(len(lightning))])
+            _apply_round(ctx, lightning)
+
+    result = lightning.result
+    if result is not None:
+        if result.in_time:
+            st.success(f"⚡ {result.score}/{len(lightning)} correct in {result.elapsed:.0f} seconds!")
+            if result.score == len(lightning):
+                st.balloons()
+        else:
+            st.warning(
+                f"⏱️ Time's up: submitted after {result.elapsed:.0f} of {lightning.time_limit:.0f} seconds. "
+                "Your answers were saved for review, but the round doesn't score."
+            )
+        for question, correct in zip(lightning.questions, result.correct.tolist()):
+            st.caption(f"{'✅' if correct else '❌'} **{question.term.name}**: {question.term.definition}")
+        st.button("⚡ Another Round", type="primary", on_click=_start_lightning_round, args=(ctx,))
+
+
+def _format_wait(seconds: float) -> str:
+    if seconds < 3600:
+        return f"{max(1, round(seconds / 60))} min"
+    if seconds < DAY:
+        return f"{round(seconds / 3600)} h"
+    return f"{round(seconds / DAY)} days"
+
+
+def render(ctx: PageContext):
+    st.header("🧠 AI-Powered Adaptive Quiz System")
+    _quiz_session(ctx)
+
+
+# Answering, hints and new questions rerun only this fragment, not the app
+# shell (CSS, header, sidebar). Progress it changes is pushed to the shell
+# through ctx.progress_changed(); the sidebar catches up on the next full run.
+@st.fragment
+def _quiz_session(ctx: PageContext):
+    catalog = ctx.catalog
+    learned_terms = ctx.learned_terms
+
+    # Quiz performance dashboard
+    col1, col2, col3, col4 = st.columns(4)
+
+    with col1:
+        st.metric(
+            "Quiz Score", 
+            f"{st.session_state.quiz_system['score']}/{st.session_state.quiz_system['total_attempts']}"
+        )
+
+    with col2:
+        accuracy = 0
+        if st.session_state.quiz_system['total_attempts'] > 0:
+            accuracy = (st.session_state.quiz_system['score'] / st.session_state.quiz_system['total_attempts']) * 100
+        st.metric("Accuracy", f"{accuracy:.1f}%")
+
+    with col3:
+        st.metric("Current Streak", st.session_state.quiz_system['streak'])
+
+    with col4:
+        est_knowledge_value = len(learned_terms) * 200  # $200 per mastered term
+        st.metric("Knowledge Value", f"${est_knowledge_value:,}")
+
+    # Adaptive quiz modes
+    st.subheader("🎯 Choose Your Challenge")
+
+    col1, col2, col3, col4 = st.columns(4)
+
+    with col1:
+        st.button("🧠 AI Adaptive Quiz", type="primary", use_container_width=True, on_click=_start_adaptive_quiz, args=(ctx,))
+
+    with col2:
+        st.button("💰 High-Earning Focus", use_container_width=True, on_click=_start_earning_quiz, args=(ctx,))
+
+    with col3:
+        st.button("🐕 Memecoin Mastery", use_container_width=True, on_click=_start_memecoin_quiz, args=(ctx,))
+
+    with col4:
+        st.button("⚡ Lightning Round", use_container_width=True, on_click=_start_lightning_round, args=(ctx,))
+
+    next_review = st.session_state.scheduler.next_review_at()
+    if next_review is not None:
+        wait = next_review - time.time()
+        if wait <= 0:
+            st.caption("🔁 Reviews are due: the AI Adaptive Quiz asks them first")
+        else:
+            st.caption(f"🔁 {len(st.session_state.scheduler)} terms in spaced review · next due in {_format_wait(wait)}")
+
+    # Display the lightning round or current question
+    lightning = st.session_state.get('lightning_round')
+    if lightning is not None:
+        _render_lightning_round(ctx, lightning)
+
+    elif st.session_state.quiz_system.get('current_question'):
+        question = st.session_state.quiz_system['current_question']
+        quiz_type = getattr(st.session_state, 'quiz_type', 'Standard Quiz')
+
+        # The format, options and any prebuilt question are drawn once per
+        # question and kept in the question state, so they stay put under
+        # the user's selection
+        choices = st.session_state.quiz_system.get('choices')
+        if choices is None or choices.term is not question:
+            choices = get_distractors(catalog, catalog.version).question(question)
+            question_bank = get_question_bank(catalog, catalog.version)
+            kind = random.choice((None,) + question_bank.kinds_for(question.name))
+            st.session_state.quiz_system['choices'] = choices
+            st.session_state.quiz_system['bank_question'] = (
+                None if kind is None else random.choice(question_bank.for_term(question.name, kind))
+            )
+            st.session_state.quiz_system['asked_at'] = time.time()
+            st.session_state.pop('adaptive_quiz_answer', None)
+        bank_question = st.session_state.quiz_system.get('bank_question')
+
+        if bank_question is None:
+            heading, statement = f"❓ What does '{question.name}' mean?", ""
+        elif bank_question.kind == TRUE_FALSE:
+            heading, statement = "✅ True or false?", bank_question.prompt
+        elif bank_question.source == 'example':
+            heading, statement = "✍️ Fill in the missing term", bank_question.prompt
+        else:
+            heading, statement = "✍️ Fill in the blank", bank_question.prompt
+
+        st.markdown(f"""
+        <div class="quiz-card">
+            <h3>{quiz_type}</h3>
+            <h2>{heading}</h2>
+            <p>{statement}</p>
+            <p><strong>💰 Earning Potential:</strong> {question.earnings_potential}</p>
+            <p><strong>🎯 Real-World Value:</strong> {question.real_world_value}</p>
+        </div>
+        """, unsafe_allow_html=True)
+
+        item_bank = get_item_bank(catalog, catalog.version)
+        predicted = st.session_state.ability.expected(item_bank.difficulty_of(question.name))
+        st.caption(f"📈 Predicted chance you get this right: {predicted:.0%}")
+
+        # Quiz interface
+        if bank_question is None:
+            user_answer = st.radio(
+                "Select the correct definition:",
+                range(len(choices.options)),
+                format_func=lambda index: choices.options[index].definition,
+                key="adaptive_quiz_answer",
+                disabled=st.session_state.quiz_system['answered']
+            )
+            correct_answer = question.definition
+        elif bank_question.kind == TRUE_FALSE:
+            user_answer = st.radio(
+                "Is this statement true?",
+                ["True", "False"],
+                index=None,
+                key="adaptive_quiz_answer",
+                horizontal=True,
+                disabled=st.session_state.quiz_system['answered']
+            )
+            correct_answer = f"{bank_question.answer.title()}. '{question.name}' means: {question.definition}"
+        else:
+            user_answer = st.text_input(
+                "Your answer:",
+                key="adaptive_quiz_answer",
+                disabled=st.session_state.quiz_system['answered']
+            )
+            correct_answer = f"{bank_question.answer}. '{question.name}' means: {question.definition}"
+
+        col1, col2, col3 = st.columns(3)
+
+        with col1:
+            submitted = st.button("✅ Submit Answer", disabled=st.session_state.quiz_system['answered'])
+            if submitted and (user_answer is None or not str(user_answer).strip()):
+                st.warning("✋ Pick or type an answer first.")
+            elif submitted:
+                st.session_state.quiz_system['answered'] = True
+                st.session_state.quiz_system['total_attempts'] += 1
+
+                if bank_question is None:
+                    correct = user_answer == choices.answer
+                else:
+                    correct = bank_question.check(user_answer or "")
+                if correct:
+                    grade = GRADE_HINTED if st.session_state.quiz_system.get('hint_used') else GRADE_CORRECT
+                else:
+                    grade = GRADE_WRONG
+                st.session_state.scheduler.review(question.name, grade)
+                st.session_state.ability.update(item_bank.difficulty_of(question.name), correct)
+                if bank_question is None:
+                    _record_answer(ctx, question, quiz_type, correct, grade, choices.options)
+                else:
+                    _record_answer(ctx, question, f"{quiz_type} ({FORMAT_LABELS[bank_question.kind]})", correct, grade)
+
+                if correct:
+                    st.session_state.quiz_system['score'] += 1
+                    st.session_state.quiz_system['streak'] += 1
+                    st.session_state.quiz_system['best_streak'] = max(
+                        st.session_state.quiz_system.get('best_streak', 0),
+                        st.session_state.quiz_system['streak'],
+                    )
+                    st.session_state.learning_progress['terms_learned'].add(question)
+
+                    st.success("🎉 Correct! Knowledge and earning potential increased!")
+
+                    # Bonus for high-value terms
+                    if question.earnings_tier >= EarningsTier.CRITICAL:
+                        st.balloons()
+                        st.success("💰 HIGH-VALUE TERM MASTERED! This knowledge can directly increase your income!")
+
+                    # Streak bonuses
+                    streak = st.session_state.quiz_system['streak']
+                    if streak == 5:
+                        st.success("🔥 5-question streak! You're on fire!")
+                    elif streak == 10:
+                        st.success("🚀 10-question streak! Expert level achieved!")
+                        st.balloons()
+
+                else:
+                    st.session_state.quiz_system['streak'] = 0
+                    st.error("❌ Not quite right. Keep learning!")
+
+                ctx.progress_changed()
+
+                # Show educational context
+                st.info(f"💡 **Correct Answer:** {correct_answer}")
+                st.info(f"🎯 **Example:** {question.example}")
+
+                # Show earning potential context
+                if question.earnings_tier in (EarningsTier.HIGH, EarningsTier.VERY_HIGH):
+                    st.success(f"💰 **Value:** Understanding '{question.name}' can help you: {question.real_world_value}")
+
+        with col2:
+            st.button("⏭️ Next Question", on_click=_next_question, args=(ctx, quiz_type))
+
+        with col3:
+            if st.button("💡 Get Hint"):
+                st.session_state.quiz_system['hint_used'] = True
+                # Provide contextual hints
+                hint_keywords = question.tags[:2]
+                st.info(f"💡 **Hint:** This term relates to: {', '.join(hint_keywords)}")
+
+                if question.category == 'Memecoin Culture':
+                    st.caption("🐕 Think about community behavior and psychology")
+                elif question.category == 'DeFi':
+                    st.caption("🏦 Consider decentralized financial services")
+                elif question.category == 'Trading':
+                    st.caption("📈 Think about market strategies and analysis")
+
+    else:
+        st.info("👆 Choose a quiz mode above to start learning and earning!")
+
+        # Show quiz statistics
+        if st.session_state.quiz_system['total_attempts'] > 0:
+            st.subheader("📊 Your Quiz Performance")
+
+            col1, col2 = st.columns(2)
+
+            with col1:
+                # Performance chart
+                accuracy_pct = (st.session_state.quiz_system['score'] / st.session_state.quiz_system['total_attempts']) * 100
+
+                fig = go.Figure(data=go.Bar(
+                    x=['Correct', 'Incorrect'],
+                    y=[st.session_state.quiz_system['score'], 
+                       st.session_state.quiz_system['total_attempts'] - st.session_state.quiz_system['score']],
+                    marker_color=['#28a745', '#dc3545']
+                ))
+                fig.update_layout(title="Quiz Performance", height=300)
+                st.plotly_chart(fig, use_container_width=True)
+
+            with col2:
+                history = st.session_state.learning_progress['quiz_history']
+                recent = history.accuracy(last=20)
+                recent_accuracy = "n/a" if recent is None else f"{recent * 100:.0f}%"
+                st.markdown(f"""
+                ### 🎯 Performance Insights
+
+                **Accuracy Rate:** {accuracy_pct:.1f}%
+                **Recent Accuracy (last 20):** {recent_accuracy}
+                **Best Streak:** {st.session_state.quiz_system.get('best_streak', 0)}
+                **Knowledge Value:** ${len(learned_terms) * 200:,}
+
+                ### 🚀 Next Level Goals
+                - **Target Accuracy:** 85%+
+                - **Streak Goal:** 15 questions
+                - **Terms to Master:** {max(0, 50 - len(learned_terms))} remaining
+                """)
+
+                # Per-term accuracy over the recorded answers
+                attempts, correct = history.term_stats()
+                missed = np.flatnonzero(attempts > correct)
+                if len(missed):
+                    worst = missed[np.argsort(correct[missed] / attempts[missed], kind='stable')][:3]
+                    st.markdown("#### 🔁 Terms to Revisit")
+                    for term_id in worst.tolist():
+                        st.caption(f"{catalog.get(term_id).name}: {correct[term_id]}/{attempts[term_id]} correct")
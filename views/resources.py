@@ -0,0 +1,183 @@
+"""Process-wide cached resources shared by the app shell and its pages"""
+
+import os
+from typing import List, NamedTuple, Optional, Tuple
+
+import numpy as np
+import streamlit as st
+
+from cryptolearn.ability import ItemBank, calibration_stamp
+from cryptolearn.autocomplete import Autocomplete
+from cryptolearn.catalog import TermCatalog
+from cryptolearn.catalog_store import CatalogStore
+from cryptolearn.distractors import DistractorPool
+from cryptolearn.leaderboard import Leaderboard
+from cryptolearn.market_client import COINGECKO_API, CircuitOpen, RateLimited
+from cryptolearn.market_history import DAY, HOUR, MarketHistory, PriceHistory
+from cryptolearn.market_poller import MarketPoller, MarketSnapshot
+from cryptolearn.market_providers import MarketProvider, fetch_top, provider_from_spec
+from cryptolearn.question_bank import QuestionBank, bank_path, compile_question_bank
+from cryptolearn.related import RelatedTerms
+from cryptolearn.search import SearchIndex
+from cryptolearn.store import ProgressStore
+
+
+# Comprehensive crypto education database, compiled from data/catalog/<locale>.json
+@st.cache_resource
+def get_catalog_store() -> CatalogStore:
+    """Process-wide catalog store; picks up catalog file edits without a restart"""
+    return CatalogStore()
+
+
+@st.cache_resource
+def get_progress_store() -> ProgressStore:
+    """Process-wide learner progress store, shared by all sessions"""
+    return ProgressStore()
+
+
+@st.cache_resource
+def get_leaderboard() -> Leaderboard:
+    """Process-wide ranking of all persisted learners, kept up to date incrementally"""
+    return Leaderboard.from_store(get_progress_store())
+
+
+@st.cache_resource(max_entries=4)
+def get_search_index(_catalog: TermCatalog, catalog_version: str) -> SearchIndex:
+    """Inverted index for the Term Explorer, rebuilt only when the catalog changes"""
+    return SearchIndex(_catalog)
+
+
+@st.cache_resource(max_entries=4)
+def get_autocomplete(_catalog: TermCatalog, catalog_version: str) -> Autocomplete:
+    """Typo-tolerant suggestion index, rebuilt only when the catalog changes"""
+    return Autocomplete(_catalog)
+
+
+@st.cache_resource(max_entries=4)
+def get_related_terms(_catalog: TermCatalog, catalog_version: str) -> RelatedTerms:
+    """Top-k similar terms for every term, rebuilt only when the catalog changes"""
+    return RelatedTerms(_catalog)
+
+
+@st.cache_resource(max_entries=4)
+def get_distractors(_catalog: TermCatalog, catalog_version: str) -> DistractorPool:
+    """Ranked wrong-answer pools for quiz questions, rebuilt only when the catalog changes"""
+    return DistractorPool(_catalog, get_related_terms(_catalog, catalog_version))
+
+
+@st.cache_resource(max_entries=4)
+def _get_item_bank(_catalog: TermCatalog, catalog_version: str, calibration: Tuple[float, int]) -> ItemBank:
+    return ItemBank(_catalog)
+
+
+def get_item_bank(catalog: TermCatalog, catalog_version: str) -> ItemBank:
+    """Calibrated term difficulties for adaptive question choice; reloaded when the calibration is refit"""
+    return _get_item_bank(catalog, catalog_version, calibration_stamp(catalog.locale))
+
+
+@st.cache_resource(max_entries=4)
+def get_question_bank(_catalog: TermCatalog, catalog_version: str) -> QuestionBank:
+    """Prebuilt true/false and cloze questions; compiled in-process if the saved bank is stale"""
+    bank = QuestionBank.load(bank_path(_catalog.locale), _catalog)
+    if bank is None:
+        bank = compile_question_bank(_catalog, get_distractors(_catalog, catalog_version))
+    return bank
+
+
+# Lessons attached to the coins they illustrate
+EDUCATIONAL_CONTEXT = {
+    'bitcoin': {
+        'lesson': 'Digital Gold',
+        'key_concept': 'Store of Value',
+        'learning_focus': 'Understand why Bitcoin is considered digital gold'
+    },
+    'ethereum': {
+        'lesson': 'Smart Contract Platform',
+        'key_concept': 'Programmable Money',
+        'learning_focus': 'Learn how Ethereum enables DeFi and NFTs'
+    },
+    'dogecoin': {
+        'lesson': 'Memecoin Culture',
+        'key_concept': 'Community Power',
+        'learning_focus': 'See how memes and community drive value'
+    }
+}
+MARKET_CURRENCY = 'usd'
+# Top coins by market cap tracked on every poll; MARKET_COINS overrides it
+MARKET_COINS = int(os.environ.get('MARKET_COINS', 250))
+
+
+@st.cache_resource
+def get_market_provider() -> MarketProvider:
+    """Process-wide market-data provider, chosen by MARKET_PROVIDER (live CoinGecko by default)"""
+    spec = os.environ.get('MARKET_PROVIDER') or f"coingecko:{os.environ.get('COINGECKO_API_URL', COINGECKO_API)}"
+    return provider_from_spec(spec)
+
+
+def _fetch_market_data():
+    """Top coins by market cap with educational context; raises MarketDataError on failure"""
+    data = fetch_top(get_market_provider(), MARKET_COINS, MARKET_CURRENCY)
+    for coin in data:
+        coin.update(EDUCATIONAL_CONTEXT.get(coin['id'], {}))
+    return data
+
+
+@st.cache_resource
+def get_market_history() -> MarketHistory:
+    """Process-wide time series of every polled snapshot, for charts and volatility"""
+    return MarketHistory()
+
+
+@st.cache_resource
+def get_market_poller() -> MarketPoller:
+    """The one background poller per process; pages only ever read its latest snapshot"""
+    history = get_market_history()
+    return MarketPoller(
+        _fetch_market_data,
+        on_snapshot=lambda snapshot: history.append(snapshot.coins, snapshot.fetched_at),
+    ).start()
+
+
+def get_market_data() -> Optional[MarketSnapshot]:
+    """Latest market snapshot, with no network I/O; None until the first poll lands"""
+    return get_market_poller().latest
+
+
+class MarketTrends(NamedTuple):
+    """Recorded price history for one snapshot's coins, in snapshot order"""
+    sparklines: List[List[float]]  # last 24h in 15-minute slots, gaps dropped
+    volatility: np.ndarray  # daily %, from the last week's hourly returns
+    last_week: PriceHistory  # hourly
+
+
+@st.cache_resource(max_entries=2)
+def get_market_trends(_snapshot: MarketSnapshot, fetched_at: float) -> MarketTrends:
+    """History queries behind the market page, run once per snapshot rather than on every rerun"""
+    history = get_market_history()
+    coin_ids = [coin['id'] for coin in _snapshot.coins]
+    last_day = history.query(coin_ids, fetched_at - DAY, fetched_at + 1, step=900)
+    last_week = history.query(coin_ids, fetched_at - 7 * DAY, fetched_at + 1, step=HOUR)
+    volatility = last_week.volatility() * np.sqrt(24)
+    # Shared by every session, like the snapshot itself
+    volatility.flags.writeable = False
+    last_week.values.flags.writeable = False
+    return MarketTrends([row[~np.isnan(row)].tolist() for row in last_day.values], volatility, last_week)
+
+
+def market_data_age(snapshot: MarketSnapshot) -> str:
+    """Caption telling the reader how fresh a snapshot is"""
+    poller = get_market_poller()
+    age = snapshot.age()
+    when = "just now" if age < 60 else f"{age / 60:.0f} min ago"
+    caption = f"🕒 Market data updated {when}"
+    error = poller.last_error
+    if error is not None:
+        if isinstance(error, RateLimited):
+            caption += " · the price feed is rate-limiting us, showing the last good snapshot"
+        elif isinstance(error, CircuitOpen):
+            caption += " · the price feed is down, showing the last good snapshot until it recovers"
+        else:
+            caption += " · live prices are temporarily unavailable, showing the last good snapshot"
+    elif poller.consumer_error is not None:
+        caption += " · price history isn't being recorded right now, so charts may have gaps"
+    return caption